@@ -0,0 +1,706 @@
+"""
+Throughput benchmarks for polars-xdt.
+
+Every public function is timed on synthetic data across input sizes, dtypes,
+null densities, chunk counts and (for time-zone aware functions) the number of
+distinct time zones. Where Polars has an equivalent, it's timed too, so that
+the two can be compared. All data is generated locally from a fixed seed, so
+no network access is needed.
+
+Each measurement runs in a fresh process, so that the reported peak memory
+(maximum resident set size) belongs to that measurement alone.
+
+Usage::
+
+    python benchmarks/bench.py
+    python benchmarks/bench.py --sizes 1e3 1e5 1e7 1e8 --functions month_delta
+    python benchmarks/bench.py --save-baseline baseline.json
+    python benchmarks/bench.py --baseline baseline.json --tolerance 0.2
+
+When comparing against a baseline, the exit code is 1 if any measurement's
+throughput dropped by more than ``tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+import polars as pl
+
+import polars_xdt as xdt
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from multiprocessing.queues import Queue
+
+    from polars_xdt.calendar import CalendarField
+
+Runner = Callable[[pl.DataFrame], Any]
+
+SEED = 0
+DTYPES = {
+    "date": pl.Date(),
+    "datetime_ms": pl.Datetime("ms"),
+    "datetime_us": pl.Datetime("us"),
+    "datetime_ns": pl.Datetime("ns"),
+}
+DATETIME_DTYPES = ("datetime_ms", "datetime_us", "datetime_ns")
+TIME_ZONES = (
+    "Europe/London",
+    "America/New_York",
+    "Asia/Kolkata",
+    "Africa/Kigali",
+    "Australia/Sydney",
+    "America/Sao_Paulo",
+    "Asia/Tokyo",
+    "Europe/Berlin",
+    "America/Los_Angeles",
+    "Asia/Kathmandu",
+    "Pacific/Auckland",
+    "America/St_Johns",
+    "Asia/Shanghai",
+    "Europe/Moscow",
+    "Atlantic/Azores",
+    "Pacific/Chatham",
+)
+# 2000-01-01 to 2030-01-01, in seconds since the Unix epoch.
+START_SECONDS = 946_684_800
+SPAN_SECONDS = 946_771_200
+HOLIDAYS = [
+    date(year, month, day)
+    for year in range(2000, 2031)
+    for month, day in ((1, 1), (5, 1), (7, 4), (12, 25), (12, 26))
+]
+SESSIONS = [(dt.time(9, 30), dt.time(12)), (dt.time(13), dt.time(16))]
+# US federal holidays, as in `generate_holidays`'s example.
+HOLIDAY_RULES: list[dict[str, Any]] = [
+    {"month": 1, "day": 1, "observed": "nearest_weekday"},
+    {"month": 1, "weekday": "Mon", "n": 3},
+    {"easter": -2},
+    {"month": 5, "weekday": "Mon", "n": -1},
+    {"month": 7, "day": 4, "observed": "nearest_weekday"},
+    {"month": 11, "weekday": "Thu", "n": 4},
+    {"month": 12, "day": 25, "observed": "nearest_weekday"},
+]
+# Written in English, so that Polars can parse it too.
+PARSE_FORMAT = "%d %B %Y %H:%M"
+
+
+@dataclass(frozen=True)
+class Config:
+    size: int
+    dtype: str
+    null_fraction: float
+    n_chunks: int
+    n_time_zones: int
+
+    @property
+    def id(self) -> str:
+        return (
+            f"n={self.size}/{self.dtype}/nulls={self.null_fraction}"
+            f"/chunks={self.n_chunks}/tz={self.n_time_zones}"
+        )
+
+
+@dataclass(frozen=True)
+class Case:
+    build: Callable[[Config], tuple[Runner, Runner | None]]
+    dtypes: tuple[str, ...] = tuple(DTYPES)
+    varies_time_zones: bool = False
+    varies_layout: bool = True
+    # Turns the generated frame into the input, outside of the timings.
+    prepare: Callable[[pl.DataFrame], pl.DataFrame] | None = None
+
+
+def make_frame(config: Config) -> pl.DataFrame:
+    """
+    Generate the benchmark input for `config`.
+
+    Columns:
+
+    - ``ts``: values of the requested dtype, with nulls.
+    - ``end``: ``ts`` shifted by up to ten years, for pairwise functions.
+    - ``utc``: ``ts`` as a UTC datetime.
+    - ``tz``: time zone names, with ``n_time_zones`` distinct values.
+    - ``value``: integers, for `arg_previous_greater`.
+    """
+    rng = np.random.default_rng(SEED)
+    seconds = START_SECONDS + rng.integers(0, SPAN_SECONDS, config.size)
+    shift = rng.integers(0, 10 * 366 * 86_400, config.size)
+    nulls = rng.random(config.size) < config.null_fraction
+    dtype = DTYPES[config.dtype]
+    datetime_dtype = dtype if dtype != pl.Date else pl.Datetime("us")
+
+    def to_dtype(values: np.ndarray[Any, Any]) -> pl.Series:
+        s = pl.Series(values * 1_000_000).cast(pl.Datetime("us"))
+        return (
+            s.cast(datetime_dtype)
+            .cast(dtype)
+            .scatter(np.flatnonzero(nulls), None)
+        )
+
+    ts = to_dtype(seconds)
+    df = pl.DataFrame(
+        {
+            "ts": ts,
+            "end": to_dtype(seconds + shift),
+            "utc": ts.cast(datetime_dtype).dt.replace_time_zone("UTC"),
+            "tz": np.array(TIME_ZONES[: config.n_time_zones])[
+                rng.integers(0, config.n_time_zones, config.size)
+            ],
+            "value": rng.integers(0, 1_000, config.size),
+        }
+    )
+    if config.n_chunks == 1:
+        return df
+    bounds = np.linspace(0, config.size, config.n_chunks + 1, dtype=np.int64)
+    return pl.concat(
+        [df.slice(lo, hi - lo) for lo, hi in zip(bounds[:-1], bounds[1:])],
+        rechunk=False,
+    )
+
+
+def _time_zone(config: Config) -> str | pl.Expr:
+    return TIME_ZONES[0] if config.n_time_zones == 1 else pl.col("tz")
+
+
+def _select(
+    result: pl.Expr, expected: pl.Expr | None
+) -> tuple[Runner, Runner | None]:
+    return (
+        lambda df: df.select(result),
+        None if expected is None else lambda df: df.select(expected),
+    )
+
+
+def _is_workday(config: Config) -> tuple[Runner, Runner | None]:
+    ts = pl.col("ts")
+    return _select(
+        xdt.is_workday(ts, holidays=HOLIDAYS),
+        (ts.dt.weekday() < 6) & ~ts.dt.date().is_in(HOLIDAYS),
+    )
+
+
+def _from_local_datetime(config: Config) -> tuple[Runner, Runner | None]:
+    time_zone = _time_zone(config)
+    return _select(
+        xdt.from_local_datetime(
+            "ts", time_zone, "UTC", ambiguous="earliest", non_existent="null"
+        ),
+        None
+        if isinstance(time_zone, pl.Expr)
+        else pl.col("ts")
+        .dt.replace_time_zone(
+            time_zone, ambiguous="earliest", non_existent="null"
+        )
+        .dt.convert_time_zone("UTC"),
+    )
+
+
+def _to_local_datetime(config: Config) -> tuple[Runner, Runner | None]:
+    time_zone = _time_zone(config)
+    return _select(
+        xdt.to_local_datetime("utc", time_zone),
+        None
+        if isinstance(time_zone, pl.Expr)
+        else pl.col("utc")
+        .dt.convert_time_zone(time_zone)
+        .dt.replace_time_zone(None),
+    )
+
+
+def _local_truncate(config: Config) -> tuple[Runner, Runner | None]:
+    time_zone = _time_zone(config)
+    return _select(
+        xdt.local_truncate("utc", "1d", time_zone),
+        None
+        if isinstance(time_zone, pl.Expr)
+        else pl.col("utc")
+        .dt.convert_time_zone(time_zone)
+        .dt.truncate("1d")
+        .dt.convert_time_zone("UTC"),
+    )
+
+
+def _local_ceil(config: Config) -> tuple[Runner, Runner | None]:
+    time_zone = _time_zone(config)
+    if isinstance(time_zone, pl.Expr):
+        expected = None
+    else:
+        local = pl.col("utc").dt.convert_time_zone(time_zone)
+        truncated = local.dt.truncate("1d")
+        expected = (
+            pl.when(local == truncated)
+            .then(truncated)
+            .otherwise(truncated.dt.offset_by("1d"))
+            .dt.convert_time_zone("UTC")
+        )
+    return _select(xdt.local_ceil("utc", "1d", time_zone), expected)
+
+
+def _local_fields(config: Config) -> tuple[Runner, Runner | None]:
+    time_zone = _time_zone(config)
+    if isinstance(time_zone, pl.Expr):
+        expected = None
+    else:
+        local = pl.col("utc").dt.convert_time_zone(time_zone)
+        expected = pl.struct(
+            date=local.dt.date(),
+            hour=local.dt.hour(),
+            weekday=local.dt.weekday(),
+            utc_offset=local.dt.base_utc_offset() + local.dt.dst_offset(),
+            is_dst=local.dt.dst_offset() != pl.duration(),
+        )
+    return _select(xdt.local_fields("utc", time_zone), expected)
+
+
+def _format_localized(config: Config) -> tuple[Runner, Runner | None]:
+    return _select(
+        xdt.format_localized("ts", "%A, %d %B %Y", "en_US"),
+        pl.col("ts").dt.strftime("%A, %d %B %Y"),
+    )
+
+
+def _day_name(config: Config) -> tuple[Runner, Runner | None]:
+    return _select(xdt.day_name("ts"), pl.col("ts").dt.strftime("%A"))
+
+
+def _month_name(config: Config) -> tuple[Runner, Runner | None]:
+    return _select(xdt.month_name("ts"), pl.col("ts").dt.strftime("%B"))
+
+
+def _to_julian_date(config: Config) -> tuple[Runner, Runner | None]:
+    return _select(
+        xdt.to_julian_date("ts"),
+        pl.col("ts").dt.epoch("ms") / 86_400_000 + 2_440_587.5,
+    )
+
+
+def _ceil(config: Config) -> tuple[Runner, Runner | None]:
+    ts = pl.col("ts")
+    truncated = ts.dt.truncate("1mo")
+    return _select(
+        xdt.ceil(ts, "1mo"),
+        pl.when(ts == truncated)
+        .then(ts)
+        .otherwise(truncated.dt.offset_by("1mo")),
+    )
+
+
+def _month_delta(config: Config) -> tuple[Runner, Runner | None]:
+    start, end = pl.col("ts"), pl.col("end")
+    # Whole months between the dates, ignoring the day-of-month adjustment.
+    months = (end.dt.year() - start.dt.year()) * 12 + (
+        end.dt.month().cast(pl.Int32) - start.dt.month().cast(pl.Int32)
+    )
+    return _select(xdt.month_delta(start, end), months)
+
+
+def _arg_previous_greater(config: Config) -> tuple[Runner, Runner | None]:
+    return _select(xdt.arg_previous_greater("value"), None)
+
+
+def _previous_greater_fields(
+    config: Config,
+) -> tuple[Runner, Runner | None]:
+    ts, value = pl.col("ts"), pl.col("value")
+    idx = xdt.arg_previous_greater(value)
+    return _select(
+        xdt.arg_previous_greater(value, fields=["delta", "value"], by=ts),
+        pl.struct(delta=ts - ts.gather(idx), value=value.gather(idx)),
+    )
+
+
+def _rolling_business(config: Config) -> tuple[Runner, Runner | None]:
+    # `by` has to be sorted and without nulls, for both.
+    ts, value = pl.col("ts"), pl.col("value")
+    result = xdt.rolling_business(value, by=ts, window="20bd")
+    # Nearest calendar equivalent, which doesn't skip weekends or holidays.
+    expected = value.rolling_sum_by(ts, "28d")
+    return (
+        lambda df: df.drop_nulls("ts").sort("ts").select(result),
+        lambda df: df.drop_nulls("ts").sort("ts").select(expected),
+    )
+
+
+def _business_day_ordinal(config: Config) -> tuple[Runner, Runner | None]:
+    ts = pl.col("ts")
+    # Same ordinals, up to a constant.
+    return _select(
+        xdt.business_day_ordinal(ts, holidays=HOLIDAYS),
+        pl.business_day_count(
+            date(1970, 1, 1), ts.dt.date(), holidays=HOLIDAYS
+        ),
+    )
+
+
+def _business_duration(config: Config) -> tuple[Runner, Runner | None]:
+    return _select(xdt.business_duration("ts", "end", holidays=HOLIDAYS), None)
+
+
+def _fiscal_period(config: Config) -> tuple[Runner, Runner | None]:
+    # Fiscal years which start in April, named after the year they end in.
+    shifted = pl.col("ts").dt.offset_by("-3mo")
+    return _select(
+        xdt.fiscal_period("ts", start_month=4),
+        pl.struct(
+            fiscal_year=shifted.dt.year() + 1,
+            fiscal_quarter=shifted.dt.quarter(),
+            fiscal_period=shifted.dt.month(),
+            fiscal_week=(shifted.dt.ordinal_day() - 1) // 7 + 1,
+        ),
+    )
+
+
+def _is_in_session(config: Config) -> tuple[Runner, Runner | None]:
+    ts = pl.col("ts")
+    time_of_day = ts.dt.time()
+    return _select(
+        xdt.is_in_session(ts, SESSIONS, holidays=HOLIDAYS),
+        (ts.dt.weekday() < 6)
+        & ~ts.dt.date().is_in(HOLIDAYS)
+        & pl.any_horizontal(
+            time_of_day.is_between(open_, close, closed="left")
+            for open_, close in SESSIONS
+        ),
+    )
+
+
+def _next_session_open(config: Config) -> tuple[Runner, Runner | None]:
+    return _select(
+        xdt.next_session_open("ts", SESSIONS, holidays=HOLIDAYS), None
+    )
+
+
+def _next_session_close(config: Config) -> tuple[Runner, Runner | None]:
+    return _select(
+        xdt.next_session_close("ts", SESSIONS, holidays=HOLIDAYS), None
+    )
+
+
+def _nth_business_day_of_month(
+    config: Config,
+) -> tuple[Runner, Runner | None]:
+    ts = pl.col("ts")
+    return _select(
+        xdt.nth_business_day_of_month(ts, 1, holidays=HOLIDAYS),
+        ts.dt.date()
+        .dt.month_start()
+        .dt.add_business_days(0, holidays=HOLIDAYS, roll="forward"),
+    )
+
+
+def _nth_weekday_of_month(config: Config) -> tuple[Runner, Runner | None]:
+    month_start = pl.col("ts").dt.date().dt.month_start()
+    return _select(
+        xdt.nth_weekday_of_month("ts", "Mon", 1),
+        month_start
+        + pl.duration(days=(8 - month_start.dt.weekday().cast(pl.Int64)) % 7),
+    )
+
+
+def _format_for_parsing(df: pl.DataFrame) -> pl.DataFrame:
+    return df.select(pl.col("ts").dt.strftime(PARSE_FORMAT))
+
+
+def _parse_localized(config: Config) -> tuple[Runner, Runner | None]:
+    return _select(
+        xdt.parse_localized("ts", PARSE_FORMAT, "en_US"),
+        pl.col("ts").str.strptime(pl.Datetime("us"), PARSE_FORMAT),
+    )
+
+
+def _calendar_table(config: Config) -> tuple[Runner, Runner | None]:
+    start = date(2000, 1, 1)
+    end = start + timedelta(days=config.size - 1)
+    fields: list[CalendarField] = [
+        "date",
+        "year",
+        "quarter",
+        "month",
+        "day",
+        "weekday",
+    ]
+
+    def expected(_: pl.DataFrame) -> pl.DataFrame:
+        dates = pl.date_range(start, end, eager=True).alias("date")
+        return dates.to_frame().with_columns(
+            year=dates.dt.year(),
+            quarter=dates.dt.quarter(),
+            month=dates.dt.month(),
+            day=dates.dt.day(),
+            weekday=dates.dt.weekday(),
+        )
+
+    return (
+        lambda _: xdt.calendar_table(start, end, fields=fields),
+        expected,
+    )
+
+
+def _generate_holidays(config: Config) -> tuple[Runner, Runner | None]:
+    # Roughly `size` holidays.
+    years = max(1, config.size // len(HOLIDAY_RULES))
+    return (
+        lambda _: xdt.generate_holidays(HOLIDAY_RULES, 1, years),
+        None,
+    )
+
+
+def _date_range(config: Config) -> tuple[Runner, Runner | None]:
+    # Roughly `size` business days.
+    start = date(2000, 1, 1)
+    end = start + timedelta(days=config.size * 7 // 5)
+
+    def expected(_: pl.DataFrame) -> pl.Series:
+        dates = pl.date_range(start, end, eager=True)
+        return dates.filter((dates.dt.weekday() < 6) & ~dates.is_in(HOLIDAYS))
+
+    return (
+        lambda _: xdt.date_range(start, end, eager=True, holidays=HOLIDAYS),
+        expected,
+    )
+
+
+CASES: dict[str, Case] = {
+    "arg_previous_greater": Case(_arg_previous_greater, dtypes=("date",)),
+    "business_day_ordinal": Case(_business_day_ordinal),
+    "business_duration": Case(_business_duration, dtypes=DATETIME_DTYPES),
+    "calendar_table": Case(
+        _calendar_table, dtypes=("date",), varies_layout=False
+    ),
+    "ceil": Case(_ceil),
+    "date_range": Case(_date_range, dtypes=("date",), varies_layout=False),
+    "day_name": Case(_day_name),
+    "fiscal_period": Case(_fiscal_period),
+    "format_localized": Case(_format_localized),
+    "from_local_datetime": Case(
+        _from_local_datetime, dtypes=DATETIME_DTYPES, varies_time_zones=True
+    ),
+    "generate_holidays": Case(
+        _generate_holidays, dtypes=("date",), varies_layout=False
+    ),
+    "is_in_session": Case(_is_in_session, dtypes=DATETIME_DTYPES),
+    "is_workday": Case(_is_workday),
+    "local_ceil": Case(
+        _local_ceil, dtypes=DATETIME_DTYPES, varies_time_zones=True
+    ),
+    "local_fields": Case(
+        _local_fields, dtypes=DATETIME_DTYPES, varies_time_zones=True
+    ),
+    "local_truncate": Case(
+        _local_truncate, dtypes=DATETIME_DTYPES, varies_time_zones=True
+    ),
+    "month_delta": Case(_month_delta, dtypes=("date",)),
+    "month_name": Case(_month_name),
+    "next_session_close": Case(_next_session_close, dtypes=DATETIME_DTYPES),
+    "next_session_open": Case(_next_session_open, dtypes=DATETIME_DTYPES),
+    "nth_business_day_of_month": Case(_nth_business_day_of_month),
+    "nth_weekday_of_month": Case(_nth_weekday_of_month),
+    "parse_localized": Case(
+        _parse_localized,
+        dtypes=DATETIME_DTYPES,
+        prepare=_format_for_parsing,
+    ),
+    "previous_greater_fields": Case(_previous_greater_fields),
+    "rolling_business": Case(_rolling_business),
+    # Little more than decoding dates and timestamps into civil fields, so
+    # this doubles as a micro-benchmark of that.
+    "to_julian_date": Case(_to_julian_date),
+    "to_local_datetime": Case(
+        _to_local_datetime, dtypes=DATETIME_DTYPES, varies_time_zones=True
+    ),
+}
+
+
+def _max_rss_mb() -> float:
+    # `ru_maxrss` is in kilobytes on Linux, and in bytes on macOS.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024**2 if sys.platform == "darwin" else 1024)
+
+
+def _measure(
+    name: str, impl: str, config: Config, repeat: int, queue: Queue[Any]
+) -> None:
+    case = CASES[name]
+    df = make_frame(config)
+    if case.prepare is not None:
+        df = case.prepare(df)
+    xdt_runner, polars_runner = case.build(config)
+    run = xdt_runner if impl == "xdt" else polars_runner
+    assert run is not None
+    input_mb = _max_rss_mb()
+    timings = []
+    try:
+        run(df)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run(df)
+            timings.append(time.perf_counter() - start)
+    except Exception as exc:  # noqa: BLE001
+        queue.put({"error": f"{type(exc).__name__}: {exc}"})
+        return
+    queue.put(
+        {
+            "seconds": min(timings),
+            "rows_per_s": config.size / min(timings),
+            "peak_mb": _max_rss_mb(),
+            "peak_over_input_mb": _max_rss_mb() - input_mb,
+        }
+    )
+
+
+def measure(
+    name: str, impl: str, config: Config, repeat: int
+) -> dict[str, Any]:
+    """Run one measurement in a fresh process."""
+    ctx = multiprocessing.get_context("spawn")
+    queue: Queue[Any] = ctx.Queue()
+    process = ctx.Process(
+        target=_measure, args=(name, impl, config, repeat, queue)
+    )
+    process.start()
+    process.join()
+    if process.exitcode != 0:
+        return {"error": f"exited with code {process.exitcode}"}
+    return queue.get()  # type: ignore[no-any-return]
+
+
+def configs(case: Case, args: argparse.Namespace) -> list[Config]:
+    null_fractions = args.null_fractions if case.varies_layout else [0.0]
+    chunks = args.chunks if case.varies_layout else [1]
+    time_zones = args.time_zones if case.varies_time_zones else [1]
+    return [
+        Config(int(size), dtype, null_fraction, n_chunks, n_time_zones)
+        for size in args.sizes
+        for dtype in case.dtypes
+        if dtype in args.dtypes
+        for null_fraction in null_fractions
+        for n_chunks in chunks
+        for n_time_zones in time_zones
+    ]
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    """Return the keys whose throughput regressed by more than `tolerance`."""
+    return [
+        key
+        for key, result in results.items()
+        if "rows_per_s" in result
+        and "rows_per_s" in baseline.get(key, {})
+        and result["rows_per_s"] < baseline[key]["rows_per_s"] * (1 - tolerance)
+    ]
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--functions", nargs="+", choices=sorted(CASES), default=sorted(CASES)
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=float, default=[1e3, 1e5, 1e6]
+    )
+    parser.add_argument(
+        "--dtypes", nargs="+", choices=list(DTYPES), default=list(DTYPES)
+    )
+    parser.add_argument(
+        "--null-fractions", nargs="+", type=float, default=[0.0, 0.1]
+    )
+    parser.add_argument("--chunks", nargs="+", type=int, default=[1, 8])
+    parser.add_argument(
+        "--time-zones",
+        nargs="+",
+        type=int,
+        choices=range(1, len(TIME_ZONES) + 1),
+        default=[1, len(TIME_ZONES)],
+        metavar="N",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--no-polars",
+        action="store_true",
+        help="Skip the pure-Polars equivalents.",
+    )
+    parser.add_argument("--output", help="Write all results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare against this JSON file.")
+    parser.add_argument(
+        "--save-baseline", help="Write throughput results to this JSON file."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative throughput drop that counts as a regression.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    results: dict[str, dict[str, Any]] = {}
+    for name in args.functions:
+        case = CASES[name]
+        for config in configs(case, args):
+            has_polars = case.build(config)[1] is not None
+            impls = (
+                ["xdt"]
+                if args.no_polars or not has_polars
+                else ["xdt", "polars"]
+            )
+            for impl in impls:
+                key = f"{name}/{impl}/{config.id}"
+                result = measure(name, impl, config, args.repeat)
+                results[key] = {**asdict(config), **result}
+                if "error" in result:
+                    print(f"{key:<90} {result['error']}")
+                else:
+                    print(
+                        f"{key:<90} {result['rows_per_s']:>14,.0f} rows/s"
+                        f" {result['peak_mb']:>9.1f} MB peak"
+                    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(
+                {
+                    key: {"rows_per_s": result["rows_per_s"]}
+                    for key, result in results.items()
+                    if "rows_per_s" in result
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for key in regressions:
+            print(
+                f"REGRESSION {key}: {results[key]['rows_per_s']:,.0f} rows/s,"
+                f" baseline {baseline[key]['rows_per_s']:,.0f} rows/s"
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Measure the cost of building polars-xdt expressions (without running them).
+
+Usage::
+
+    python benchmarks/expr_build.py
+    python benchmarks/expr_build.py --number 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from datetime import date
+from typing import Callable
+
+import polars as pl
+
+import polars_xdt as xdt
+
+HOLIDAYS = [date(2024, 1, 1), date(2024, 5, 1), date(2024, 12, 25)] * 50
+
+BUILDERS: dict[str, Callable[[], pl.Expr]] = {
+    "is_workday": lambda: xdt.is_workday(
+        "ts", weekend=("Fri", "Sat"), holidays=HOLIDAYS
+    ),
+    "ns.is_workday": lambda: pl.col("ts").xdt.is_workday(  # type: ignore[attr-defined]
+        weekend=("Fri", "Sat"), holidays=HOLIDAYS
+    ),
+    "format_localized": lambda: xdt.format_localized("ts", "%A", "fr_FR"),
+    "ns.format_localized": lambda: pl.col("ts").xdt.format_localized(  # type: ignore[attr-defined]
+        "%A", "fr_FR"
+    ),
+    "from_local_datetime": lambda: xdt.from_local_datetime(
+        "ts", "Europe/London", "UTC"
+    ),
+    "ns.month_name": lambda: pl.col("ts").xdt.month_name(),  # type: ignore[attr-defined]
+    "ns.month_delta": lambda: pl.col("ts").xdt.month_delta(  # type: ignore[attr-defined]
+        "end"
+    ),
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for name, build in BUILDERS.items():
+        build()  # Warm up imports and caches.
+        seconds = min(timeit.repeat(build, number=args.number, repeat=5))
+        print(f"{name:<24} {seconds / args.number * 1e6:>8.2f} us/expr")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
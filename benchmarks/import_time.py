@@ -0,0 +1,56 @@
+"""
+Measure how long ``import polars_xdt`` takes on top of ``import polars``.
+
+Each sample imports both in a fresh interpreter, so nothing is cached in
+``sys.modules``. Usage::
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --samples 50 --max-ms 20
+
+With ``--max-ms``, the exit code is 1 if the median exceeds the limit.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+CODE = """
+import time
+import polars
+start = time.perf_counter()
+import polars_xdt
+print(time.perf_counter() - start)
+"""
+
+
+def sample() -> float:
+    """Seconds taken by ``import polars_xdt`` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", CODE], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--max-ms", type=float)
+    args = parser.parse_args()
+
+    timings_ms = sorted(sample() * 1000 for _ in range(args.samples))
+    median = statistics.median(timings_ms)
+    print(
+        f"import polars_xdt: median {median:.2f} ms,"
+        f" min {timings_ms[0]:.2f} ms, max {timings_ms[-1]:.2f} ms"
+    )
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"median exceeds {args.max_ms} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,33 +1,95 @@
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Registers the `xdt` expression namespace. Everything else, including the
+# native extension, is only imported when first accessed.
 import polars_xdt.namespace  # noqa: F401
-from polars_xdt.functions import (
-    arg_previous_greater,
-    ceil,
-    day_name,
-    format_localized,
-    from_local_datetime,
-    is_workday,
-    month_delta,
-    month_name,
-    to_julian_date,
-    to_local_datetime,
-)
-from polars_xdt.ranges import date_range
-
-from ._internal import __version__
+
+if TYPE_CHECKING:
+    from polars_xdt._internal import __version__
+    from polars_xdt.calendar import calendar_table
+    from polars_xdt.functions import (
+        arg_previous_greater,
+        business_day_ordinal,
+        business_duration,
+        ceil,
+        day_name,
+        fiscal_period,
+        format_localized,
+        from_local_datetime,
+        is_in_session,
+        is_workday,
+        local_ceil,
+        local_fields,
+        local_truncate,
+        month_delta,
+        month_name,
+        next_session_close,
+        next_session_open,
+        nth_business_day_of_month,
+        nth_weekday_of_month,
+        parse_localized,
+        rolling_business,
+        to_julian_date,
+        to_local_datetime,
+    )
+    from polars_xdt.holidays import generate_holidays
+    from polars_xdt.profiling import profiling, profiling_stats
+    from polars_xdt.ranges import date_range
 
 __all__ = [
     "__version__",
     "arg_previous_greater",
+    "business_day_ordinal",
+    "business_duration",
+    "calendar_table",
     "ceil",
     "date_range",
     "day_name",
+    "fiscal_period",
     "format_localized",
     "from_local_datetime",
+    "generate_holidays",
+    "is_in_session",
     "is_workday",
+    "local_ceil",
+    "local_fields",
+    "local_truncate",
     "month_delta",
     "month_name",
+    "next_session_close",
+    "next_session_open",
+    "nth_business_day_of_month",
+    "nth_weekday_of_month",
+    "parse_localized",
+    "profiling",
+    "profiling_stats",
+    "rolling_business",
     "to_julian_date",
     "to_local_datetime",
 ]
+
+_LAZY_ATTRIBUTE_MODULES = {
+    "__version__": "polars_xdt._internal",
+    "calendar_table": "polars_xdt.calendar",
+    "date_range": "polars_xdt.ranges",
+    "generate_holidays": "polars_xdt.holidays",
+    "profiling": "polars_xdt.profiling",
+    "profiling_stats": "polars_xdt.profiling",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    module = _LAZY_ATTRIBUTE_MODULES.get(name, "polars_xdt.functions")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
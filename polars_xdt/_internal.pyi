@@ -1 +1,21 @@
+import polars as pl
+
 __version__: str
+
+def calendar_table(
+    start: int,
+    end: int,
+    fields: list[str],
+    locales: list[tuple[str, str]],
+    calendars: list[tuple[str, list[bool], list[int]]],
+) -> pl.DataFrame: ...
+def generate_holidays(
+    rules: list[tuple[str, int, int, int, str]],
+    start_year: int,
+    end_year: int,
+    weekmask: list[bool],
+) -> pl.Series: ...
+def set_profiling(enabled: bool) -> None: ...
+def is_profiling() -> bool: ...
+def reset_profiling() -> None: ...
+def profiling_stats() -> pl.DataFrame: ...
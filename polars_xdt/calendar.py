@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import sys
+from datetime import date
+from typing import TYPE_CHECKING, Literal
+
+from polars_xdt import _internal
+from polars_xdt.functions import _holidays_to_epoch_days, get_weekmask
+
+if sys.version_info >= (3, 10):
+    from typing import TypeAlias
+else:
+    from typing_extensions import TypeAlias
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    import polars as pl
+
+    from polars_xdt.typing import IntoHolidays
+
+CalendarField: TypeAlias = Literal[
+    "date",
+    "year",
+    "quarter",
+    "month",
+    "day",
+    "weekday",
+    "day_of_year",
+    "iso_year",
+    "iso_week",
+    "julian_date",
+    "day_name",
+    "month_name",
+    "is_workday",
+    "business_day_ordinal",
+]
+
+_ALL_FIELDS: tuple[CalendarField, ...] = (
+    "date",
+    "year",
+    "quarter",
+    "month",
+    "day",
+    "weekday",
+    "day_of_year",
+    "iso_year",
+    "iso_week",
+    "julian_date",
+    "day_name",
+    "month_name",
+    "is_workday",
+    "business_day_ordinal",
+)
+
+_EPOCH = date(1970, 1, 1)
+
+
+def calendar_table(
+    start: date,
+    end: date,
+    *,
+    fields: Sequence[CalendarField] | None = None,
+    locales: Sequence[str] | None = None,
+    calendars: Mapping[str, tuple[Sequence[str], IntoHolidays | None]]
+    | None = None,
+) -> pl.DataFrame:
+    """
+    Build a calendar (date dimension) table, with one row per date.
+
+    Each date is decoded once, and all the requested columns are filled
+    natively and in parallel, rather than by evaluating one expression per
+    column over a ``date_range``.
+
+    Parameters
+    ----------
+    start
+        First date of the table.
+    end
+        Last date of the table (inclusive).
+    fields
+        Columns to include, in order. Defaults to all of them:
+
+        - ``date``
+        - ``year``, ``quarter``, ``month``, ``day``
+        - ``weekday``: from 1 (Monday) to 7 (Sunday).
+        - ``day_of_year``: from 1.
+        - ``iso_year``, ``iso_week``: ISO 8601 week-numbering year and week.
+        - ``julian_date``: at midnight, as in :func:`to_julian_date`.
+        - ``day_name``, ``month_name``: one column per locale.
+        - ``is_workday``: one column per calendar.
+        - ``business_day_ordinal``: one column per calendar, as in
+          :func:`business_day_ordinal`.
+    locales
+        Locales of the name columns, which are named ``day_name_<locale>``
+        and ``month_name_<locale>``. Defaults to a single ``day_name`` and
+        ``month_name`` column in English.
+    calendars
+        Business day calendars, as a mapping from name to
+        ``(weekend, holidays)``. Their columns are named
+        ``is_workday_<name>`` and ``business_day_ordinal_<name>``. Defaults
+        to a single ``is_workday`` and ``business_day_ordinal`` column, with
+        a Saturday and Sunday weekend and no holidays.
+
+    Returns
+    -------
+    DataFrame
+
+    Examples
+    --------
+    >>> from datetime import date
+    >>> import polars_xdt as xdt
+    >>> xdt.calendar_table(
+    ...     date(2024, 1, 5),
+    ...     date(2024, 1, 8),
+    ...     fields=["date", "weekday", "iso_week", "day_name", "is_workday"],
+    ...     locales=["en_US", "fr_FR"],
+    ... )
+    shape: (4, 6)
+    ┌────────────┬─────────┬──────────┬────────────────┬────────────────┬────────────┐
+    │ date       ┆ weekday ┆ iso_week ┆ day_name_en_US ┆ day_name_fr_FR ┆ is_workday │
+    │ ---        ┆ ---     ┆ ---      ┆ ---            ┆ ---            ┆ ---        │
+    │ date       ┆ i8      ┆ i8       ┆ str            ┆ str            ┆ bool       │
+    ╞════════════╪═════════╪══════════╪════════════════╪════════════════╪════════════╡
+    │ 2024-01-05 ┆ 5       ┆ 1        ┆ Friday         ┆ vendredi       ┆ true       │
+    │ 2024-01-06 ┆ 6       ┆ 1        ┆ Saturday       ┆ samedi         ┆ false      │
+    │ 2024-01-07 ┆ 7       ┆ 1        ┆ Sunday         ┆ dimanche       ┆ false      │
+    │ 2024-01-08 ┆ 1       ┆ 2        ┆ Monday         ┆ lundi          ┆ true       │
+    └────────────┴─────────┴──────────┴────────────────┴────────────────┴────────────┘
+
+    """
+    if locales is None:
+        locale_specs = [("", "en_US")]
+    else:
+        locale_specs = [(f"_{locale}", locale) for locale in locales]
+    calendar_specs: list[tuple[str, list[bool], list[int]]]
+    if calendars is None:
+        calendar_specs = [("", get_weekmask(("Sat", "Sun")), [])]
+    else:
+        calendar_specs = [
+            (
+                f"_{name}",
+                get_weekmask(weekend),
+                _holidays_to_epoch_days(holidays),
+            )
+            for name, (weekend, holidays) in calendars.items()
+        ]
+    return _internal.calendar_table(
+        (start - _EPOCH).days,
+        (end - _EPOCH).days,
+        list(_ALL_FIELDS if fields is None else fields),
+        locale_specs,
+        calendar_specs,
+    )
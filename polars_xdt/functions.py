@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import re
 import sys
-from datetime import date
+from collections.abc import Mapping
+from datetime import date, time
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import polars as pl
 from polars.plugins import register_plugin_function
 
-from polars_xdt.utils import parse_into_expr
+from polars_xdt.utils import holidays_to_series, parse_into_expr
 
 if sys.version_info >= (3, 10):
     from typing import TypeAlias
@@ -20,9 +23,24 @@ if TYPE_CHECKING:
 
     from polars import Expr
 
-    from polars_xdt.typing import IntoExprColumn
+    from polars_xdt.typing import IntoExprColumn, IntoHolidays
 
     Ambiguous: TypeAlias = Literal["earliest", "latest", "raise", "null"]
+    NonExistent: TypeAlias = Literal[
+        "raise", "null", "shift_forward", "shift_backward"
+    ]
+    LocalField: TypeAlias = Literal[
+        "date", "hour", "weekday", "utc_offset", "is_dst"
+    ]
+    TimeUnit: TypeAlias = Literal["ns", "us", "ms"]
+    FiscalScheme: TypeAlias = Literal["month", "445", "454", "544"]
+    LocalizedFormats: TypeAlias = (
+        Sequence[str] | Mapping[str, str | tuple[str, str]]
+    )
+    PreviousGreaterField: TypeAlias = Literal[
+        "index", "distance", "value", "delta"
+    ]
+    RollingBusinessAgg: TypeAlias = Literal["sum", "mean", "min", "max"]
 
 RollStrategy: TypeAlias = Literal["raise", "forward", "backward"]
 
@@ -33,22 +51,67 @@ mapping = {"Mon": 1, "Tue": 2, "Wed": 3, "Thu": 4, "Fri": 5, "Sat": 6, "Sun": 7}
 reverse_mapping = {value: key for key, value in mapping.items()}
 
 
-def get_weekmask(weekend: Sequence[str]) -> list[bool]:
-    if weekend == ("Sat", "Sun"):
-        weekmask = [True, True, True, True, True, False, False]
-    else:
-        weekmask = [reverse_mapping[i] not in weekend for i in range(1, 8)]
+@lru_cache(maxsize=64)
+def _weekmask(weekend: tuple[str, ...]) -> tuple[bool, ...]:
+    weekend_int = {mapping[x] for x in weekend}
+    weekmask = tuple(day not in weekend_int for day in range(1, 8))
     if sum(weekmask) == 0:
-        msg = f"At least one day of the week must be a business day. Got weekend={weekend}"
+        msg = f"At least one day of the week must be a business day. Got weekend={list(weekend)}"
         raise ValueError(msg)
     return weekmask
 
 
+def get_weekmask(weekend: Sequence[str]) -> list[bool]:
+    return list(_weekmask(tuple(weekend)))
+
+
+def _epoch_days(holidays: pl.Series) -> list[int]:
+    return holidays.drop_nulls().unique().sort().to_physical().to_list()
+
+
+@lru_cache(maxsize=64)
+def _cached_holidays_to_epoch_days(
+    holidays: tuple[date, ...],
+) -> tuple[int, ...]:
+    return tuple(_epoch_days(pl.Series(holidays, dtype=pl.Date)))
+
+
+def _holidays_to_epoch_days(holidays: IntoHolidays | None) -> list[int]:
+    """
+    Convert holidays to sorted, unique days since the Unix epoch.
+
+    Results for lists and tuples of dates are memoized, as the same holiday
+    calendar is typically reused across many expressions. Series and arrays
+    are converted from their buffers instead, without going through Python
+    ``date`` objects.
+    """
+    if holidays is None or len(holidays) == 0:
+        return []
+    if isinstance(holidays, (list, tuple)):
+        return list(_cached_holidays_to_epoch_days(tuple(holidays)))
+    return _epoch_days(holidays_to_series(holidays))
+
+
+def _business_days_window(window: str | int) -> int:
+    if isinstance(window, int):
+        return window
+    match = re.fullmatch(r"(\d+)bd", window)
+    if match is None:
+        msg = f"`window` must be an integer or a string like '20bd', got {window!r}"
+        raise ValueError(msg)
+    return int(match.group(1))
+
+
+def _time_to_nanoseconds(t: time) -> int:
+    seconds = t.hour * 3600 + t.minute * 60 + t.second
+    return seconds * 1_000_000_000 + t.microsecond * 1_000
+
+
 def is_workday(
     expr: IntoExprColumn,
     *,
     weekend: Sequence[str] = ("Sat", "Sun"),
-    holidays: Sequence[date] | None = None,
+    holidays: IntoHolidays | None = None,
 ) -> pl.Expr:
     """
     Determine whether a day is a workday.
@@ -56,16 +119,710 @@ def is_workday(
     Parameters
     ----------
     expr
-        Input expression.
+        Input expression.
+    weekend
+        The days of the week that are considered weekends. Defaults to ("Sat", "Sun").
+    holidays
+        The holidays to exclude from the calculation. Defaults to None. This should
+        be a list of ``datetime.date`` s, or a Date Series, NumPy ``datetime64[D]``
+        array or Arrow Date32 array, which are used without conversion to Python
+        objects.
+
+    Returns
+    -------
+    polars.Expr
+
+    Examples
+    --------
+    >>> from datetime import date
+    >>> import polars as pl
+    >>> import polars_xdt as xdt
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "date": [
+    ...             date(2023, 1, 4),
+    ...             date(2023, 5, 1),
+    ...             date(2023, 9, 9),
+    ...         ],
+    ...     }
+    ... )
+    >>> df.with_columns(is_workday=xdt.is_workday("date"))
+    shape: (3, 2)
+    ┌────────────┬────────────┐
+    │ date       ┆ is_workday │
+    │ ---        ┆ ---        │
+    │ date       ┆ bool       │
+    ╞════════════╪════════════╡
+    │ 2023-01-04 ┆ true       │
+    │ 2023-05-01 ┆ true       │
+    │ 2023-09-09 ┆ false      │
+    └────────────┴────────────┘
+
+    """
+    expr = parse_into_expr(expr)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="is_workday",
+        is_elementwise=True,
+        args=[expr],
+        kwargs={
+            "weekmask": get_weekmask(weekend),
+            "holidays": _holidays_to_epoch_days(holidays),
+        },
+    )
+
+
+def business_day_ordinal(
+    expr: IntoExprColumn,
+    *,
+    every: int = 1,
+    weekend: Sequence[str] = ("Sat", "Sun"),
+    holidays: IntoHolidays | None = None,
+    roll: RollStrategy = "forward",
+) -> pl.Expr:
+    """
+    Count the business days from 1970-01-01 to each date.
+
+    Consecutive business days get consecutive ordinals, so that the
+    ordinal (or, with ``every``, the bucket id) can be used as a group key
+    for aggregating over business days, like
+    :meth:`polars.DataFrame.group_by_dynamic` does over calendar days.
+    If the input is sorted, then so is the output.
+
+    Parameters
+    ----------
+    expr
+        Input expression, of Date or Datetime type. Datetimes are assigned to
+        their local date.
+    every
+        Number of business days per bucket. Defaults to 1, in which case each
+        business day gets its own ordinal.
+    weekend
+        The days of the week that are considered weekends. Defaults to ("Sat", "Sun").
+    holidays
+        The holidays to exclude from the calculation. Defaults to None. This should
+        be a list of ``datetime.date`` s, or a Date Series, NumPy ``datetime64[D]``
+        array or Arrow Date32 array, which are used without conversion to Python
+        objects.
+    roll
+        What to do with dates which aren't business days:
+
+        - 'forward': give them the ordinal of the next business day.
+        - 'backward': give them the ordinal of the previous business day.
+        - 'raise': raise an error.
+
+    Returns
+    -------
+    polars.Expr
+        Int32 expression.
+
+    Examples
+    --------
+    >>> from datetime import date
+    >>> import polars as pl
+    >>> import polars_xdt as xdt
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "date": pl.date_range(
+    ...             date(2024, 1, 4), date(2024, 1, 10), eager=True
+    ...         ),
+    ...         "sales": [1, 2, 3, 4, 5, 6, 7],
+    ...     }
+    ... )
+    >>> df.with_columns(ordinal=xdt.business_day_ordinal("date"))
+    shape: (7, 3)
+    ┌────────────┬───────┬─────────┐
+    │ date       ┆ sales ┆ ordinal │
+    │ ---        ┆ ---   ┆ ---     │
+    │ date       ┆ i64   ┆ i32     │
+    ╞════════════╪═══════╪═════════╡
+    │ 2024-01-04 ┆ 1     ┆ 14090   │
+    │ 2024-01-05 ┆ 2     ┆ 14091   │
+    │ 2024-01-06 ┆ 3     ┆ 14092   │
+    │ 2024-01-07 ┆ 4     ┆ 14092   │
+    │ 2024-01-08 ┆ 5     ┆ 14092   │
+    │ 2024-01-09 ┆ 6     ┆ 14093   │
+    │ 2024-01-10 ┆ 7     ┆ 14094   │
+    └────────────┴───────┴─────────┘
+
+    Total sales over every two business days:
+
+    >>> df.group_by(
+    ...     xdt.business_day_ordinal("date", every=2).alias("bucket"),
+    ...     maintain_order=True,
+    ... ).agg(pl.col("date").first(), pl.col("sales").sum())
+    shape: (3, 3)
+    ┌────────┬────────────┬───────┐
+    │ bucket ┆ date       ┆ sales │
+    │ ---    ┆ ---        ┆ ---   │
+    │ i32    ┆ date       ┆ i64   │
+    ╞════════╪════════════╪═══════╡
+    │ 7045   ┆ 2024-01-04 ┆ 3     │
+    │ 7046   ┆ 2024-01-06 ┆ 18    │
+    │ 7047   ┆ 2024-01-10 ┆ 7     │
+    └────────┴────────────┴───────┘
+
+    """
+    expr = parse_into_expr(expr)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="business_day_ordinal",
+        is_elementwise=True,
+        args=[expr],
+        kwargs={
+            "weekmask": get_weekmask(weekend),
+            "holidays": _holidays_to_epoch_days(holidays),
+            "roll": roll,
+            "every": every,
+        },
+    )
+
+
+def rolling_business(  # noqa: PLR0913
+    expr: IntoExprColumn,
+    *,
+    by: IntoExprColumn,
+    window: str | int,
+    agg: RollingBusinessAgg = "sum",
+    min_samples: int = 1,
+    weekend: Sequence[str] = ("Sat", "Sun"),
+    holidays: IntoHolidays | None = None,
+) -> pl.Expr:
+    """
+    Aggregate over a rolling window of business days.
+
+    Each row's window holds the rows from its own business day and the
+    ``window - 1`` business days before it. Unlike
+    :meth:`polars.Expr.rolling_sum_by`, which only understands calendar
+    durations, weekends and holidays don't count towards the window, and no
+    rows are needed for the days which are missing from the data.
+
+    Parameters
+    ----------
+    expr
+        Numeric expression to aggregate.
+    by
+        Date or Datetime expression, sorted in ascending order and without
+        nulls. Datetimes are assigned to their local date. Dates which aren't
+        business days belong to the business day before them.
+    window
+        Number of business days in each window, either as an integer or as a
+        string such as ``"20bd"``.
+    agg
+        Aggregation to compute over each window: ``'sum'``, ``'mean'``,
+        ``'min'`` or ``'max'``. Nulls are skipped.
+    min_samples
+        Number of non-null values a window needs for its result to not be
+        null. Defaults to 1.
+    weekend
+        The days of the week that are considered weekends. Defaults to ("Sat", "Sun").
+    holidays
+        The holidays to exclude from the calculation. Defaults to None. This should
+        be a list of ``datetime.date`` s, or a Date Series, NumPy ``datetime64[D]``
+        array or Arrow Date32 array, which are used without conversion to Python
+        objects.
+
+    Returns
+    -------
+    polars.Expr
+        Int64 for sums of integers, Float64 (or Float32 for Float32 input) for
+        means, and otherwise of the same data type as ``expr``.
+
+    Examples
+    --------
+    >>> from datetime import date
+    >>> import polars as pl
+    >>> import polars_xdt as xdt
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "date": [
+    ...             date(2024, 12, 19),
+    ...             date(2024, 12, 20),
+    ...             date(2024, 12, 24),
+    ...             date(2024, 12, 27),
+    ...             date(2024, 12, 30),
+    ...         ],
+    ...         "sales": [1, 2, 3, 4, 5],
+    ...     }
+    ... )
+    >>> df.with_columns(
+    ...     sales_3bd=xdt.rolling_business(
+    ...         "sales",
+    ...         by="date",
+    ...         window="3bd",
+    ...         holidays=[date(2024, 12, 25), date(2024, 12, 26)],
+    ...     )
+    ... )
+    shape: (5, 3)
+    ┌────────────┬───────┬───────────┐
+    │ date       ┆ sales ┆ sales_3bd │
+    │ ---        ┆ ---   ┆ ---       │
+    │ date       ┆ i64   ┆ i64       │
+    ╞════════════╪═══════╪═══════════╡
+    │ 2024-12-19 ┆ 1     ┆ 1         │
+    │ 2024-12-20 ┆ 2     ┆ 3         │
+    │ 2024-12-24 ┆ 3     ┆ 5         │
+    │ 2024-12-27 ┆ 4     ┆ 7         │
+    │ 2024-12-30 ┆ 5     ┆ 12        │
+    └────────────┴───────┴───────────┘
+
+    Per group, such as for each ticker, use it with
+    :meth:`polars.Expr.over`.
+
+    """
+    expr = parse_into_expr(expr)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="rolling_business",
+        is_elementwise=False,
+        args=[expr, parse_into_expr(by)],
+        kwargs={
+            "window": _business_days_window(window),
+            "agg": agg,
+            "min_samples": min_samples,
+            "weekmask": get_weekmask(weekend),
+            "holidays": _holidays_to_epoch_days(holidays),
+        },
+    )
+
+
+def business_duration(  # noqa: PLR0913
+    start: IntoExprColumn,
+    end: IntoExprColumn,
+    *,
+    open: time = time(9),  # noqa: A002
+    close: time = time(17),
+    time_zone: str | None = None,
+    weekend: Sequence[str] = ("Sat", "Sun"),
+    holidays: IntoHolidays | None = None,
+) -> pl.Expr:
+    """
+    Calculate the business time elapsed between two datetimes.
+
+    Only time between ``open`` and ``close`` on business days counts,
+    as read off the local clock.
+
+    Parameters
+    ----------
+    start
+        Start datetimes.
+    end
+        End datetimes. If they're before ``start``, the result is negative.
+    open
+        Time of day at which business hours start. Defaults to 09:00.
+    close
+        Time of day at which business hours end. Defaults to 17:00.
+    time_zone
+        Time zone in which business hours are observed. Defaults to the
+        time zone of ``start``. Can only be set for time-zone-aware
+        datetimes.
+    weekend
+        The days of the week that are considered weekends. Defaults to ("Sat", "Sun").
+    holidays
+        The holidays to exclude from the calculation. Defaults to None. This should
+        be a list of ``datetime.date`` s, or a Date Series, NumPy ``datetime64[D]``
+        array or Arrow Date32 array, which are used without conversion to Python
+        objects.
+
+    Returns
+    -------
+    polars.Expr
+        Duration expression, with the time unit of ``start``.
+
+    Examples
+    --------
+    >>> from datetime import datetime, time
+    >>> import polars as pl
+    >>> import polars_xdt as xdt
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "opened": [datetime(2024, 1, 5, 16), datetime(2024, 1, 9, 8)],
+    ...         "closed": [
+    ...             datetime(2024, 1, 8, 10, 30),
+    ...             datetime(2024, 1, 9, 18),
+    ...         ],
+    ...     }
+    ... )
+    >>> df.with_columns(
+    ...     working_time=xdt.business_duration(
+    ...         "opened", "closed", open=time(9), close=time(17, 30)
+    ...     )
+    ... )
+    shape: (2, 3)
+    ┌─────────────────────┬─────────────────────┬──────────────┐
+    │ opened              ┆ closed              ┆ working_time │
+    │ ---                 ┆ ---                 ┆ ---          │
+    │ datetime[μs]        ┆ datetime[μs]        ┆ duration[μs] │
+    ╞═════════════════════╪═════════════════════╪══════════════╡
+    │ 2024-01-05 16:00:00 ┆ 2024-01-08 10:30:00 ┆ 3h           │
+    │ 2024-01-09 08:00:00 ┆ 2024-01-09 18:00:00 ┆ 8h 30m       │
+    └─────────────────────┴─────────────────────┴──────────────┘
+
+    """
+    start = parse_into_expr(start)
+    end = parse_into_expr(end)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="business_duration",
+        is_elementwise=True,
+        args=[start, end],
+        kwargs={
+            "open": _time_to_nanoseconds(open),
+            "close": _time_to_nanoseconds(close),
+            "weekmask": get_weekmask(weekend),
+            "holidays": _holidays_to_epoch_days(holidays),
+            "time_zone": time_zone,
+        },
+    )
+
+
+def _session_kwargs(
+    sessions: Sequence[tuple[time, time]],
+    time_zone: str | None,
+    weekend: Sequence[str],
+    holidays: IntoHolidays | None,
+) -> dict[str, Any]:
+    return {
+        "sessions": [
+            [_time_to_nanoseconds(open_), _time_to_nanoseconds(close)]
+            for open_, close in sessions
+        ],
+        "weekmask": get_weekmask(weekend),
+        "holidays": _holidays_to_epoch_days(holidays),
+        "time_zone": time_zone,
+    }
+
+
+def is_in_session(
+    expr: IntoExprColumn,
+    sessions: Sequence[tuple[time, time]],
+    *,
+    time_zone: str | None = None,
+    weekend: Sequence[str] = ("Sat", "Sun"),
+    holidays: IntoHolidays | None = None,
+) -> pl.Expr:
+    """
+    Determine whether each datetime falls within a trading session.
+
+    Each row costs a binary search over the day's sessions, rather than a
+    join against a table of sessions.
+
+    Parameters
+    ----------
+    expr
+        Input expression, of Datetime type.
+    sessions
+        Trading sessions, as ``(open, close)`` times of day. Each session
+        includes its open but not its close. Sessions must be in order and
+        not overlap, and are observed on every business day.
+    time_zone
+        Time zone in which sessions are observed. Defaults to the time zone
+        of ``expr``. Can only be set for time-zone-aware datetimes.
+    weekend
+        The days of the week that are considered weekends. Defaults to ("Sat", "Sun").
+    holidays
+        The holidays to exclude from the calculation. Defaults to None. This should
+        be a list of ``datetime.date`` s, or a Date Series, NumPy ``datetime64[D]``
+        array or Arrow Date32 array, which are used without conversion to Python
+        objects.
+
+    Returns
+    -------
+    polars.Expr
+
+    Examples
+    --------
+    >>> from datetime import datetime, time
+    >>> import polars as pl
+    >>> import polars_xdt as xdt
+    >>> sessions = [(time(9), time(11, 30)), (time(12, 30), time(15))]
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "tick": [
+    ...             datetime(2024, 1, 5, 10),
+    ...             datetime(2024, 1, 5, 12),
+    ...             datetime(2024, 1, 5, 15, 30),
+    ...             datetime(2024, 1, 6, 10),
+    ...         ],
+    ...     }
+    ... )
+    >>> df.with_columns(in_session=xdt.is_in_session("tick", sessions))
+    shape: (4, 2)
+    ┌─────────────────────┬────────────┐
+    │ tick                ┆ in_session │
+    │ ---                 ┆ ---        │
+    │ datetime[μs]        ┆ bool       │
+    ╞═════════════════════╪════════════╡
+    │ 2024-01-05 10:00:00 ┆ true       │
+    │ 2024-01-05 12:00:00 ┆ false      │
+    │ 2024-01-05 15:30:00 ┆ false      │
+    │ 2024-01-06 10:00:00 ┆ false      │
+    └─────────────────────┴────────────┘
+
+    """
+    expr = parse_into_expr(expr)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="is_in_session",
+        is_elementwise=True,
+        args=[expr],
+        kwargs=_session_kwargs(sessions, time_zone, weekend, holidays),
+    )
+
+
+def next_session_open(
+    expr: IntoExprColumn,
+    sessions: Sequence[tuple[time, time]],
+    *,
+    time_zone: str | None = None,
+    weekend: Sequence[str] = ("Sat", "Sun"),
+    holidays: IntoHolidays | None = None,
+) -> pl.Expr:
+    """
+    Find the next session open, at or after each datetime.
+
+    Opens are found on the local clock, and returned in the time zone of
+    ``expr``.
+
+    Parameters
+    ----------
+    expr
+        Input expression, of Datetime type.
+    sessions
+        Trading sessions, as ``(open, close)`` times of day. Each session
+        includes its open but not its close. Sessions must be in order and
+        not overlap, and are observed on every business day.
+    time_zone
+        Time zone in which sessions are observed. Defaults to the time zone
+        of ``expr``. Can only be set for time-zone-aware datetimes.
+    weekend
+        The days of the week that are considered weekends. Defaults to ("Sat", "Sun").
+    holidays
+        The holidays to exclude from the calculation. Defaults to None. This should
+        be a list of ``datetime.date`` s, or a Date Series, NumPy ``datetime64[D]``
+        array or Arrow Date32 array, which are used without conversion to Python
+        objects.
+
+    Returns
+    -------
+    polars.Expr
+
+    Examples
+    --------
+    >>> from datetime import datetime, time
+    >>> import polars as pl
+    >>> import polars_xdt as xdt
+    >>> sessions = [(time(9), time(11, 30)), (time(12, 30), time(15))]
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "tick": [
+    ...             datetime(2024, 1, 5, 10),
+    ...             datetime(2024, 1, 5, 12),
+    ...             datetime(2024, 1, 5, 15, 30),
+    ...             datetime(2024, 1, 6, 10),
+    ...         ],
+    ...     }
+    ... )
+    >>> df.with_columns(next_open=xdt.next_session_open("tick", sessions))
+    shape: (4, 2)
+    ┌─────────────────────┬─────────────────────┐
+    │ tick                ┆ next_open           │
+    │ ---                 ┆ ---                 │
+    │ datetime[μs]        ┆ datetime[μs]        │
+    ╞═════════════════════╪═════════════════════╡
+    │ 2024-01-05 10:00:00 ┆ 2024-01-05 12:30:00 │
+    │ 2024-01-05 12:00:00 ┆ 2024-01-05 12:30:00 │
+    │ 2024-01-05 15:30:00 ┆ 2024-01-08 09:00:00 │
+    │ 2024-01-06 10:00:00 ┆ 2024-01-08 09:00:00 │
+    └─────────────────────┴─────────────────────┘
+
+    """
+    expr = parse_into_expr(expr)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="next_session_open",
+        is_elementwise=True,
+        args=[expr],
+        kwargs=_session_kwargs(sessions, time_zone, weekend, holidays),
+    )
+
+
+def next_session_close(
+    expr: IntoExprColumn,
+    sessions: Sequence[tuple[time, time]],
+    *,
+    time_zone: str | None = None,
+    weekend: Sequence[str] = ("Sat", "Sun"),
+    holidays: IntoHolidays | None = None,
+) -> pl.Expr:
+    """
+    Find the next session close, at or after each datetime.
+
+    Closes are found on the local clock, and returned in the time zone of
+    ``expr``. For datetimes within a session, this is the end of that
+    session.
+
+    Parameters
+    ----------
+    expr
+        Input expression, of Datetime type.
+    sessions
+        Trading sessions, as ``(open, close)`` times of day. Each session
+        includes its open but not its close. Sessions must be in order and
+        not overlap, and are observed on every business day.
+    time_zone
+        Time zone in which sessions are observed. Defaults to the time zone
+        of ``expr``. Can only be set for time-zone-aware datetimes.
+    weekend
+        The days of the week that are considered weekends. Defaults to ("Sat", "Sun").
+    holidays
+        The holidays to exclude from the calculation. Defaults to None. This should
+        be a list of ``datetime.date`` s, or a Date Series, NumPy ``datetime64[D]``
+        array or Arrow Date32 array, which are used without conversion to Python
+        objects.
+
+    Returns
+    -------
+    polars.Expr
+
+    Examples
+    --------
+    >>> from datetime import datetime, time
+    >>> import polars as pl
+    >>> import polars_xdt as xdt
+    >>> sessions = [(time(9), time(11, 30)), (time(12, 30), time(15))]
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "tick": [
+    ...             datetime(2024, 1, 5, 10),
+    ...             datetime(2024, 1, 5, 12),
+    ...             datetime(2024, 1, 5, 15, 30),
+    ...             datetime(2024, 1, 6, 10),
+    ...         ],
+    ...     }
+    ... )
+    >>> df.with_columns(next_close=xdt.next_session_close("tick", sessions))
+    shape: (4, 2)
+    ┌─────────────────────┬─────────────────────┐
+    │ tick                ┆ next_close          │
+    │ ---                 ┆ ---                 │
+    │ datetime[μs]        ┆ datetime[μs]        │
+    ╞═════════════════════╪═════════════════════╡
+    │ 2024-01-05 10:00:00 ┆ 2024-01-05 11:30:00 │
+    │ 2024-01-05 12:00:00 ┆ 2024-01-05 15:00:00 │
+    │ 2024-01-05 15:30:00 ┆ 2024-01-08 11:30:00 │
+    │ 2024-01-06 10:00:00 ┆ 2024-01-08 11:30:00 │
+    └─────────────────────┴─────────────────────┘
+
+    """
+    expr = parse_into_expr(expr)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="next_session_close",
+        is_elementwise=True,
+        args=[expr],
+        kwargs=_session_kwargs(sessions, time_zone, weekend, holidays),
+    )
+
+
+def nth_weekday_of_month(
+    expr: IntoExprColumn,
+    weekday: str,
+    n: int,
+) -> pl.Expr:
+    """
+    Find the n-th given weekday of each date's month.
+
+    Useful for rules such as "third Friday of the month". Each row is
+    computed arithmetically, without materializing the days of the month.
+
+    Parameters
+    ----------
+    expr
+        Input expression, of Date or Datetime type. Datetimes are assigned to
+        their local date.
+    weekday
+        Day of the week, from "Mon" to "Sun".
+    n
+        Which occurrence of ``weekday`` to find: 1 for the first, 2 for the
+        second, and so on, or -1 for the last, -2 for the second to last,
+        and so on. Months without an ``n``-th such weekday give null.
+
+    Returns
+    -------
+    polars.Expr
+        Date expression.
+
+    Examples
+    --------
+    >>> from datetime import date
+    >>> import polars as pl
+    >>> import polars_xdt as xdt
+    >>> df = pl.DataFrame(
+    ...     {"date": [date(2024, 1, 15), date(2024, 2, 10), date(2024, 3, 31)]}
+    ... )
+    >>> df.with_columns(
+    ...     third_friday=xdt.nth_weekday_of_month("date", "Fri", 3),
+    ...     last_friday=xdt.nth_weekday_of_month("date", "Fri", -1),
+    ... )
+    shape: (3, 3)
+    ┌────────────┬──────────────┬─────────────┐
+    │ date       ┆ third_friday ┆ last_friday │
+    │ ---        ┆ ---          ┆ ---         │
+    │ date       ┆ date         ┆ date        │
+    ╞════════════╪══════════════╪═════════════╡
+    │ 2024-01-15 ┆ 2024-01-19   ┆ 2024-01-26  │
+    │ 2024-02-10 ┆ 2024-02-16   ┆ 2024-02-23  │
+    │ 2024-03-31 ┆ 2024-03-15   ┆ 2024-03-29  │
+    └────────────┴──────────────┴─────────────┘
+
+    """
+    expr = parse_into_expr(expr)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="nth_weekday_of_month",
+        is_elementwise=True,
+        args=[expr],
+        kwargs={"weekday": mapping[weekday] - 1, "n": n},
+    )
+
+
+def nth_business_day_of_month(
+    expr: IntoExprColumn,
+    n: int,
+    *,
+    weekend: Sequence[str] = ("Sat", "Sun"),
+    holidays: IntoHolidays | None = None,
+) -> pl.Expr:
+    """
+    Find the n-th business day of each date's month.
+
+    Useful for rules such as "fifth business day" or "last business day of
+    the month". Business days are counted with the same index as
+    :func:`business_day_ordinal`, so each row costs a few lookups rather
+    than a pass over the days of the month.
+
+    Parameters
+    ----------
+    expr
+        Input expression, of Date or Datetime type. Datetimes are assigned to
+        their local date.
+    n
+        Which business day to find: 1 for the first, 2 for the second, and
+        so on, or -1 for the last, -2 for the second to last, and so on.
+        Months with fewer than ``n`` business days give null.
     weekend
         The days of the week that are considered weekends. Defaults to ("Sat", "Sun").
     holidays
         The holidays to exclude from the calculation. Defaults to None. This should
-        be a list of ``datetime.date`` s.
+        be a list of ``datetime.date`` s, or a Date Series, NumPy ``datetime64[D]``
+        array or Arrow Date32 array, which are used without conversion to Python
+        objects.
 
     Returns
     -------
     polars.Expr
+        Date expression.
 
     Examples
     --------
@@ -73,42 +830,46 @@ def is_workday(
     >>> import polars as pl
     >>> import polars_xdt as xdt
     >>> df = pl.DataFrame(
-    ...     {
-    ...         "date": [
-    ...             date(2023, 1, 4),
-    ...             date(2023, 5, 1),
-    ...             date(2023, 9, 9),
-    ...         ],
-    ...     }
+    ...     {"date": [date(2024, 1, 15), date(2024, 2, 10), date(2024, 3, 31)]}
     ... )
-    >>> df.with_columns(is_workday=xdt.is_workday("date"))
-    shape: (3, 2)
-    ┌────────────┬────────────┐
-    │ date       ┆ is_workday │
-    │ ---        ┆ ---        │
-    │ date       ┆ bool       │
-    ╞════════════╪════════════╡
-    │ 2023-01-04 ┆ true       │
-    │ 2023-05-01 ┆ true       │
-    │ 2023-09-09 ┆ false      │
-    └────────────┴────────────┘
+    >>> df.with_columns(
+    ...     fifth=xdt.nth_business_day_of_month("date", 5),
+    ...     last=xdt.nth_business_day_of_month("date", -1),
+    ... )
+    shape: (3, 3)
+    ┌────────────┬────────────┬────────────┐
+    │ date       ┆ fifth      ┆ last       │
+    │ ---        ┆ ---        ┆ ---        │
+    │ date       ┆ date       ┆ date       │
+    ╞════════════╪════════════╪════════════╡
+    │ 2024-01-15 ┆ 2024-01-05 ┆ 2024-01-31 │
+    │ 2024-02-10 ┆ 2024-02-07 ┆ 2024-02-29 │
+    │ 2024-03-31 ┆ 2024-03-07 ┆ 2024-03-29 │
+    └────────────┴────────────┴────────────┘
 
     """
     expr = parse_into_expr(expr)
-    weekend_int = [mapping[x] for x in weekend]
-    if holidays is not None:
-        return ~(
-            expr.dt.date().is_in(holidays)
-            | expr.dt.weekday().is_in(weekend_int)
-        )
-    return ~expr.dt.weekday().is_in(weekend_int)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="nth_business_day_of_month",
+        is_elementwise=True,
+        args=[expr],
+        kwargs={
+            "n": n,
+            "weekmask": get_weekmask(weekend),
+            "holidays": _holidays_to_epoch_days(holidays),
+        },
+    )
 
 
-def from_local_datetime(
+def from_local_datetime(  # noqa: PLR0913
     expr: IntoExprColumn,
     from_tz: str | Expr,
     to_tz: str,
-    ambiguous: Ambiguous = "raise",
+    ambiguous: Ambiguous | Expr = "raise",
+    non_existent: NonExistent = "raise",
+    *,
+    dedupe: bool | None = None,
 ) -> pl.Expr:
     """
     Convert from local datetime in given time zone to new timezone.
@@ -127,6 +888,24 @@ def from_local_datetime(
         - `'raise'` (default): raise
         - `'earliest'`: use the earliest datetime
         - `'latest'`: use the latest datetime
+        - `'null'`: set to null
+
+        May also be an expression, so that each row can be handled
+        differently.
+    non_existent
+        Determine how to deal with non-existent datetimes (which fall in a
+        daylight saving time gap):
+
+        - `'raise'` (default): raise
+        - `'null'`: set to null
+        - `'shift_forward'`: use the first existing datetime after the gap
+        - `'shift_backward'`: use the last existing datetime before the gap
+    dedupe
+        Whether to convert each distinct datetime only once and gather the
+        results, which pays off when values repeat a lot (for example,
+        minute-truncated times). If ``None`` (default), this is decided by
+        sampling the input. Only used when `from_tz` and `ambiguous` are
+        scalars.
 
     Returns
     -------
@@ -173,14 +952,16 @@ def from_local_datetime(
     """
     expr = parse_into_expr(expr)
     from_tz = parse_into_expr(from_tz, str_as_lit=True)
+    ambiguous = parse_into_expr(ambiguous, str_as_lit=True)
     return register_plugin_function(
         plugin_path=PLUGIN_PATH,
         function_name="from_local_datetime",
         is_elementwise=True,
-        args=[expr, from_tz],
+        args=[expr, from_tz, ambiguous],
         kwargs={
             "to_tz": to_tz,
-            "ambiguous": ambiguous,
+            "non_existent": non_existent,
+            "dedupe": dedupe,
         },
     )
 
@@ -248,10 +1029,234 @@ def to_local_datetime(
     )
 
 
+def local_truncate(
+    expr: IntoExprColumn,
+    every: str,
+    time_zone: str | Expr,
+) -> pl.Expr:
+    """
+    Truncate datetimes in the local calendar of the given time zone(s).
+
+    This is equivalent to converting each datetime to its local time zone,
+    truncating, and converting back, but is done in a single pass.
+
+    Parameters
+    ----------
+    expr
+        Expression to truncate.
+    every
+        Duration string, e.g. ``'1d'``, ``'1w'``, or ``'1mo'``. See
+        :func:`ceil` for the supported string language.
+    time_zone
+        Time zone whose local calendar to truncate in. May be a column of
+        time zones, in which case each row is truncated in its own time zone.
+
+    Returns
+    -------
+    Expr
+        Expression of the same data type as ``expr``.
+
+    Examples
+    --------
+    >>> from datetime import datetime
+    >>> import polars_xdt as xdt
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "date_col": [datetime(2020, 10, 10, 3)] * 3,
+    ...         "timezone": [
+    ...             "Europe/London",
+    ...             "Africa/Kigali",
+    ...             "America/New_York",
+    ...         ],
+    ...     }
+    ... ).with_columns(pl.col("date_col").dt.replace_time_zone("UTC"))
+    >>> df.with_columns(
+    ...     local_day_start=xdt.local_truncate(
+    ...         "date_col", "1d", pl.col("timezone")
+    ...     )
+    ... )
+    shape: (3, 3)
+    ┌─────────────────────────┬──────────────────┬─────────────────────────┐
+    │ date_col                ┆ timezone         ┆ local_day_start         │
+    │ ---                     ┆ ---              ┆ ---                     │
+    │ datetime[μs, UTC]       ┆ str              ┆ datetime[μs, UTC]       │
+    ╞═════════════════════════╪══════════════════╪═════════════════════════╡
+    │ 2020-10-10 03:00:00 UTC ┆ Europe/London    ┆ 2020-10-09 23:00:00 UTC │
+    │ 2020-10-10 03:00:00 UTC ┆ Africa/Kigali    ┆ 2020-10-09 22:00:00 UTC │
+    │ 2020-10-10 03:00:00 UTC ┆ America/New_York ┆ 2020-10-09 04:00:00 UTC │
+    └─────────────────────────┴──────────────────┴─────────────────────────┘
+
+    """
+    expr = parse_into_expr(expr)
+    time_zone = parse_into_expr(time_zone, str_as_lit=True)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="local_truncate",
+        is_elementwise=True,
+        args=[expr, time_zone],
+        kwargs={"every": every},
+    )
+
+
+def local_ceil(
+    expr: IntoExprColumn,
+    every: str,
+    time_zone: str | Expr,
+) -> pl.Expr:
+    """
+    Find "ceiling" of datetimes in the local calendar of the given time zone(s).
+
+    This is equivalent to converting each datetime to its local time zone,
+    taking the ceiling, and converting back, but is done in a single pass.
+
+    Parameters
+    ----------
+    expr
+        Expression to take "ceiling" of.
+    every
+        Duration string, e.g. ``'1d'``, ``'1w'``, or ``'1mo'``. See
+        :func:`ceil` for the supported string language.
+    time_zone
+        Time zone whose local calendar to take the ceiling in. May be a column
+        of time zones, in which case each row uses its own time zone.
+
+    Returns
+    -------
+    Expr
+        Expression of the same data type as ``expr``.
+
+    Examples
+    --------
+    >>> from datetime import datetime
+    >>> import polars_xdt as xdt
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "date_col": [datetime(2020, 10, 10, 3)] * 3,
+    ...         "timezone": [
+    ...             "Europe/London",
+    ...             "Africa/Kigali",
+    ...             "America/New_York",
+    ...         ],
+    ...     }
+    ... ).with_columns(pl.col("date_col").dt.replace_time_zone("UTC"))
+    >>> df.with_columns(
+    ...     next_local_day_start=xdt.local_ceil(
+    ...         "date_col", "1d", pl.col("timezone")
+    ...     )
+    ... )
+    shape: (3, 3)
+    ┌─────────────────────────┬──────────────────┬─────────────────────────┐
+    │ date_col                ┆ timezone         ┆ next_local_day_start    │
+    │ ---                     ┆ ---              ┆ ---                     │
+    │ datetime[μs, UTC]       ┆ str              ┆ datetime[μs, UTC]       │
+    ╞═════════════════════════╪══════════════════╪═════════════════════════╡
+    │ 2020-10-10 03:00:00 UTC ┆ Europe/London    ┆ 2020-10-10 23:00:00 UTC │
+    │ 2020-10-10 03:00:00 UTC ┆ Africa/Kigali    ┆ 2020-10-10 22:00:00 UTC │
+    │ 2020-10-10 03:00:00 UTC ┆ America/New_York ┆ 2020-10-10 04:00:00 UTC │
+    └─────────────────────────┴──────────────────┴─────────────────────────┘
+
+    """
+    expr = parse_into_expr(expr)
+    time_zone = parse_into_expr(time_zone, str_as_lit=True)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="local_ceil",
+        is_elementwise=True,
+        args=[expr, time_zone],
+        kwargs={"every": every},
+    )
+
+
+def local_fields(
+    expr: IntoExprColumn,
+    time_zone: str | Expr,
+    fields: Sequence[LocalField] = (
+        "date",
+        "hour",
+        "weekday",
+        "utc_offset",
+        "is_dst",
+    ),
+) -> pl.Expr:
+    """
+    Extract local calendar fields in the given time zone(s).
+
+    This is equivalent to calling :func:`to_local_datetime` followed by
+    several ``.dt`` extractions, but each row's time zone conversion is only
+    done once, and no intermediate Datetime column is created.
+
+    Parameters
+    ----------
+    expr
+        Expression to extract fields from.
+    time_zone
+        Time zone to extract fields in. May be a column of time zones, in
+        which case each row uses its own time zone.
+    fields
+        Which fields to extract, in order. Available fields are:
+
+        - `'date'`: local date, of data type :class:`Date`
+        - `'hour'`: local hour, of data type :class:`Int8`
+        - `'weekday'`: local ISO weekday (Monday = 1 and Sunday = 7),
+          of data type :class:`Int8`
+        - `'utc_offset'`: offset from UTC, including any daylight saving
+          adjustment, of data type :class:`Duration`
+        - `'is_dst'`: whether daylight saving time is in effect, of data type
+          :class:`Boolean`
+
+    Returns
+    -------
+    Expr
+        Expression of data type :class:`Struct`, with one field per
+        requested field.
+
+    Examples
+    --------
+    >>> from datetime import datetime
+    >>> import polars_xdt as xdt
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "date_col": [datetime(2020, 10, 10, 23)] * 3,
+    ...         "timezone": [
+    ...             "Europe/London",
+    ...             "Africa/Kigali",
+    ...             "America/New_York",
+    ...         ],
+    ...     }
+    ... ).with_columns(pl.col("date_col").dt.replace_time_zone("UTC"))
+    >>> df.select(
+    ...     "timezone",
+    ...     xdt.local_fields("date_col", pl.col("timezone")).alias("local"),
+    ... ).unnest("local")
+    shape: (3, 6)
+    ┌──────────────────┬────────────┬──────┬─────────┬──────────────┬────────┐
+    │ timezone         ┆ date       ┆ hour ┆ weekday ┆ utc_offset   ┆ is_dst │
+    │ ---              ┆ ---        ┆ ---  ┆ ---     ┆ ---          ┆ ---    │
+    │ str              ┆ date       ┆ i8   ┆ i8      ┆ duration[μs] ┆ bool   │
+    ╞══════════════════╪════════════╪══════╪═════════╪══════════════╪════════╡
+    │ Europe/London    ┆ 2020-10-11 ┆ 0    ┆ 7       ┆ 1h           ┆ true   │
+    │ Africa/Kigali    ┆ 2020-10-11 ┆ 1    ┆ 7       ┆ 2h           ┆ false  │
+    │ America/New_York ┆ 2020-10-10 ┆ 19   ┆ 6       ┆ -4h          ┆ true   │
+    └──────────────────┴────────────┴──────┴─────────┴──────────────┴────────┘
+
+    """
+    expr = parse_into_expr(expr)
+    time_zone = parse_into_expr(time_zone, str_as_lit=True)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="local_fields",
+        is_elementwise=True,
+        args=[expr, time_zone],
+        kwargs={"fields": list(fields)},
+    )
+
+
 def format_localized(
     expr: IntoExprColumn,
-    format: str,  # noqa: A002
+    format: str | LocalizedFormats,  # noqa: A002
     locale: str = "uk_UA",
+    *,
+    dedupe: bool | None = None,
 ) -> pl.Expr:
     """
     Convert to local datetime in given time zone.
@@ -263,14 +1268,27 @@ def format_localized(
     format
         Format string, see https://docs.rs/chrono/latest/chrono/format/strftime/index.html
         for what's available.
+
+        To format into several strings at once, pass a list of format
+        strings, or a dict from field name to either a format string or a
+        ``(format, locale)`` tuple. Each value is then decoded (and converted
+        to its time zone) only once for all of them, and the result is a
+        :class:`Struct`, with one field per format. Fields from a list are
+        named after their format strings.
     locale
         Locale to use for formatting. Defaults to "uk_UA", because that's what the OP
         requested https://github.com/pola-rs/polars/issues/12341.
+    dedupe
+        Whether to format each distinct value only once and gather the
+        results, which pays off when values repeat a lot (for example, daily
+        timestamps). If ``None`` (default), this is decided by sampling the
+        input.
 
     Returns
     -------
     Expr
-        Expression of data type :class:`Utf8`.
+        Expression of data type :class:`Utf8`, or :class:`Struct` if several
+        formats are given.
 
     Examples
     --------
@@ -296,14 +1314,216 @@ def format_localized(
     │ 2024-10-01 00:00:00 ┆ вівторок, 01 жовтня 2024 │
     └─────────────────────┴──────────────────────────┘
 
+    Several formats, and locales, at once:
+
+    >>> df.select(
+    ...     xdt.format_localized(
+    ...         "date_col",
+    ...         {
+    ...             "date": "%d %B %Y",
+    ...             "weekday": "%A",
+    ...             "weekday_en": ("%A", "en_US"),
+    ...         },
+    ...     ).alias("formatted")
+    ... ).unnest("formatted")
+    shape: (2, 3)
+    ┌────────────────┬──────────┬────────────┐
+    │ date           ┆ weekday  ┆ weekday_en │
+    │ ---            ┆ ---      ┆ ---        │
+    │ str            ┆ str      ┆ str        │
+    ╞════════════════╪══════════╪════════════╡
+    │ 24 серпня 2024 ┆ субота   ┆ Saturday   │
+    │ 01 жовтня 2024 ┆ вівторок ┆ Tuesday    │
+    └────────────────┴──────────┴────────────┘
+
+    """
+    expr = parse_into_expr(expr)
+    if isinstance(format, str):
+        return register_plugin_function(
+            plugin_path=PLUGIN_PATH,
+            function_name="format_localized",
+            is_elementwise=True,
+            args=[expr],
+            kwargs={"format": format, "locale": locale, "dedupe": dedupe},
+        )
+    specs = (
+        format.items() if isinstance(format, Mapping) else zip(format, format)
+    )
+    formats = [
+        [name, spec, locale] if isinstance(spec, str) else [name, *spec]
+        for name, spec in specs
+    ]
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="format_localized_many",
+        is_elementwise=True,
+        args=[expr],
+        kwargs={"formats": formats, "dedupe": dedupe},
+    )
+
+
+def parse_localized(
+    expr: IntoExprColumn,
+    format: str,  # noqa: A002
+    locale: str = "uk_UA",
+    *,
+    time_unit: TimeUnit = "us",
+    strict: bool = True,
+) -> pl.Expr:
+    """
+    Parse strings with localized month and weekday names into datetimes.
+
+    This is the inverse of :func:`format_localized`.
+
+    Parameters
+    ----------
+    expr
+        Expression of data type :class:`String` to parse.
+    format
+        Format string, see https://docs.rs/chrono/latest/chrono/format/strftime/index.html
+        for what's available. Month names (``%B``, ``%b``), weekday names
+        (``%A``, ``%a``), and AM/PM (``%p``) are matched case-insensitively
+        against those of ``locale``; full and abbreviated names are both
+        accepted.
+    locale
+        Locale of the names in ``expr``.
+    time_unit
+        Time unit of the resulting Datetime.
+    strict
+        Whether to raise if a value can't be parsed. If ``False``, such
+        values become null.
+
+    Returns
+    -------
+    Expr
+        Expression of data type :class:`Datetime`. If ``format`` contains a
+        UTC offset (e.g. ``%z``), values are converted to UTC and the result
+        is time-zone aware.
+
+    Examples
+    --------
+    >>> import polars_xdt as xdt
+    >>> df = pl.DataFrame(
+    ...     {"date_col": ["samedi, 24 août 2024", "mardi, 01 octobre 2024"]}
+    ... )
+    >>> df.with_columns(
+    ...     result=xdt.parse_localized(
+    ...         "date_col", format="%A, %d %B %Y", locale="fr_FR"
+    ...     )
+    ... )
+    shape: (2, 2)
+    ┌────────────────────────┬─────────────────────┐
+    │ date_col               ┆ result              │
+    │ ---                    ┆ ---                 │
+    │ str                    ┆ datetime[μs]        │
+    ╞════════════════════════╪═════════════════════╡
+    │ samedi, 24 août 2024   ┆ 2024-08-24 00:00:00 │
+    │ mardi, 01 octobre 2024 ┆ 2024-10-01 00:00:00 │
+    └────────────────────────┴─────────────────────┘
+
+    """
+    expr = parse_into_expr(expr)
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="parse_localized",
+        is_elementwise=True,
+        args=[expr],
+        kwargs={
+            "format": format,
+            "locale": locale,
+            "time_unit": time_unit,
+            "strict": strict,
+        },
+    )
+
+
+def fiscal_period(
+    expr: IntoExprColumn,
+    *,
+    start_month: int = 1,
+    scheme: FiscalScheme = "month",
+    week_start: str = "Mon",
+    anchor: Literal["nearest", "last"] = "nearest",
+) -> pl.Expr:
+    """
+    Compute fiscal year, quarter, period, and week.
+
+    Fiscal years are named after the calendar year in which they end.
+
+    Parameters
+    ----------
+    expr
+        Expression of data type :class:`Date` or :class:`Datetime`.
+        Time-zone-aware datetimes use their local date.
+    start_month
+        Month (1 to 12) in which the fiscal year starts.
+    scheme
+        How the fiscal year is split into periods:
+
+        - ``'month'``: the fiscal year starts on the first of ``start_month``,
+          and periods are calendar months.
+        - ``'445'``, ``'454'``, ``'544'``: retail calendar of 52 or 53 whole
+          weeks. Each quarter has 13 weeks, split into periods of 4, 4 and 5
+          weeks (or 4-5-4, or 5-4-4). The 53rd week, when there is one, is
+          part of the last period.
+    week_start
+        Day of the week ("Mon", "Tue", ...) on which weeks, and therefore
+        retail fiscal years, start. Only used by retail schemes.
+    anchor
+        Which ``week_start`` day retail fiscal years start on:
+
+        - ``'nearest'``: the one nearest to the first of ``start_month``.
+        - ``'last'``: the last one on or before the first of ``start_month``.
+
+    Returns
+    -------
+    Expr
+        Expression of data type :class:`Struct`, with fields:
+
+        - ``fiscal_year`` (:class:`Int32`)
+        - ``fiscal_quarter`` (:class:`Int8`), from 1 to 4
+        - ``fiscal_period`` (:class:`Int8`), from 1 to 12
+        - ``fiscal_week`` (:class:`Int8`), from 1 to 53
+
+    Examples
+    --------
+    National Retail Federation calendar: 4-5-4, with weeks starting on
+    Sunday and years ending on the Saturday nearest the end of January.
+
+    >>> from datetime import date
+    >>> import polars_xdt as xdt
+    >>> df = pl.DataFrame(
+    ...     {"date": [date(2023, 1, 29), date(2023, 3, 5), date(2024, 2, 3)]}
+    ... )
+    >>> df.with_columns(
+    ...     xdt.fiscal_period(
+    ...         "date", start_month=2, scheme="454", week_start="Sun"
+    ...     ).alias("fiscal")
+    ... ).unnest("fiscal")
+    shape: (3, 5)
+    ┌────────────┬─────────────┬────────────────┬───────────────┬─────────────┐
+    │ date       ┆ fiscal_year ┆ fiscal_quarter ┆ fiscal_period ┆ fiscal_week │
+    │ ---        ┆ ---         ┆ ---            ┆ ---           ┆ ---         │
+    │ date       ┆ i32         ┆ i8             ┆ i8            ┆ i8          │
+    ╞════════════╪═════════════╪════════════════╪═══════════════╪═════════════╡
+    │ 2023-01-29 ┆ 2024        ┆ 1              ┆ 1             ┆ 1           │
+    │ 2023-03-05 ┆ 2024        ┆ 1              ┆ 2             ┆ 6           │
+    │ 2024-02-03 ┆ 2024        ┆ 4              ┆ 12            ┆ 53          │
+    └────────────┴─────────────┴────────────────┴───────────────┴─────────────┘
+
     """
     expr = parse_into_expr(expr)
     return register_plugin_function(
         plugin_path=PLUGIN_PATH,
-        function_name="format_localized",
+        function_name="fiscal_period",
         is_elementwise=True,
         args=[expr],
-        kwargs={"format": format, "locale": locale},
+        kwargs={
+            "start_month": start_month,
+            "scheme": scheme,
+            "week_start": mapping[week_start] - 1,
+            "anchor": anchor,
+        },
     )
 
 
@@ -407,11 +1627,19 @@ def ceil(
 
     """
     expr = parse_into_expr(expr)
-    truncated = expr.dt.truncate(every)
-    return (
-        pl.when(expr == truncated)
-        .then(expr)
-        .otherwise(truncated.dt.offset_by(every))
+    if isinstance(every, pl.Expr):
+        truncated = expr.dt.truncate(every)
+        return (
+            pl.when(expr == truncated)
+            .then(expr)
+            .otherwise(truncated.dt.offset_by(every))
+        )
+    return register_plugin_function(
+        plugin_path=PLUGIN_PATH,
+        function_name="ceil",
+        is_elementwise=True,
+        args=[expr],
+        kwargs={"every": every},
     )
 
 
@@ -577,7 +1805,12 @@ def month_delta(
     )
 
 
-def arg_previous_greater(expr: IntoExprColumn) -> pl.Expr:
+def arg_previous_greater(
+    expr: IntoExprColumn,
+    *,
+    fields: Sequence[PreviousGreaterField] | None = None,
+    by: IntoExprColumn | None = None,
+) -> pl.Expr:
     """
     Find the row count of the previous value greater than the current one.
 
@@ -585,11 +1818,28 @@ def arg_previous_greater(expr: IntoExprColumn) -> pl.Expr:
     ----------
     expr
         Expression.
+    fields
+        If given, return these fields of the previous greater value, in
+        order, instead of just its row count. They're all filled in during
+        the same pass which finds it, so no gather is needed afterwards.
+        Available fields are:
+
+        - `'index'`: row count of the previous greater value, as returned
+          when `fields` isn't given
+        - `'distance'`: number of rows since the previous greater value
+        - `'value'`: the previous greater value itself
+        - `'delta'`: difference between the current and previous greater
+          rows of `by`, of data type :class:`Duration`
+
+    by
+        Date, Datetime or Duration expression, from which to compute the
+        `'delta'` field.
 
     Returns
     -------
     Expr
-        UInt64 or UInt32 type, depending on the platform.
+        UInt64 or UInt32 type, depending on the platform. If `fields` is
+        given, :class:`Struct` with one field per requested field.
 
     Examples
     --------
@@ -633,42 +1883,53 @@ def arg_previous_greater(expr: IntoExprColumn) -> pl.Expr:
     ... )
     >>> df = df.with_columns(pl.col("date").str.to_date())
 
-    and want find out, for each day and each item, how many days it's
-    been since `'value'` was higher than it currently is, you could do
+    and want find out, for each day and each item, how long it's been
+    since `'value'` was higher than it currently is, and what it was then,
+    you could do
 
     >>> df.with_columns(
-    ...     result=(
-    ...         (
-    ...             pl.col("date")
-    ...             - pl.col("date")
-    ...             .gather(xdt.arg_previous_greater("value"))
-    ...             .over("group")
-    ...         ).dt.total_days()
-    ...     ),
-    ... )
-    shape: (10, 4)
-    ┌────────────┬───────┬───────┬────────┐
-    │ date       ┆ group ┆ value ┆ result │
-    │ ---        ┆ ---   ┆ ---   ┆ ---    │
-    │ date       ┆ str   ┆ i64   ┆ i64    │
-    ╞════════════╪═══════╪═══════╪════════╡
-    │ 2024-02-01 ┆ A     ┆ 1     ┆ null   │
-    │ 2024-02-02 ┆ A     ┆ 9     ┆ 0      │
-    │ 2024-02-03 ┆ A     ┆ null  ┆ null   │
-    │ 2024-02-04 ┆ A     ┆ 7     ┆ 2      │
-    │ 2024-02-05 ┆ A     ┆ 3     ┆ 1      │
-    │ 2024-02-06 ┆ B     ┆ 2     ┆ null   │
-    │ 2024-02-07 ┆ B     ┆ 4     ┆ 0      │
-    │ 2024-02-08 ┆ B     ┆ 5     ┆ 0      │
-    │ 2024-02-09 ┆ B     ┆ 1     ┆ 1      │
-    │ 2024-02-10 ┆ B     ┆ 9     ┆ 0      │
-    └────────────┴───────┴───────┴────────┘
+    ...     xdt.arg_previous_greater(
+    ...         "value", fields=["delta", "value"], by="date"
+    ...     )
+    ...     .over("group")
+    ...     .struct.rename_fields(["delta", "previous_value"])
+    ...     .alias("previous")
+    ... ).unnest("previous")
+    shape: (10, 5)
+    ┌────────────┬───────┬───────┬──────────────┬────────────────┐
+    │ date       ┆ group ┆ value ┆ delta        ┆ previous_value │
+    │ ---        ┆ ---   ┆ ---   ┆ ---          ┆ ---            │
+    │ date       ┆ str   ┆ i64   ┆ duration[ms] ┆ i64            │
+    ╞════════════╪═══════╪═══════╪══════════════╪════════════════╡
+    │ 2024-02-01 ┆ A     ┆ 1     ┆ null         ┆ null           │
+    │ 2024-02-02 ┆ A     ┆ 9     ┆ 0ms          ┆ 9              │
+    │ 2024-02-03 ┆ A     ┆ null  ┆ null         ┆ null           │
+    │ 2024-02-04 ┆ A     ┆ 7     ┆ 2d           ┆ 9              │
+    │ 2024-02-05 ┆ A     ┆ 3     ┆ 1d           ┆ 7              │
+    │ 2024-02-06 ┆ B     ┆ 2     ┆ null         ┆ null           │
+    │ 2024-02-07 ┆ B     ┆ 4     ┆ 0ms          ┆ 4              │
+    │ 2024-02-08 ┆ B     ┆ 5     ┆ 0ms          ┆ 5              │
+    │ 2024-02-09 ┆ B     ┆ 1     ┆ 1d           ┆ 5              │
+    │ 2024-02-10 ┆ B     ┆ 9     ┆ 0ms          ┆ 9              │
+    └────────────┴───────┴───────┴──────────────┴────────────────┘
 
     """
     expr = parse_into_expr(expr)
+    if fields is None:
+        return register_plugin_function(
+            plugin_path=PLUGIN_PATH,
+            function_name="arg_previous_greater",
+            is_elementwise=False,
+            args=[expr],
+        )
+    if "delta" in fields and by is None:
+        msg = "The 'delta' field requires `by`"
+        raise ValueError(msg)
+    args = [expr] if by is None else [expr, parse_into_expr(by)]
     return register_plugin_function(
         plugin_path=PLUGIN_PATH,
-        function_name="arg_previous_greater",
+        function_name="previous_greater_fields",
         is_elementwise=False,
-        args=[expr],
+        args=args,
+        kwargs={"fields": list(fields)},
     )
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from polars_xdt import _internal
+from polars_xdt.functions import get_weekmask, mapping
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    import polars as pl
+
+
+def _rule_tuple(rule: Mapping[str, Any]) -> tuple[str, int, int, int, str]:
+    observed = rule.get("observed") or "actual"
+    if "easter" in rule:
+        return ("easter", 0, rule["easter"], 0, observed)
+    if "weekday" in rule:
+        weekday = mapping[rule["weekday"]] - 1
+        return ("nth_weekday", rule["month"], weekday, rule["n"], observed)
+    if "day" in rule:
+        return ("fixed", rule["month"], rule["day"], 0, observed)
+    msg = f"Holiday rule must have an 'easter', 'weekday' or 'day' key, got {dict(rule)}"
+    raise ValueError(msg)
+
+
+def generate_holidays(
+    rules: Sequence[Mapping[str, Any]],
+    start_year: int,
+    end_year: int,
+    *,
+    weekend: Sequence[str] = ("Sat", "Sun"),
+) -> pl.Series:
+    """
+    Generate holidays from declarative rules, for a range of years.
+
+    All years are expanded natively in one pass. The result can be passed as
+    ``holidays`` to the business day functions.
+
+    Parameters
+    ----------
+    rules
+        Holiday rules, each a mapping of one of these forms:
+
+        - ``{"month": 12, "day": 25}``: a fixed date. Years in which the
+          date doesn't exist (such as 29 February) are skipped.
+        - ``{"month": 11, "weekday": "Thu", "n": 4}``: the ``n``-th weekday
+          of a month, counting from the end of the month if ``n`` is
+          negative.
+        - ``{"easter": -2}``: days after (Gregorian) Easter Sunday.
+
+        Each rule may also have an ``"observed"`` key, saying where a
+        holiday which falls on a weekend is moved to:
+
+        - ``"actual"`` (default): it isn't moved.
+        - ``"nearest_weekday"``: the nearest business day of the week, or
+          the earlier one if two are as near (e.g. Saturday to Friday, and
+          Sunday to Monday).
+        - ``"next_weekday"``: the next business day of the week which isn't
+          another holiday (such as Boxing Day, when Christmas is on a
+          Sunday).
+
+    start_year
+        First year to generate holidays for.
+    end_year
+        Last year to generate holidays for (inclusive).
+    weekend
+        The days of the week that are considered weekends, for observance.
+        Defaults to ("Sat", "Sun").
+
+    Returns
+    -------
+    Series
+        Sorted, unique holidays, of data type :class:`Date`.
+
+    Examples
+    --------
+    >>> import polars_xdt as xdt
+    >>> rules = [
+    ...     {"month": 1, "day": 1, "observed": "nearest_weekday"},
+    ...     {"month": 1, "weekday": "Mon", "n": 3},
+    ...     {"easter": -2},
+    ...     {"month": 5, "weekday": "Mon", "n": -1},
+    ...     {"month": 7, "day": 4, "observed": "nearest_weekday"},
+    ...     {"month": 11, "weekday": "Thu", "n": 4},
+    ...     {"month": 12, "day": 25, "observed": "nearest_weekday"},
+    ... ]
+    >>> xdt.generate_holidays(rules, 2024, 2024).to_frame()
+    shape: (7, 1)
+    ┌────────────┐
+    │ holidays   │
+    │ ---        │
+    │ date       │
+    ╞════════════╡
+    │ 2024-01-01 │
+    │ 2024-01-15 │
+    │ 2024-03-29 │
+    │ 2024-05-27 │
+    │ 2024-07-04 │
+    │ 2024-11-28 │
+    │ 2024-12-25 │
+    └────────────┘
+
+    """
+    return _internal.generate_holidays(
+        [_rule_tuple(rule) for rule in rules],
+        start_year,
+        end_year,
+        get_weekmask(weekend),
+    )
@@ -1,10 +1,35 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+import importlib
+from datetime import time
+from functools import cache
+from typing import TYPE_CHECKING, Literal
 
 import polars as pl
 
-from polars_xdt import functions
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import date
+    from types import ModuleType
+
+    from polars_xdt.functions import (
+        Ambiguous,
+        FiscalScheme,
+        LocalField,
+        LocalizedFormats,
+        NonExistent,
+        PreviousGreaterField,
+        RollingBusinessAgg,
+        RollStrategy,
+        TimeUnit,
+    )
+    from polars_xdt.typing import IntoExprColumn, IntoHolidays
+
+
+@cache
+def _functions() -> ModuleType:
+    # Imported on first use, so that `import polars_xdt` stays cheap.
+    return importlib.import_module("polars_xdt.functions")
 
 
 @pl.api.register_expr_namespace("xdt")
@@ -14,10 +39,252 @@ class ExprXDTNamespace:
     def __init__(self, expr: pl.Expr) -> None:
         self._expr = expr
 
-    def __getattr__(self, function_name: str) -> Callable[[Any], pl.Expr]:
-        def func(*args: Any, **kwargs: Any) -> pl.Expr:
-            return getattr(functions, function_name)(
-                self._expr, *args, **kwargs
-            )
+    def arg_previous_greater(
+        self,
+        *,
+        fields: Sequence[PreviousGreaterField] | None = None,
+        by: IntoExprColumn | None = None,
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.arg_previous_greater`."""
+        return _functions().arg_previous_greater(
+            self._expr, fields=fields, by=by
+        )
+
+    def business_day_ordinal(
+        self,
+        *,
+        every: int = 1,
+        weekend: Sequence[str] = ("Sat", "Sun"),
+        holidays: IntoHolidays | None = None,
+        roll: RollStrategy = "forward",
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.business_day_ordinal`."""
+        return _functions().business_day_ordinal(
+            self._expr,
+            every=every,
+            weekend=weekend,
+            holidays=holidays,
+            roll=roll,
+        )
+
+    def business_duration(  # noqa: PLR0913
+        self,
+        end: IntoExprColumn,
+        *,
+        open: time = time(9),  # noqa: A002
+        close: time = time(17),
+        time_zone: str | None = None,
+        weekend: Sequence[str] = ("Sat", "Sun"),
+        holidays: IntoHolidays | None = None,
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.business_duration`."""
+        return _functions().business_duration(
+            self._expr,
+            end,
+            open=open,
+            close=close,
+            time_zone=time_zone,
+            weekend=weekend,
+            holidays=holidays,
+        )
+
+    def ceil(self, every: str | pl.Expr) -> pl.Expr:
+        """See :func:`polars_xdt.ceil`."""
+        return _functions().ceil(self._expr, every)
+
+    def day_name(self, locale: str | None = None) -> pl.Expr:
+        """See :func:`polars_xdt.day_name`."""
+        return _functions().day_name(self._expr, locale)
+
+    def fiscal_period(
+        self,
+        *,
+        start_month: int = 1,
+        scheme: FiscalScheme = "month",
+        week_start: str = "Mon",
+        anchor: Literal["nearest", "last"] = "nearest",
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.fiscal_period`."""
+        return _functions().fiscal_period(
+            self._expr,
+            start_month=start_month,
+            scheme=scheme,
+            week_start=week_start,
+            anchor=anchor,
+        )
+
+    def format_localized(
+        self,
+        format: str | LocalizedFormats,  # noqa: A002
+        locale: str = "uk_UA",
+        *,
+        dedupe: bool | None = None,
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.format_localized`."""
+        return _functions().format_localized(
+            self._expr, format, locale, dedupe=dedupe
+        )
+
+    def from_local_datetime(
+        self,
+        from_tz: str | pl.Expr,
+        to_tz: str,
+        ambiguous: Ambiguous | pl.Expr = "raise",
+        non_existent: NonExistent = "raise",
+        *,
+        dedupe: bool | None = None,
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.from_local_datetime`."""
+        return _functions().from_local_datetime(
+            self._expr, from_tz, to_tz, ambiguous, non_existent, dedupe=dedupe
+        )
+
+    def is_in_session(
+        self,
+        sessions: Sequence[tuple[time, time]],
+        *,
+        time_zone: str | None = None,
+        weekend: Sequence[str] = ("Sat", "Sun"),
+        holidays: IntoHolidays | None = None,
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.is_in_session`."""
+        return _functions().is_in_session(
+            self._expr,
+            sessions,
+            time_zone=time_zone,
+            weekend=weekend,
+            holidays=holidays,
+        )
+
+    def is_workday(
+        self,
+        *,
+        weekend: Sequence[str] = ("Sat", "Sun"),
+        holidays: IntoHolidays | None = None,
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.is_workday`."""
+        return _functions().is_workday(
+            self._expr, weekend=weekend, holidays=holidays
+        )
+
+    def local_ceil(self, every: str, time_zone: str | pl.Expr) -> pl.Expr:
+        """See :func:`polars_xdt.local_ceil`."""
+        return _functions().local_ceil(self._expr, every, time_zone)
+
+    def local_fields(
+        self,
+        time_zone: str | pl.Expr,
+        fields: Sequence[LocalField] = (
+            "date",
+            "hour",
+            "weekday",
+            "utc_offset",
+            "is_dst",
+        ),
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.local_fields`."""
+        return _functions().local_fields(self._expr, time_zone, fields)
+
+    def local_truncate(self, every: str, time_zone: str | pl.Expr) -> pl.Expr:
+        """See :func:`polars_xdt.local_truncate`."""
+        return _functions().local_truncate(self._expr, every, time_zone)
+
+    def month_delta(self, end_dates: IntoExprColumn | date) -> pl.Expr:
+        """See :func:`polars_xdt.month_delta`."""
+        return _functions().month_delta(self._expr, end_dates)
+
+    def month_name(self, locale: str | None = None) -> pl.Expr:
+        """See :func:`polars_xdt.month_name`."""
+        return _functions().month_name(self._expr, locale)
+
+    def next_session_close(
+        self,
+        sessions: Sequence[tuple[time, time]],
+        *,
+        time_zone: str | None = None,
+        weekend: Sequence[str] = ("Sat", "Sun"),
+        holidays: IntoHolidays | None = None,
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.next_session_close`."""
+        return _functions().next_session_close(
+            self._expr,
+            sessions,
+            time_zone=time_zone,
+            weekend=weekend,
+            holidays=holidays,
+        )
+
+    def next_session_open(
+        self,
+        sessions: Sequence[tuple[time, time]],
+        *,
+        time_zone: str | None = None,
+        weekend: Sequence[str] = ("Sat", "Sun"),
+        holidays: IntoHolidays | None = None,
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.next_session_open`."""
+        return _functions().next_session_open(
+            self._expr,
+            sessions,
+            time_zone=time_zone,
+            weekend=weekend,
+            holidays=holidays,
+        )
+
+    def nth_business_day_of_month(
+        self,
+        n: int,
+        *,
+        weekend: Sequence[str] = ("Sat", "Sun"),
+        holidays: IntoHolidays | None = None,
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.nth_business_day_of_month`."""
+        return _functions().nth_business_day_of_month(
+            self._expr, n, weekend=weekend, holidays=holidays
+        )
+
+    def nth_weekday_of_month(self, weekday: str, n: int) -> pl.Expr:
+        """See :func:`polars_xdt.nth_weekday_of_month`."""
+        return _functions().nth_weekday_of_month(self._expr, weekday, n)
+
+    def parse_localized(
+        self,
+        format: str,  # noqa: A002
+        locale: str = "uk_UA",
+        *,
+        time_unit: TimeUnit = "us",
+        strict: bool = True,
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.parse_localized`."""
+        return _functions().parse_localized(
+            self._expr, format, locale, time_unit=time_unit, strict=strict
+        )
+
+    def rolling_business(  # noqa: PLR0913
+        self,
+        *,
+        by: IntoExprColumn,
+        window: str | int,
+        agg: RollingBusinessAgg = "sum",
+        min_samples: int = 1,
+        weekend: Sequence[str] = ("Sat", "Sun"),
+        holidays: IntoHolidays | None = None,
+    ) -> pl.Expr:
+        """See :func:`polars_xdt.rolling_business`."""
+        return _functions().rolling_business(
+            self._expr,
+            by=by,
+            window=window,
+            agg=agg,
+            min_samples=min_samples,
+            weekend=weekend,
+            holidays=holidays,
+        )
+
+    def to_julian_date(self) -> pl.Expr:
+        """See :func:`polars_xdt.to_julian_date`."""
+        return _functions().to_julian_date(self._expr)
 
-        return func
+    def to_local_datetime(self, time_zone: str | pl.Expr) -> pl.Expr:
+        """See :func:`polars_xdt.to_local_datetime`."""
+        return _functions().to_local_datetime(self._expr, time_zone)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from polars_xdt import _internal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import polars as pl
+
+
+@contextmanager
+def profiling() -> Iterator[None]:
+    """
+    Record counters for polars-xdt kernels run inside this context.
+
+    Counters are reset on entry, and can be read with
+    :func:`profiling_stats` (also after the context exits).
+
+    Profiling can also be enabled for the whole process by setting the
+    ``POLARS_XDT_PROFILE`` environment variable to ``1``. It's read once, the
+    first time the plugin allocates or runs a kernel, so it has to be set
+    before then. When disabled, the counters have no measurable cost.
+
+    Examples
+    --------
+    >>> from datetime import date
+    >>> import polars as pl
+    >>> import polars_xdt as xdt
+    >>> df = pl.DataFrame({"date": [date(2024, 1, 1), date(2024, 1, 6)]})
+    >>> with xdt.profiling():
+    ...     _ = df.select(xdt.is_workday("date"))
+    >>> xdt.profiling_stats().select("function", "calls", "rows")
+    shape: (1, 3)
+    ┌────────────┬───────┬──────┐
+    │ function   ┆ calls ┆ rows │
+    │ ---        ┆ ---   ┆ ---  │
+    │ str        ┆ u64   ┆ u64  │
+    ╞════════════╪═══════╪══════╡
+    │ is_workday ┆ 1     ┆ 2    │
+    └────────────┴───────┴──────┘
+
+    """
+    was_enabled = _internal.is_profiling()
+    _internal.reset_profiling()
+    _internal.set_profiling(True)
+    try:
+        yield
+    finally:
+        _internal.set_profiling(was_enabled)
+
+
+def profiling_stats() -> pl.DataFrame:
+    """
+    Return the counters recorded while profiling, one row per function.
+
+    Columns:
+
+    - ``function``: name of the polars-xdt kernel.
+    - ``calls``: number of times the kernel ran.
+    - ``wall_time_ns``: total wall time spent in the kernel, in nanoseconds.
+    - ``rows``: total number of rows processed.
+    - ``chunks``: total number of chunks in the kernel's first input.
+    - ``allocated_bytes``: total bytes allocated by the plugin while the
+      kernel ran. Kernels running concurrently share this counter.
+
+    Returns
+    -------
+    DataFrame
+
+    """
+    return _internal.profiling_stats()
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, Literal, Union, overload
 
 import polars as pl
 
+from polars_xdt.utils import holidays_to_series
+
 mapping = {"Mon": 1, "Tue": 2, "Wed": 3, "Thu": 4, "Fri": 5, "Sat": 6, "Sun": 7}
 
 if TYPE_CHECKING:
@@ -17,6 +19,8 @@ if TYPE_CHECKING:
         from typing_extensions import TypeAlias
     from datetime import date, datetime, timedelta
 
+    from polars_xdt.typing import IntoHolidays
+
     ClosedInterval: TypeAlias = Literal[
         "left", "right", "both", "none"
     ]  # ClosedWindow
@@ -32,7 +36,7 @@ def date_range(
     closed: ClosedInterval = ...,
     eager: Literal[False] = ...,
     weekend: Sequence[str] = ...,
-    holidays: Sequence[date] | None = ...,
+    holidays: IntoHolidays | None = ...,
 ) -> pl.Expr: ...
 
 
@@ -45,7 +49,7 @@ def date_range(
     closed: ClosedInterval = ...,
     eager: Literal[True],
     weekend: Sequence[str] = ...,
-    holidays: Sequence[date] | None = ...,
+    holidays: IntoHolidays | None = ...,
 ) -> pl.Series: ...
 
 
@@ -58,7 +62,7 @@ def date_range(
     closed: ClosedInterval = ...,
     eager: bool = ...,
     weekend: Sequence[str] = ...,
-    holidays: Sequence[date] | None = ...,
+    holidays: IntoHolidays | None = ...,
 ) -> pl.Series | pl.Expr: ...
 
 
@@ -70,7 +74,7 @@ def date_range(  # noqa: PLR0913
     closed: ClosedInterval = "both",
     eager: bool = False,
     weekend: Sequence[str] = ("Sat", "Sun"),
-    holidays: Sequence[date] | None = None,
+    holidays: IntoHolidays | None = None,
 ) -> pl.Series | pl.Expr:
     """
     Create a range of dates with a given interval and filter out weekends and holidays.
@@ -96,7 +100,9 @@ def date_range(  # noqa: PLR0913
         The days of the week that are considered weekends. Defaults to ("Sat", "Sun").
     holidays
         The holidays to exclude from the calculation. Defaults to None. This should
-        be a list of ``datetime.date`` s.
+        be a list of ``datetime.date`` s, or a Date Series, NumPy ``datetime64[D]``
+        array or Arrow Date32 array, which are used without conversion to Python
+        objects.
 
     Returns
     -------
@@ -135,9 +141,6 @@ def date_range(  # noqa: PLR0913
         weekend_int = [6, 7]
     else:
         weekend_int = sorted({mapping[name] for name in weekend})
-    if holidays is None:
-        holidays = []
-
     if not (isinstance(interval, str) and re.match(r"^-?\d+bd$", interval)):
         msg = "Only intervals of the form 'nbd' (where n is an integer) are supported."
         raise ValueError(msg)
@@ -150,7 +153,9 @@ def date_range(  # noqa: PLR0913
         closed=closed,
         eager=False,
     )
-    expr = expr.filter(~expr.dt.date().is_in(holidays))
+    if holidays is not None:
+        holidays = holidays_to_series(holidays)
+        expr = expr.filter(~expr.dt.date().is_in(holidays.implode()))
     expr = expr.filter(~expr.dt.weekday().is_in(weekend_int))
     if eager:
         df = pl.select(expr)
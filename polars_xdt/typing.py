@@ -1,9 +1,13 @@
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Union
 
 if TYPE_CHECKING:
     import sys
+    from collections.abc import Sequence
+    from datetime import date
 
+    import numpy as np
     import polars as pl
+    import pyarrow as pa
 
     if sys.version_info >= (3, 10):
         from typing import TypeAlias
@@ -13,3 +17,10 @@ if TYPE_CHECKING:
 
     IntoExprColumn: TypeAlias = Union[pl.Expr, str, pl.Series]
     PolarsDataType: TypeAlias = Union[DataType, DataTypeClass]
+    IntoHolidays: TypeAlias = Union[
+        Sequence[date],
+        pl.Series,
+        np.ndarray[Any, Any],
+        pa.Array,
+        pa.ChunkedArray,
+    ]
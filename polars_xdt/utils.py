@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 import polars as pl
 
 if TYPE_CHECKING:
-    from polars_xdt.typing import IntoExprColumn, PolarsDataType
+    from polars_xdt.typing import IntoExprColumn, IntoHolidays, PolarsDataType
 
 
 def parse_into_expr(
@@ -47,3 +47,28 @@ def parse_into_expr(
         expr = pl.lit(expr, dtype=dtype)
 
     return expr
+
+
+def holidays_to_series(holidays: IntoHolidays) -> pl.Series:
+    """
+    Convert holidays to a Date Series.
+
+    Series, NumPy ``datetime64[D]`` arrays and Arrow Date32 arrays are used
+    as they are, without going through Python ``date`` objects.
+
+    Parameters
+    ----------
+    holidays
+        The holidays to convert.
+
+    Returns
+    -------
+    polars.Series
+
+    """
+    series = (
+        holidays if isinstance(holidays, pl.Series) else pl.Series(holidays)
+    )
+    if series.dtype != pl.Date:
+        series = series.cast(pl.Date)
+    return series
@@ -1,42 +1,205 @@
 use polars::prelude::*;
+use polars_arrow::array::{Array, PrimitiveArray};
+use polars_arrow::types::NativeType;
+use std::str::FromStr;
+
+const MILLISECONDS_PER_DAY: i64 = 86_400_000;
+
+/// Outputs which `arg_previous_greater` can return for each row's previous
+/// greater value.
+#[derive(Clone, Copy, PartialEq)]
+pub enum PreviousGreaterField {
+    Index,
+    Distance,
+    Value,
+    Delta,
+}
+
+impl FromStr for PreviousGreaterField {
+    type Err = PolarsError;
+
+    fn from_str(s: &str) -> Result<Self, Self::Err> {
+        match s {
+            "index" => Ok(PreviousGreaterField::Index),
+            "distance" => Ok(PreviousGreaterField::Distance),
+            "value" => Ok(PreviousGreaterField::Value),
+            "delta" => Ok(PreviousGreaterField::Delta),
+            s => polars_bail!(InvalidOperation:
+                "Invalid field {}, expected one of: \"index\", \"distance\", \"value\", \"delta\"", s
+            ),
+        }
+    }
+}
+
+impl PreviousGreaterField {
+    pub fn dtype(&self, dtype: &DataType, by: Option<&DataType>) -> PolarsResult<DataType> {
+        match self {
+            PreviousGreaterField::Index | PreviousGreaterField::Distance => Ok(IDX_DTYPE),
+            PreviousGreaterField::Value => Ok(dtype.clone()),
+            PreviousGreaterField::Delta => match by {
+                Some(DataType::Date) => Ok(DataType::Duration(TimeUnit::Milliseconds)),
+                Some(DataType::Datetime(unit, _)) | Some(DataType::Duration(unit)) => {
+                    Ok(DataType::Duration(*unit))
+                }
+                Some(dtype) => polars_bail!(InvalidOperation:
+                    "`by` must be of data type Date, Datetime or Duration, got {}", dtype
+                ),
+                None => polars_bail!(InvalidOperation: "The `delta` field requires `by`"),
+            },
+        }
+    }
+}
+
+/// Call `f` with each row and the row of its previous greater value, or the
+/// row itself if there isn't one. Null rows, and rows with only nulls before
+/// them, get `None`.
+///
+/// Each row keeps a link to its previous greater value, so that each search
+/// follows links rather than scanning back row by row.
+fn for_each_previous_greater<T>(arr: &PrimitiveArray<T>, mut f: impl FnMut(usize, Option<usize>))
+where
+    T: NativeType + PartialOrd,
+{
+    const NONE: usize = usize::MAX;
+    let values = arr.values().as_slice();
+    let mut previous = Vec::with_capacity(values.len());
+    let mut last_valid = NONE;
+    for (i, &value) in values.iter().enumerate() {
+        if !arr.is_valid(i) {
+            previous.push(NONE);
+            f(i, None);
+            continue;
+        }
+        let mut j = last_valid;
+        last_valid = i;
+        if j == NONE {
+            previous.push(NONE);
+            f(i, None);
+            continue;
+        }
+        while j != NONE && value >= values[j] {
+            j = previous[j];
+        }
+        previous.push(j);
+        f(i, Some(if j == NONE { i } else { j }));
+    }
+}
 
 pub(crate) fn impl_arg_previous_greater<T>(ca: &ChunkedArray<T>) -> IdxCa
 where
     T: PolarsNumericType,
 {
-    let mut idx: Vec<i32> = Vec::with_capacity(ca.len());
-    let out: IdxCa = ca
+    let mut builder = PrimitiveChunkedBuilder::<IdxType>::new(ca.name().clone(), ca.len());
+    let ca = ca.rechunk();
+    if let Some(arr) = ca.downcast_iter().next() {
+        for_each_previous_greater(arr, |_, j| {
+            builder.append_option(j.map(|j| j as IdxSize));
+        });
+    }
+    builder.finish()
+}
+
+/// `by` as integers in its duration time unit, with dates in milliseconds.
+fn delta_values(by: &Series) -> PolarsResult<Int64Chunked> {
+    match by.dtype() {
+        DataType::Date => Ok(by.cast(&DataType::Int64)?.i64()?.clone() * MILLISECONDS_PER_DAY),
+        DataType::Datetime(_, _) | DataType::Duration(_) => {
+            Ok(by.to_physical_repr().i64()?.clone())
+        }
+        dtype => polars_bail!(InvalidOperation:
+            "`by` must be of data type Date, Datetime or Duration, got {}", dtype
+        ),
+    }
+}
+
+/// The requested fields of each row's previous greater value, computed
+/// during the same pass which finds it, rather than by gathering afterwards.
+pub(crate) fn impl_previous_greater_fields<T>(
+    ca: &ChunkedArray<T>,
+    by: Option<&Series>,
+    fields: &[String],
+) -> PolarsResult<StructChunked>
+where
+    T: PolarsNumericType,
+{
+    let fields = fields
         .iter()
-        .enumerate()
-        .map(|(i, opt_val)| {
-            if opt_val.is_none() {
-                idx.push(-1);
-                return None;
-            }
-            let i_curr = i;
-            let mut i = (i as i32) - 1; // look at previous element
-            while i >= 0 && ca.get(i as usize).is_none() {
-                // find previous non-null value
-                i -= 1;
-            }
-            if i < 0 {
-                idx.push(-1);
-                return None;
+        .map(|field| PreviousGreaterField::from_str(field))
+        .collect::<PolarsResult<Vec<_>>>()?;
+    polars_ensure!(
+        !fields.is_empty(),
+        InvalidOperation: "`fields` must contain at least one field"
+    );
+    polars_ensure!(
+        (1..fields.len()).all(|i| !fields[..i].contains(&fields[i])),
+        InvalidOperation: "`fields` must not contain duplicates"
+    );
+    let len = ca.len();
+    let wants = |field: PreviousGreaterField| fields.contains(&field);
+
+    let by = match by {
+        Some(by) if wants(PreviousGreaterField::Delta) => {
+            polars_ensure!(
+                by.len() == len,
+                ShapeMismatch: "`by` must have the same length as the input, got {} and {}", by.len(), len
+            );
+            let DataType::Duration(unit) =
+                PreviousGreaterField::Delta.dtype(ca.dtype(), Some(by.dtype()))?
+            else {
+                unreachable!()
+            };
+            Some((delta_values(by)?.rechunk().into_owned(), unit))
+        }
+        None if wants(PreviousGreaterField::Delta) => {
+            polars_bail!(InvalidOperation: "The `delta` field requires `by`")
+        }
+        _ => None,
+    };
+    let by_values: Option<&PrimitiveArray<i64>> =
+        by.as_ref().and_then(|(by, _)| by.downcast_iter().next());
+
+    let mut index = wants(PreviousGreaterField::Index)
+        .then(|| PrimitiveChunkedBuilder::<IdxType>::new("index".into(), len));
+    let mut distance = wants(PreviousGreaterField::Distance)
+        .then(|| PrimitiveChunkedBuilder::<IdxType>::new("distance".into(), len));
+    let mut value = wants(PreviousGreaterField::Value)
+        .then(|| PrimitiveChunkedBuilder::<T>::new("value".into(), len));
+    let mut delta = wants(PreviousGreaterField::Delta)
+        .then(|| PrimitiveChunkedBuilder::<Int64Type>::new("delta".into(), len));
+
+    let ca = ca.rechunk();
+    if let Some(values) = ca.downcast_iter().next() {
+        for_each_previous_greater(values, |i, j| {
+            if let Some(b) = index.as_mut() {
+                b.append_option(j.map(|j| j as IdxSize))
             }
-            while (i != -1) && opt_val >= ca.get(i as usize) {
-                i = idx[i as usize];
+            if let Some(b) = distance.as_mut() {
+                b.append_option(j.map(|j| (i - j) as IdxSize))
             }
-            if i == -1 {
-                idx.push(-1);
-                return Some(i_curr as IdxSize);
+            if let Some(b) = value.as_mut() {
+                // Just compared against, so this doesn't miss the cache.
+                b.append_option(j.map(|j| values.value(j)))
             }
-            idx.push(i);
-            if i == -1 {
-                None
-            } else {
-                Some(i as IdxSize)
+            if let (Some(b), Some(by)) = (delta.as_mut(), by_values) {
+                let get = |i: usize| by.is_valid(i).then(|| by.value(i));
+                b.append_option(j.and_then(|j| Some(get(i)? - get(j)?)))
             }
+        });
+    }
+
+    let columns = fields
+        .iter()
+        .map(|field| match field {
+            PreviousGreaterField::Index => index.take().unwrap().finish().into_series(),
+            PreviousGreaterField::Distance => distance.take().unwrap().finish().into_series(),
+            PreviousGreaterField::Value => value.take().unwrap().finish().into_series(),
+            PreviousGreaterField::Delta => delta
+                .take()
+                .unwrap()
+                .finish()
+                .into_duration(by.as_ref().unwrap().1)
+                .into_series(),
         })
-        .collect();
-    out
+        .collect::<Vec<_>>();
+    StructChunked::from_series(ca.name().clone(), len, columns.iter())
 }
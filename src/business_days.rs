@@ -0,0 +1,256 @@
+use polars::prelude::*;
+use pyo3_polars::export::polars_core::datatypes::TimeZone as PolarsTimeZone;
+
+use crate::civil::{
+    days_to_date, nanoseconds_per_unit, split_timestamp, weekday, NANOSECONDS_PER_DAY,
+};
+use crate::utils::sortedness_no_nulls;
+
+/// Convert `s` to local calendar dates, as days since the Unix epoch.
+pub(crate) fn to_local_days(s: &Series) -> PolarsResult<Int32Chunked> {
+    let dates = match s.dtype() {
+        DataType::Date => s.clone(),
+        DataType::Datetime(_, None) => s.cast(&DataType::Date)?,
+        DataType::Datetime(_, Some(_)) => polars_ops::prelude::replace_time_zone(
+            s.datetime()?,
+            None,
+            &StringChunked::from_iter(std::iter::once("raise")),
+            NonExistent::Raise,
+        )?
+        .into_series()
+        .cast(&DataType::Date)?,
+        dtype => {
+            polars_bail!(InvalidOperation: "polars_xdt business day functions only work on Date or Datetime type, got {}", dtype)
+        }
+    };
+    Ok(dates.date()?.phys.clone())
+}
+
+/// Whether each date in `s` is a business day.
+///
+/// * `weekmask`: which days of the week, starting from Monday, are business days.
+/// * `holidays`: sorted, deduplicated holidays, as days since the Unix epoch.
+///
+/// If the dates are sorted, then instead of binary-searching `holidays` for each
+/// date, walk through them alongside the dates.
+pub(crate) fn impl_is_workday(
+    s: &Series,
+    weekmask: &[bool; 7],
+    holidays: &[i32],
+) -> PolarsResult<Series> {
+    let days = to_local_days(s)?;
+    let out: BooleanChunked = match (sortedness_no_nulls(&days), days.first()) {
+        (IsSorted::Ascending, Some(first)) => {
+            let mut next_holiday = holidays.partition_point(|&holiday| holiday < first);
+            days.apply_nonnull_values_generic(DataType::Boolean, |day| {
+                while next_holiday < holidays.len() && holidays[next_holiday] < day {
+                    next_holiday += 1;
+                }
+                weekmask[weekday(day)] && holidays.get(next_holiday) != Some(&day)
+            })
+        }
+        _ => days.apply_nonnull_values_generic(DataType::Boolean, |day| {
+            weekmask[weekday(day)] && holidays.binary_search(&day).is_err()
+        }),
+    };
+    Ok(out.into_series())
+}
+
+/// Counts business days under a weekmask and holidays, in O(1) per date.
+pub(crate) struct BusinessDayCounter {
+    /// `week_prefix[k]`: business days among the first `k` days of a week
+    /// starting on Monday.
+    week_prefix: [i32; 8],
+    /// `holidays_before[i]`: holidays before `first_holiday + i`. Only holidays
+    /// which fall on business days of the week are counted.
+    first_holiday: i32,
+    holidays_before: Vec<i32>,
+    /// Business days of the week from Monday 1969-12-29 to 1970-01-01, plus
+    /// holidays before 1970-01-01, so that counts start from the epoch.
+    epoch_offset: i32,
+}
+
+impl BusinessDayCounter {
+    /// * `weekmask`: which days of the week, starting from Monday, are business days.
+    /// * `holidays`: sorted, deduplicated holidays, as days since the Unix epoch.
+    pub(crate) fn new(weekmask: &[bool; 7], holidays: &[i32]) -> Self {
+        let mut week_prefix = [0; 8];
+        for (k, &is_business_day) in weekmask.iter().enumerate() {
+            week_prefix[k + 1] = week_prefix[k] + is_business_day as i32;
+        }
+        let holidays: Vec<i32> = holidays
+            .iter()
+            .copied()
+            .filter(|&holiday| weekmask[weekday(holiday)])
+            .collect();
+        let first_holiday = holidays.first().copied().unwrap_or(0);
+        let mut holidays_before = vec![0];
+        for (count, holiday) in holidays.iter().enumerate() {
+            holidays_before.resize((holiday - first_holiday + 1) as usize, count as i32);
+            holidays_before.push(count as i32 + 1);
+        }
+        let mut counter = Self {
+            week_prefix,
+            first_holiday,
+            holidays_before,
+            epoch_offset: 0,
+        };
+        counter.epoch_offset = counter.count_before(0);
+        counter
+    }
+
+    /// Business days from 1970-01-01 up to (but excluding) `days`, or minus
+    /// those from `days` up to 1970-01-01 for earlier dates.
+    #[inline]
+    pub(crate) fn count_before(&self, days: i32) -> i32 {
+        // Days since Monday 1969-12-29.
+        let since_monday = days + 3;
+        let weekdays = since_monday.div_euclid(7) * self.week_prefix[7]
+            + self.week_prefix[since_monday.rem_euclid(7) as usize];
+        let holidays = match days - self.first_holiday {
+            offset if offset <= 0 => 0,
+            offset => self.holidays_before[(offset as usize).min(self.holidays_before.len() - 1)],
+        };
+        weekdays - holidays - self.epoch_offset
+    }
+
+    #[inline]
+    pub(crate) fn is_business_day(&self, days: i32) -> bool {
+        self.count_before(days + 1) > self.count_before(days)
+    }
+}
+
+/// Business-day ordinal of each date in `s`, divided into buckets of `every`.
+///
+/// Consecutive business days get consecutive ordinals, counted from
+/// 1970-01-01. Other days take the ordinal of the next business day
+/// (`roll="forward"`) or the previous one (`roll="backward"`), or raise
+/// (`roll="raise"`). Ordinals never decrease as dates increase, so sortedness
+/// is preserved.
+pub(crate) fn impl_business_day_ordinal(
+    s: &Series,
+    weekmask: &[bool; 7],
+    holidays: &[i32],
+    roll: &str,
+    every: i32,
+) -> PolarsResult<Series> {
+    polars_ensure!(
+        weekmask.iter().any(|&is_business_day| is_business_day),
+        InvalidOperation: "At least one day of the week must be a business day"
+    );
+    polars_ensure!(every > 0, InvalidOperation: "`every` must be positive, got {}", every);
+    let days = to_local_days(s)?;
+    let counter = BusinessDayCounter::new(weekmask, holidays);
+    let mut out: Int32Chunked = match roll {
+        "forward" => days.apply_values(|day| counter.count_before(day).div_euclid(every)),
+        "backward" => {
+            days.apply_values(|day| (counter.count_before(day + 1) - 1).div_euclid(every))
+        }
+        // Null slots can hold any value, so only check the valid ones.
+        "raise" => days.try_apply_nonnull_values_generic(|day| -> PolarsResult<i32> {
+            let ordinal = counter.count_before(day);
+            polars_ensure!(
+                counter.count_before(day + 1) > ordinal,
+                ComputeError: "date {} is not a business day. You may want to use `roll='forward'` or `roll='backward'`",
+                days_to_date(day)?
+            );
+            Ok(ordinal.div_euclid(every))
+        })?,
+        _ => polars_bail!(InvalidOperation:
+            "Invalid roll {}, expected one of: \"raise\", \"forward\", \"backward\"", roll
+        ),
+    };
+    out.set_sorted_flag(days.is_sorted_flag());
+    Ok(out.into_series())
+}
+
+/// Convert `s` to local wall-clock timestamps, in `time_zone` if given and
+/// otherwise in its own time zone.
+pub(crate) fn to_local_timestamps(
+    s: &Series,
+    time_zone: Option<&str>,
+) -> PolarsResult<Int64Chunked> {
+    let s = match (s.dtype(), time_zone) {
+        (DataType::Datetime(_, None), None) => return Ok(s.datetime()?.phys.clone()),
+        (DataType::Datetime(_, None), Some(_)) => polars_bail!(InvalidOperation:
+            "`time_zone` can only be set for time-zone-aware datetimes. \
+            Please use `replace_time_zone` first."
+        ),
+        (DataType::Datetime(time_unit, Some(_)), Some(time_zone)) => s.cast(
+            &DataType::Datetime(*time_unit, PolarsTimeZone::opt_try_new(Some(time_zone))?),
+        )?,
+        (DataType::Datetime(_, Some(_)), None) => s.clone(),
+        (dtype, _) => {
+            polars_bail!(InvalidOperation: "polars_xdt business hours functions only work on Datetime type, got {}", dtype)
+        }
+    };
+    let local = polars_ops::prelude::replace_time_zone(
+        s.datetime()?,
+        None,
+        &StringChunked::from_iter(std::iter::once("raise")),
+        NonExistent::Raise,
+    )?;
+    Ok(local.phys)
+}
+
+/// Business time from `start` to `end`: time within `open..close` (in
+/// nanoseconds since midnight) on business days, on the local clock.
+///
+/// Each row costs O(1): whole business days up to each timestamp come from
+/// `BusinessDayCounter`, and only the partial days at either end are clipped.
+pub(crate) fn impl_business_duration(
+    start: &Series,
+    end: &Series,
+    open: i64,
+    close: i64,
+    weekmask: &[bool; 7],
+    holidays: &[i32],
+    time_zone: Option<&str>,
+) -> PolarsResult<Series> {
+    polars_ensure!(
+        0 <= open && open < close && close <= NANOSECONDS_PER_DAY,
+        InvalidOperation: "`open` must be before `close`, and both within the same day"
+    );
+    let DataType::Datetime(time_unit, _) = start.dtype() else {
+        polars_bail!(InvalidOperation: "polars_xdt.business_duration only works on Datetime type, got {}", start.dtype())
+    };
+    let time_unit = *time_unit;
+    let end = end.cast(start.dtype())?;
+    let (starts, ends) = match (start.len(), end.len()) {
+        (start_len, end_len) if start_len == end_len => (
+            to_local_timestamps(start, time_zone)?,
+            to_local_timestamps(&end, time_zone)?,
+        ),
+        (1, len) => (
+            to_local_timestamps(&start.new_from_index(0, len), time_zone)?,
+            to_local_timestamps(&end, time_zone)?,
+        ),
+        (len, 1) => (
+            to_local_timestamps(start, time_zone)?,
+            to_local_timestamps(&end.new_from_index(0, len), time_zone)?,
+        ),
+        (start_len, end_len) => polars_bail!(
+            ShapeMismatch: "expected `start` and `end` to be of equal length, got {} and {}", start_len, end_len
+        ),
+    };
+
+    let per_nanosecond = nanoseconds_per_unit(time_unit);
+    let units_per_day = NANOSECONDS_PER_DAY / per_nanosecond;
+    let open = open / per_nanosecond;
+    let hours = close / per_nanosecond - open;
+    let counter = BusinessDayCounter::new(weekmask, holidays);
+    // Business time from 1970-01-01 to `timestamp`.
+    let business_time_before = |timestamp: i64| {
+        let (day, time_of_day) = split_timestamp(timestamp, units_per_day);
+        let partial_day = if counter.is_business_day(day) {
+            (time_of_day - open).clamp(0, hours)
+        } else {
+            0
+        };
+        counter.count_before(day) as i64 * hours + partial_day
+    };
+    let out: Int64Chunked = arity::binary_elementwise_values(&starts, &ends, |start, end| {
+        business_time_before(end) - business_time_before(start)
+    });
+    Ok(out.into_duration(time_unit).into_series())
+}
@@ -0,0 +1,276 @@
+//! Date dimension tables, built natively in one pass.
+//!
+//! Each date in the range is decoded into its civil fields once, and every
+//! requested column is then filled from those fields, in parallel on Polars'
+//! thread pool.
+use chrono::{NaiveDate, NaiveTime};
+use polars::prelude::*;
+use pyo3::prelude::*;
+use pyo3_polars::error::PyPolarsErr;
+use pyo3_polars::export::polars_core::POOL;
+use pyo3_polars::PyDataFrame;
+
+use crate::business_days::BusinessDayCounter;
+use crate::civil::{civil_from_days, day_of_year, days_from_civil, weekday};
+use crate::format_localized::format_ndt;
+
+/// Julian date of 1970-01-01 at midnight.
+const EPOCH_JULIAN_DATE: f64 = 2_440_587.5;
+
+/// Civil fields of every date in the range, decoded once.
+struct Dates {
+    days: Vec<i32>,
+    year: Vec<i32>,
+    month: Vec<u32>,
+    day: Vec<u32>,
+    /// From 0 (Monday) to 6 (Sunday).
+    weekday: Vec<usize>,
+}
+
+impl Dates {
+    fn new(start: i32, end: i32) -> Self {
+        let len = (end - start + 1).max(0) as usize;
+        let mut dates = Self {
+            days: Vec::with_capacity(len),
+            year: Vec::with_capacity(len),
+            month: Vec::with_capacity(len),
+            day: Vec::with_capacity(len),
+            weekday: Vec::with_capacity(len),
+        };
+        for days in start..=end {
+            let (year, month, day) = civil_from_days(days);
+            dates.days.push(days);
+            dates.year.push(year);
+            dates.month.push(month);
+            dates.day.push(day);
+            dates.weekday.push(weekday(days));
+        }
+        dates
+    }
+
+    /// ISO 8601 week-numbering year and week of the `i`-th date.
+    fn iso_week(&self, i: usize) -> (i32, i8) {
+        // ISO weeks belong to the year which their Thursday falls in.
+        let thursday = self.days[i] - self.weekday[i] as i32 + 3;
+        let (year, _, _) = civil_from_days(thursday);
+        let week = (thursday - days_from_civil(year, 1, 1)) / 7 + 1;
+        (year, week as i8)
+    }
+}
+
+enum ColumnSpec {
+    Date,
+    Year,
+    Quarter,
+    Month,
+    Day,
+    Weekday,
+    DayOfYear,
+    IsoYear,
+    IsoWeek,
+    JulianDate,
+    /// Day names, starting from Monday.
+    DayName(String, [String; 7]),
+    /// Month names, starting from January.
+    MonthName(String, [String; 12]),
+    IsWorkday(String, BusinessDayCounter),
+    BusinessDayOrdinal(String, BusinessDayCounter),
+}
+
+fn locale_names<const N: usize>(
+    locale: &str,
+    format: &str,
+    date: impl Fn(u32) -> NaiveDate,
+) -> PolarsResult<[String; N]> {
+    let chrono_locale = chrono::Locale::try_from(locale).map_err(
+        |_| polars_err!(ComputeError: format!("given locale {} could not be parsed", locale)),
+    )?;
+    Ok(std::array::from_fn(|i| {
+        let ndt = date(i as u32).and_time(NaiveTime::MIN);
+        format_ndt(ndt, format, chrono_locale, chrono_tz::UTC).to_string()
+    }))
+}
+
+impl ColumnSpec {
+    fn name(&self) -> String {
+        match self {
+            ColumnSpec::Date => "date".into(),
+            ColumnSpec::Year => "year".into(),
+            ColumnSpec::Quarter => "quarter".into(),
+            ColumnSpec::Month => "month".into(),
+            ColumnSpec::Day => "day".into(),
+            ColumnSpec::Weekday => "weekday".into(),
+            ColumnSpec::DayOfYear => "day_of_year".into(),
+            ColumnSpec::IsoYear => "iso_year".into(),
+            ColumnSpec::IsoWeek => "iso_week".into(),
+            ColumnSpec::JulianDate => "julian_date".into(),
+            ColumnSpec::DayName(suffix, _) => format!("day_name{suffix}"),
+            ColumnSpec::MonthName(suffix, _) => format!("month_name{suffix}"),
+            ColumnSpec::IsWorkday(suffix, _) => format!("is_workday{suffix}"),
+            ColumnSpec::BusinessDayOrdinal(suffix, _) => format!("business_day_ordinal{suffix}"),
+        }
+    }
+
+    fn build(&self, dates: &Dates) -> Column {
+        let name = PlSmallStr::from(self.name());
+        let len = dates.days.len();
+        let series = match self {
+            ColumnSpec::Date => Int32Chunked::from_vec(name, dates.days.clone())
+                .into_date()
+                .into_series(),
+            ColumnSpec::Year => Int32Chunked::from_vec(name, dates.year.clone()).into_series(),
+            ColumnSpec::Quarter => {
+                Int8Chunked::from_iter_values(name, dates.month.iter().map(|m| ((m + 2) / 3) as i8))
+                    .into_series()
+            }
+            ColumnSpec::Month => {
+                Int8Chunked::from_iter_values(name, dates.month.iter().map(|&m| m as i8))
+                    .into_series()
+            }
+            ColumnSpec::Day => {
+                Int8Chunked::from_iter_values(name, dates.day.iter().map(|&d| d as i8))
+                    .into_series()
+            }
+            ColumnSpec::Weekday => {
+                Int8Chunked::from_iter_values(name, dates.weekday.iter().map(|&w| w as i8 + 1))
+                    .into_series()
+            }
+            ColumnSpec::DayOfYear => Int16Chunked::from_iter_values(
+                name,
+                (0..len).map(|i| day_of_year(dates.days[i], dates.year[i]) as i16),
+            )
+            .into_series(),
+            ColumnSpec::IsoYear => {
+                Int32Chunked::from_iter_values(name, (0..len).map(|i| dates.iso_week(i).0))
+                    .into_series()
+            }
+            ColumnSpec::IsoWeek => {
+                Int8Chunked::from_iter_values(name, (0..len).map(|i| dates.iso_week(i).1))
+                    .into_series()
+            }
+            ColumnSpec::JulianDate => Float64Chunked::from_iter_values(
+                name,
+                dates.days.iter().map(|&d| d as f64 + EPOCH_JULIAN_DATE),
+            )
+            .into_series(),
+            ColumnSpec::DayName(_, names) => StringChunked::from_iter_values(
+                name,
+                dates.weekday.iter().map(|&w| names[w].as_str()),
+            )
+            .into_series(),
+            ColumnSpec::MonthName(_, names) => StringChunked::from_iter_values(
+                name,
+                dates.month.iter().map(|&m| names[m as usize - 1].as_str()),
+            )
+            .into_series(),
+            ColumnSpec::IsWorkday(_, counter) => BooleanChunked::from_iter_values(
+                name,
+                dates.days.iter().map(|&d| counter.is_business_day(d)),
+            )
+            .into_series(),
+            ColumnSpec::BusinessDayOrdinal(_, counter) => Int32Chunked::from_iter_values(
+                name,
+                dates.days.iter().map(|&d| counter.count_before(d)),
+            )
+            .into_series(),
+        };
+        series.into_column()
+    }
+}
+
+fn column_specs(
+    fields: &[String],
+    locales: &[(String, String)],
+    calendars: &[(String, [bool; 7], Vec<i32>)],
+) -> PolarsResult<Vec<ColumnSpec>> {
+    let mut specs = vec![];
+    for field in fields {
+        match field.as_str() {
+            "date" => specs.push(ColumnSpec::Date),
+            "year" => specs.push(ColumnSpec::Year),
+            "quarter" => specs.push(ColumnSpec::Quarter),
+            "month" => specs.push(ColumnSpec::Month),
+            "day" => specs.push(ColumnSpec::Day),
+            "weekday" => specs.push(ColumnSpec::Weekday),
+            "day_of_year" => specs.push(ColumnSpec::DayOfYear),
+            "iso_year" => specs.push(ColumnSpec::IsoYear),
+            "iso_week" => specs.push(ColumnSpec::IsoWeek),
+            "julian_date" => specs.push(ColumnSpec::JulianDate),
+            "day_name" => {
+                for (suffix, locale) in locales {
+                    // 2000-01-03 was a Monday.
+                    let names = locale_names(locale, "%A", |i| {
+                        NaiveDate::from_ymd_opt(2000, 1, 3 + i).unwrap()
+                    })?;
+                    specs.push(ColumnSpec::DayName(suffix.clone(), names));
+                }
+            }
+            "month_name" => {
+                for (suffix, locale) in locales {
+                    let names = locale_names(locale, "%B", |i| {
+                        NaiveDate::from_ymd_opt(2000, i + 1, 1).unwrap()
+                    })?;
+                    specs.push(ColumnSpec::MonthName(suffix.clone(), names));
+                }
+            }
+            "is_workday" => {
+                for (suffix, weekmask, holidays) in calendars {
+                    let counter = BusinessDayCounter::new(weekmask, holidays);
+                    specs.push(ColumnSpec::IsWorkday(suffix.clone(), counter));
+                }
+            }
+            "business_day_ordinal" => {
+                for (suffix, weekmask, holidays) in calendars {
+                    polars_ensure!(
+                        weekmask.iter().any(|&is_business_day| is_business_day),
+                        InvalidOperation: "At least one day of the week must be a business day"
+                    );
+                    let counter = BusinessDayCounter::new(weekmask, holidays);
+                    specs.push(ColumnSpec::BusinessDayOrdinal(suffix.clone(), counter));
+                }
+            }
+            field => polars_bail!(InvalidOperation: "Invalid calendar table field {}", field),
+        }
+    }
+    Ok(specs)
+}
+
+fn build_calendar_table(
+    start: i32,
+    end: i32,
+    fields: &[String],
+    locales: &[(String, String)],
+    calendars: &[(String, [bool; 7], Vec<i32>)],
+) -> PolarsResult<DataFrame> {
+    let specs = column_specs(fields, locales, calendars)?;
+    let dates = Dates::new(start, end);
+    let mut columns: Vec<Option<Column>> = (0..specs.len()).map(|_| None).collect();
+    POOL.scope(|scope| {
+        for (spec, column) in specs.iter().zip(columns.iter_mut()) {
+            let dates = &dates;
+            scope.spawn(move |_| *column = Some(spec.build(dates)));
+        }
+    });
+    DataFrame::new(columns.into_iter().map(Option::unwrap).collect())
+}
+
+/// Calendar table for the dates from `start` to `end` (inclusive), as days
+/// since the Unix epoch.
+///
+/// * `locales`: column name suffix and locale, for each set of name columns.
+/// * `calendars`: column name suffix, weekmask and sorted, deduplicated
+///   holidays, for each set of business day columns.
+#[pyfunction]
+pub fn calendar_table(
+    py: Python<'_>,
+    start: i32,
+    end: i32,
+    fields: Vec<String>,
+    locales: Vec<(String, String)>,
+    calendars: Vec<(String, [bool; 7], Vec<i32>)>,
+) -> PyResult<PyDataFrame> {
+    let df = py
+        .allow_threads(|| build_calendar_table(start, end, &fields, &locales, &calendars))
+        .map_err(PyPolarsErr::from)?;
+    Ok(PyDataFrame(df))
+}
@@ -0,0 +1,171 @@
+//! Integer routines for decoding dates and timestamps into civil fields,
+//! shared by every kernel.
+//!
+//! They're plain integer arithmetic, with no data-dependent branches and no
+//! round trips through chrono, so that loops over them can be vectorized.
+//! Chrono is only used at the edges, where a `NaiveDate` or `NaiveDateTime`
+//! is needed for formatting or time zone lookups.
+use chrono::{NaiveDate, NaiveDateTime, NaiveTime};
+use polars::prelude::*;
+
+pub(crate) const SECONDS_PER_DAY: i64 = 86_400;
+pub(crate) const NANOSECONDS_PER_DAY: i64 = 86_400_000_000_000;
+const NANOSECONDS_PER_SECOND: i64 = 1_000_000_000;
+
+/// Days from 0001-01-01 (in the proleptic Gregorian calendar) to 1970-01-01.
+const EPOCH_DAYS_FROM_CE: i32 = 719_163;
+
+const DAYS_PER_MONTH: [[u32; 12]; 2] = [
+    //J   F   M   A   M   J   J   A   S   O   N   D
+    [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], // non-leap year
+    [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], // leap year
+];
+
+/// Units of `time_unit` in a second.
+#[inline]
+pub(crate) fn units_per_second(time_unit: TimeUnit) -> i64 {
+    match time_unit {
+        TimeUnit::Milliseconds => 1_000,
+        TimeUnit::Microseconds => 1_000_000,
+        TimeUnit::Nanoseconds => 1_000_000_000,
+    }
+}
+
+/// Length of one unit of `time_unit`, in nanoseconds.
+#[inline]
+pub(crate) fn nanoseconds_per_unit(time_unit: TimeUnit) -> i64 {
+    NANOSECONDS_PER_SECOND / units_per_second(time_unit)
+}
+
+/// Split `timestamp` into days since the Unix epoch and the time of day,
+/// both counted in `units_per_day`ths of a day.
+#[inline]
+pub(crate) fn split_timestamp(timestamp: i64, units_per_day: i64) -> (i32, i64) {
+    (
+        timestamp.div_euclid(units_per_day) as i32,
+        timestamp.rem_euclid(units_per_day),
+    )
+}
+
+/// Day of the week of `days` (days since the Unix epoch), from 0 (Monday) to 6 (Sunday).
+#[inline]
+pub(crate) fn weekday(days: i32) -> usize {
+    // 1970-01-01 was a Thursday.
+    (days + 3).rem_euclid(7) as usize
+}
+
+/// Year, month and day of `days` since the Unix epoch, in the proleptic
+/// Gregorian calendar.
+#[inline]
+pub(crate) fn civil_from_days(days: i32) -> (i32, u32, u32) {
+    // http://howardhinnant.github.io/date_algorithms.html#civil_from_days
+    let z = days as i64 + 719_468;
+    let era = z.div_euclid(146_097);
+    let doe = z - era * 146_097;
+    let yoe = (doe - doe / 1_460 + doe / 36_524 - doe / 146_096) / 365;
+    let doy = doe - (365 * yoe + yoe / 4 - yoe / 100);
+    let mp = (5 * doy + 2) / 153;
+    let day = doy - (153 * mp + 2) / 5 + 1;
+    let month = if mp < 10 { mp + 3 } else { mp - 9 };
+    let year = yoe + era * 400 + (month <= 2) as i64;
+    (year as i32, month as u32, day as u32)
+}
+
+/// Days since the Unix epoch of the given date, in the proleptic Gregorian
+/// calendar.
+#[inline]
+pub(crate) fn days_from_civil(year: i32, month: u32, day: u32) -> i32 {
+    // http://howardhinnant.github.io/date_algorithms.html#days_from_civil
+    let year = year as i64 - (month <= 2) as i64;
+    let era = year.div_euclid(400);
+    let yoe = year - era * 400;
+    let mp = (month as i64 + 9) % 12;
+    let doy = (153 * mp + 2) / 5 + day as i64 - 1;
+    let doe = yoe * 365 + yoe / 4 - yoe / 100 + doy;
+    (era * 146_097 + doe - 719_468) as i32
+}
+
+/// Day of the year, from 1, of `days` since the Unix epoch, given the `year`
+/// it falls in (as already decoded by `civil_from_days`).
+#[inline]
+pub(crate) fn day_of_year(days: i32, year: i32) -> u32 {
+    (days - days_from_civil(year, 1, 1) + 1) as u32
+}
+
+#[inline]
+pub(crate) fn is_leap_year(year: i32) -> bool {
+    year % 4 == 0 && (year % 100 != 0 || year % 400 == 0)
+}
+
+/// Number of days in `month` (from 1) of `year`.
+#[inline]
+pub(crate) fn days_in_month(year: i32, month: u32) -> u32 {
+    DAYS_PER_MONTH[is_leap_year(year) as usize][month as usize - 1]
+}
+
+/// Hour, minute, second and nanosecond of `nanoseconds` since midnight.
+#[inline]
+pub(crate) fn time_from_nanoseconds(nanoseconds: i64) -> (u32, u32, u32, u32) {
+    let seconds = nanoseconds / NANOSECONDS_PER_SECOND;
+    (
+        (seconds / 3_600) as u32,
+        (seconds / 60 % 60) as u32,
+        (seconds % 60) as u32,
+        (nanoseconds % NANOSECONDS_PER_SECOND) as u32,
+    )
+}
+
+/// Date of `days` since the Unix epoch, if it's in the range of dates which
+/// chrono supports.
+#[inline]
+fn checked_days_to_date(days: i64) -> Option<NaiveDate> {
+    i32::try_from(days + EPOCH_DAYS_FROM_CE as i64)
+        .ok()
+        .and_then(NaiveDate::from_num_days_from_ce_opt)
+}
+
+/// Date of `days` since the Unix epoch, or an error if it's outside the range
+/// of dates which chrono supports.
+pub(crate) fn days_to_date(days: i32) -> PolarsResult<NaiveDate> {
+    checked_days_to_date(days as i64).ok_or_else(
+        || polars_err!(ComputeError: "date {} days from the Unix epoch is out of range", days),
+    )
+}
+
+/// Midnight at the start of `days` since the Unix epoch.
+#[inline]
+pub(crate) fn days_to_datetime(days: i32) -> PolarsResult<NaiveDateTime> {
+    Ok(days_to_date(days)?.and_time(NaiveTime::MIN))
+}
+
+fn timestamp_to_datetime<const UNITS_PER_SECOND: i64>(
+    timestamp: i64,
+) -> PolarsResult<NaiveDateTime> {
+    let units_per_day = UNITS_PER_SECOND * SECONDS_PER_DAY;
+    // Unlike `split_timestamp`, don't let the days wrap around.
+    let date = checked_days_to_date(timestamp.div_euclid(units_per_day))
+        .ok_or_else(|| polars_err!(ComputeError: "timestamp {} is out of range", timestamp))?;
+    let nanoseconds =
+        timestamp.rem_euclid(units_per_day) * (NANOSECONDS_PER_SECOND / UNITS_PER_SECOND);
+    // The time of day is always valid.
+    let time = NaiveTime::from_num_seconds_from_midnight_opt(
+        (nanoseconds / NANOSECONDS_PER_SECOND) as u32,
+        (nanoseconds % NANOSECONDS_PER_SECOND) as u32,
+    )
+    .unwrap();
+    Ok(date.and_time(time))
+}
+
+/// Function which converts timestamps in `time_unit` to `NaiveDateTime`s, or
+/// raises for those outside the range of dates which chrono supports.
+///
+/// The unit is resolved once here rather than for each value, and the
+/// timestamp is split into whole days and the time of day directly, rather
+/// than by way of seconds.
+pub(crate) fn datetime_decoder(time_unit: TimeUnit) -> fn(i64) -> PolarsResult<NaiveDateTime> {
+    match time_unit {
+        TimeUnit::Milliseconds => timestamp_to_datetime::<1_000>,
+        TimeUnit::Microseconds => timestamp_to_datetime::<1_000_000>,
+        TimeUnit::Nanoseconds => timestamp_to_datetime::<1_000_000_000>,
+    }
+}
@@ -1,23 +1,114 @@
 #![allow(clippy::unit_arg, clippy::unused_unit)]
 use crate::arg_previous_greater::*;
+use crate::business_days::*;
+use crate::fiscal::*;
 use crate::format_localized::*;
 use crate::month_delta::*;
+use crate::nth_day::*;
+use crate::parse_localized::*;
+use crate::profiling::profile;
+use crate::rolling_business::*;
+use crate::sessions::*;
 use crate::timezone::*;
 use crate::to_julian::*;
 use polars::prelude::*;
 use pyo3_polars::derive::polars_expr;
 use pyo3_polars::export::polars_core::datatypes::TimeZone as PolarsTimeZone;
 use serde::Deserialize;
+use std::str::FromStr;
 
 #[derive(Deserialize)]
 pub struct FromLocalDatetimeKwargs {
     to_tz: String,
-    ambiguous: String,
+    non_existent: String,
+    dedupe: Option<bool>,
+}
+#[derive(Deserialize)]
+pub struct LocalTruncateKwargs {
+    every: String,
+}
+#[derive(Deserialize)]
+pub struct CeilKwargs {
+    every: String,
+}
+#[derive(Deserialize)]
+pub struct LocalFieldsKwargs {
+    fields: Vec<String>,
+}
+#[derive(Deserialize)]
+pub struct PreviousGreaterFieldsKwargs {
+    fields: Vec<String>,
+}
+#[derive(Deserialize)]
+pub struct IsWorkdayKwargs {
+    weekmask: [bool; 7],
+    holidays: Vec<i32>,
+}
+#[derive(Deserialize)]
+pub struct BusinessDayOrdinalKwargs {
+    weekmask: [bool; 7],
+    holidays: Vec<i32>,
+    roll: String,
+    every: i32,
+}
+#[derive(Deserialize)]
+pub struct RollingBusinessKwargs {
+    window: i32,
+    agg: String,
+    min_samples: usize,
+    weekmask: [bool; 7],
+    holidays: Vec<i32>,
+}
+#[derive(Deserialize)]
+pub struct BusinessDurationKwargs {
+    open: i64,
+    close: i64,
+    weekmask: [bool; 7],
+    holidays: Vec<i32>,
+    time_zone: Option<String>,
+}
+#[derive(Deserialize)]
+pub struct SessionKwargs {
+    sessions: Vec<[i64; 2]>,
+    weekmask: [bool; 7],
+    holidays: Vec<i32>,
+    time_zone: Option<String>,
+}
+#[derive(Deserialize)]
+pub struct NthWeekdayOfMonthKwargs {
+    weekday: usize,
+    n: i32,
+}
+#[derive(Deserialize)]
+pub struct NthBusinessDayOfMonthKwargs {
+    n: i32,
+    weekmask: [bool; 7],
+    holidays: Vec<i32>,
 }
 #[derive(Deserialize)]
 pub struct FormatLocalizedKwargs {
     format: String,
     locale: String,
+    dedupe: Option<bool>,
+}
+#[derive(Deserialize)]
+pub struct FormatLocalizedManyKwargs {
+    formats: Vec<[String; 3]>,
+    dedupe: Option<bool>,
+}
+#[derive(Deserialize)]
+pub struct FiscalPeriodKwargs {
+    start_month: u32,
+    scheme: String,
+    week_start: usize,
+    anchor: String,
+}
+#[derive(Deserialize)]
+pub struct ParseLocalizedKwargs {
+    format: String,
+    locale: String,
+    time_unit: String,
+    strict: bool,
 }
 
 pub fn to_local_datetime_output(input_fields: &[Field]) -> PolarsResult<Field> {
@@ -31,6 +122,139 @@ pub fn to_local_datetime_output(input_fields: &[Field]) -> PolarsResult<Field> {
     Ok(Field::new(field.name, dtype))
 }
 
+pub fn local_truncate_output(input_fields: &[Field]) -> PolarsResult<Field> {
+    let field = input_fields[0].clone();
+    match field.dtype {
+        DataType::Datetime(_, _) => Ok(field),
+        _ => polars_bail!(InvalidOperation:
+            "dtype '{}' not supported", field.dtype
+        ),
+    }
+}
+
+pub fn ceil_output(input_fields: &[Field]) -> PolarsResult<Field> {
+    let field = input_fields[0].clone();
+    match field.dtype {
+        DataType::Date | DataType::Datetime(_, _) => Ok(field),
+        _ => polars_bail!(InvalidOperation:
+            "dtype '{}' not supported", field.dtype
+        ),
+    }
+}
+
+pub fn parse_localized_output(
+    input_fields: &[Field],
+    kwargs: ParseLocalizedKwargs,
+) -> PolarsResult<Field> {
+    let field = input_fields[0].clone();
+    match field.dtype {
+        DataType::String => Ok(Field::new(
+            field.name,
+            parse_localized_dtype(&kwargs.format, &kwargs.time_unit)?,
+        )),
+        _ => polars_bail!(InvalidOperation:
+            "dtype '{}' not supported", field.dtype
+        ),
+    }
+}
+
+pub fn business_duration_output(input_fields: &[Field]) -> PolarsResult<Field> {
+    let field = input_fields[0].clone();
+    match field.dtype {
+        DataType::Datetime(unit, _) => Ok(Field::new(field.name, DataType::Duration(unit))),
+        _ => polars_bail!(InvalidOperation:
+            "dtype '{}' not supported", field.dtype
+        ),
+    }
+}
+
+pub fn fiscal_period_output(input_fields: &[Field]) -> PolarsResult<Field> {
+    let field = input_fields[0].clone();
+    match field.dtype {
+        DataType::Date | DataType::Datetime(_, _) => Ok(Field::new(
+            field.name,
+            DataType::Struct(fiscal_period_fields()),
+        )),
+        _ => polars_bail!(InvalidOperation:
+            "dtype '{}' not supported", field.dtype
+        ),
+    }
+}
+
+pub fn local_fields_output(
+    input_fields: &[Field],
+    kwargs: LocalFieldsKwargs,
+) -> PolarsResult<Field> {
+    let field = input_fields[0].clone();
+    let time_unit = match field.dtype {
+        DataType::Datetime(unit, _) => unit,
+        _ => polars_bail!(InvalidOperation:
+            "dtype '{}' not supported", field.dtype
+        ),
+    };
+    let fields = kwargs
+        .fields
+        .iter()
+        .map(|name| {
+            let local_field = LocalField::from_str(name)?;
+            Ok(Field::new(
+                name.as_str().into(),
+                local_field.dtype(time_unit),
+            ))
+        })
+        .collect::<PolarsResult<Vec<_>>>()?;
+    Ok(Field::new(field.name, DataType::Struct(fields)))
+}
+
+pub fn format_localized_many_output(
+    input_fields: &[Field],
+    kwargs: FormatLocalizedManyKwargs,
+) -> PolarsResult<Field> {
+    let field = input_fields[0].clone();
+    match field.dtype {
+        DataType::Date | DataType::Datetime(_, _) => {
+            let fields = kwargs
+                .formats
+                .iter()
+                .map(|[name, _, _]| Field::new(name.as_str().into(), DataType::String))
+                .collect();
+            Ok(Field::new(field.name, DataType::Struct(fields)))
+        }
+        _ => polars_bail!(InvalidOperation:
+            "dtype '{}' not supported", field.dtype
+        ),
+    }
+}
+
+pub fn rolling_business_output(
+    input_fields: &[Field],
+    kwargs: RollingBusinessKwargs,
+) -> PolarsResult<Field> {
+    let field = &input_fields[0];
+    let dtype = RollingAgg::from_str(&kwargs.agg)?.dtype(&field.dtype)?;
+    Ok(Field::new(field.name.clone(), dtype))
+}
+
+pub fn previous_greater_fields_output(
+    input_fields: &[Field],
+    kwargs: PreviousGreaterFieldsKwargs,
+) -> PolarsResult<Field> {
+    let field = input_fields[0].clone();
+    let by = input_fields.get(1).map(|field| &field.dtype);
+    let fields = kwargs
+        .fields
+        .iter()
+        .map(|name| {
+            let previous_greater_field = PreviousGreaterField::from_str(name)?;
+            Ok(Field::new(
+                name.as_str().into(),
+                previous_greater_field.dtype(&field.dtype, by)?,
+            ))
+        })
+        .collect::<PolarsResult<Vec<_>>>()?;
+    Ok(Field::new(field.name, DataType::Struct(fields)))
+}
+
 pub fn from_local_datetime_output(
     input_fields: &[Field],
     kwargs: FromLocalDatetimeKwargs,
@@ -49,6 +273,7 @@ pub fn from_local_datetime_output(
 
 #[polars_expr(output_type=Int32)]
 fn month_delta(inputs: &[Series]) -> PolarsResult<Series> {
+    let _span = profile("month_delta", inputs);
     let start_dates = &inputs[0];
     let end_dates = &inputs[1];
     impl_month_delta(start_dates, end_dates)
@@ -56,6 +281,7 @@ fn month_delta(inputs: &[Series]) -> PolarsResult<Series> {
 
 #[polars_expr(output_type_func=to_local_datetime_output)]
 fn to_local_datetime(inputs: &[Series]) -> PolarsResult<Series> {
+    let _span = profile("to_local_datetime", inputs);
     let s1 = &inputs[0];
     let ca = s1.datetime()?;
     let s2 = &inputs[1].str()?;
@@ -64,22 +290,203 @@ fn to_local_datetime(inputs: &[Series]) -> PolarsResult<Series> {
 
 #[polars_expr(output_type_func_with_kwargs=from_local_datetime_output)]
 fn from_local_datetime(inputs: &[Series], kwargs: FromLocalDatetimeKwargs) -> PolarsResult<Series> {
+    let _span = profile("from_local_datetime", inputs);
     let s1 = &inputs[0];
     let ca = s1.datetime().unwrap();
     let s2 = &inputs[1].str().unwrap();
-    Ok(elementwise_from_local_datetime(ca, s2, &kwargs.to_tz, &kwargs.ambiguous)?.into_series())
+    let ambiguous = &inputs[2].str().unwrap();
+    Ok(elementwise_from_local_datetime(
+        ca,
+        s2,
+        ambiguous,
+        &kwargs.to_tz,
+        &kwargs.non_existent,
+        kwargs.dedupe,
+    )?
+    .into_series())
+}
+
+#[polars_expr(output_type_func=local_truncate_output)]
+fn local_truncate(inputs: &[Series], kwargs: LocalTruncateKwargs) -> PolarsResult<Series> {
+    let _span = profile("local_truncate", inputs);
+    let ca = inputs[0].datetime()?;
+    let tz = inputs[1].str()?;
+    Ok(elementwise_local_truncate(ca, tz, &kwargs.every, false)?.into_series())
+}
+
+#[polars_expr(output_type_func=local_truncate_output)]
+fn local_ceil(inputs: &[Series], kwargs: LocalTruncateKwargs) -> PolarsResult<Series> {
+    let _span = profile("local_ceil", inputs);
+    let ca = inputs[0].datetime()?;
+    let tz = inputs[1].str()?;
+    Ok(elementwise_local_truncate(ca, tz, &kwargs.every, true)?.into_series())
+}
+
+#[polars_expr(output_type_func=ceil_output)]
+fn ceil(inputs: &[Series], kwargs: CeilKwargs) -> PolarsResult<Series> {
+    let _span = profile("ceil", inputs);
+    impl_ceil(&inputs[0], &kwargs.every)
+}
+
+#[polars_expr(output_type_func_with_kwargs=local_fields_output)]
+fn local_fields(inputs: &[Series], kwargs: LocalFieldsKwargs) -> PolarsResult<Series> {
+    let _span = profile("local_fields", inputs);
+    let ca = inputs[0].datetime()?;
+    let tz = inputs[1].str()?;
+    Ok(impl_local_fields(ca, tz, &kwargs.fields)?.into_series())
 }
 
 #[polars_expr(output_type=String)]
 fn format_localized(inputs: &[Series], kwargs: FormatLocalizedKwargs) -> PolarsResult<Series> {
+    let _span = profile("format_localized", inputs);
     let s = &inputs[0];
     let locale = kwargs.locale;
     let format = kwargs.format;
-    impl_format_localized(s, &format, &locale)
+    impl_format_localized(s, &format, &locale, kwargs.dedupe)
+}
+
+#[polars_expr(output_type_func_with_kwargs=format_localized_many_output)]
+fn format_localized_many(
+    inputs: &[Series],
+    kwargs: FormatLocalizedManyKwargs,
+) -> PolarsResult<Series> {
+    let _span = profile("format_localized_many", inputs);
+    Ok(impl_format_localized_many(&inputs[0], &kwargs.formats, kwargs.dedupe)?.into_series())
+}
+
+#[polars_expr(output_type_func_with_kwargs=parse_localized_output)]
+fn parse_localized(inputs: &[Series], kwargs: ParseLocalizedKwargs) -> PolarsResult<Series> {
+    let _span = profile("parse_localized", inputs);
+    impl_parse_localized(
+        &inputs[0],
+        &kwargs.format,
+        &kwargs.locale,
+        &kwargs.time_unit,
+        kwargs.strict,
+    )
+}
+
+#[polars_expr(output_type_func=fiscal_period_output)]
+fn fiscal_period(inputs: &[Series], kwargs: FiscalPeriodKwargs) -> PolarsResult<Series> {
+    let _span = profile("fiscal_period", inputs);
+    impl_fiscal_period(
+        &inputs[0],
+        kwargs.start_month,
+        &kwargs.scheme,
+        kwargs.week_start,
+        &kwargs.anchor,
+    )
+}
+
+#[polars_expr(output_type=Boolean)]
+fn is_workday(inputs: &[Series], kwargs: IsWorkdayKwargs) -> PolarsResult<Series> {
+    let _span = profile("is_workday", inputs);
+    let s = &inputs[0];
+    impl_is_workday(s, &kwargs.weekmask, &kwargs.holidays)
+}
+
+#[polars_expr(output_type=Int32)]
+fn business_day_ordinal(
+    inputs: &[Series],
+    kwargs: BusinessDayOrdinalKwargs,
+) -> PolarsResult<Series> {
+    let _span = profile("business_day_ordinal", inputs);
+    impl_business_day_ordinal(
+        &inputs[0],
+        &kwargs.weekmask,
+        &kwargs.holidays,
+        &kwargs.roll,
+        kwargs.every,
+    )
+}
+
+#[polars_expr(output_type_func_with_kwargs=rolling_business_output)]
+fn rolling_business(inputs: &[Series], kwargs: RollingBusinessKwargs) -> PolarsResult<Series> {
+    let _span = profile("rolling_business", inputs);
+    impl_rolling_business(
+        &inputs[0],
+        &inputs[1],
+        kwargs.window,
+        &kwargs.agg,
+        kwargs.min_samples,
+        &kwargs.weekmask,
+        &kwargs.holidays,
+    )
+}
+
+#[polars_expr(output_type_func=business_duration_output)]
+fn business_duration(inputs: &[Series], kwargs: BusinessDurationKwargs) -> PolarsResult<Series> {
+    let _span = profile("business_duration", inputs);
+    impl_business_duration(
+        &inputs[0],
+        &inputs[1],
+        kwargs.open,
+        kwargs.close,
+        &kwargs.weekmask,
+        &kwargs.holidays,
+        kwargs.time_zone.as_deref(),
+    )
+}
+
+#[polars_expr(output_type=Boolean)]
+fn is_in_session(inputs: &[Series], kwargs: SessionKwargs) -> PolarsResult<Series> {
+    let _span = profile("is_in_session", inputs);
+    impl_is_in_session(
+        &inputs[0],
+        &kwargs.sessions,
+        &kwargs.weekmask,
+        &kwargs.holidays,
+        kwargs.time_zone.as_deref(),
+    )
+}
+
+#[polars_expr(output_type_func=local_truncate_output)]
+fn next_session_open(inputs: &[Series], kwargs: SessionKwargs) -> PolarsResult<Series> {
+    let _span = profile("next_session_open", inputs);
+    impl_next_session_boundary(
+        &inputs[0],
+        &kwargs.sessions,
+        &kwargs.weekmask,
+        &kwargs.holidays,
+        kwargs.time_zone.as_deref(),
+        false,
+    )
+}
+
+#[polars_expr(output_type_func=local_truncate_output)]
+fn next_session_close(inputs: &[Series], kwargs: SessionKwargs) -> PolarsResult<Series> {
+    let _span = profile("next_session_close", inputs);
+    impl_next_session_boundary(
+        &inputs[0],
+        &kwargs.sessions,
+        &kwargs.weekmask,
+        &kwargs.holidays,
+        kwargs.time_zone.as_deref(),
+        true,
+    )
+}
+
+#[polars_expr(output_type=Date)]
+fn nth_weekday_of_month(
+    inputs: &[Series],
+    kwargs: NthWeekdayOfMonthKwargs,
+) -> PolarsResult<Series> {
+    let _span = profile("nth_weekday_of_month", inputs);
+    impl_nth_weekday_of_month(&inputs[0], kwargs.weekday, kwargs.n)
+}
+
+#[polars_expr(output_type=Date)]
+fn nth_business_day_of_month(
+    inputs: &[Series],
+    kwargs: NthBusinessDayOfMonthKwargs,
+) -> PolarsResult<Series> {
+    let _span = profile("nth_business_day_of_month", inputs);
+    impl_nth_business_day_of_month(&inputs[0], kwargs.n, &kwargs.weekmask, &kwargs.holidays)
 }
 
 #[polars_expr(output_type=Float64)]
 fn to_julian_date(inputs: &[Series]) -> PolarsResult<Series> {
+    let _span = profile("to_julian_date", inputs);
     let s = &inputs[0];
     impl_to_julian_date(s)
 }
@@ -94,6 +501,7 @@ fn idx_dtype(input_fields: &[Field]) -> PolarsResult<Field> {
 
 #[polars_expr(output_type_func=idx_dtype)]
 fn arg_previous_greater(inputs: &[Series]) -> PolarsResult<Series> {
+    let _span = profile("arg_previous_greater", inputs);
     let ser = &inputs[0];
     match ser.dtype() {
         DataType::Int64 => Ok(impl_arg_previous_greater(ser.i64().unwrap()).into_series()),
@@ -105,3 +513,24 @@ fn arg_previous_greater(inputs: &[Series]) -> PolarsResult<Series> {
         dt => polars_bail!(ComputeError:"Expected numeric data type, got: {}", dt),
     }
 }
+
+#[polars_expr(output_type_func_with_kwargs=previous_greater_fields_output)]
+fn previous_greater_fields(
+    inputs: &[Series],
+    kwargs: PreviousGreaterFieldsKwargs,
+) -> PolarsResult<Series> {
+    let _span = profile("previous_greater_fields", inputs);
+    let ser = &inputs[0];
+    let by = inputs.get(1);
+    let fields = &kwargs.fields;
+    let out = match ser.dtype() {
+        DataType::Int64 => impl_previous_greater_fields(ser.i64().unwrap(), by, fields),
+        DataType::Int32 => impl_previous_greater_fields(ser.i32().unwrap(), by, fields),
+        DataType::UInt64 => impl_previous_greater_fields(ser.u64().unwrap(), by, fields),
+        DataType::UInt32 => impl_previous_greater_fields(ser.u32().unwrap(), by, fields),
+        DataType::Float64 => impl_previous_greater_fields(ser.f64().unwrap(), by, fields),
+        DataType::Float32 => impl_previous_greater_fields(ser.f32().unwrap(), by, fields),
+        dt => polars_bail!(ComputeError:"Expected numeric data type, got: {}", dt),
+    };
+    Ok(out?.into_series())
+}
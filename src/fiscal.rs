@@ -0,0 +1,217 @@
+use polars::prelude::*;
+use std::str::FromStr;
+
+use crate::business_days::to_local_days;
+use crate::civil::{civil_from_days, days_from_civil, weekday};
+
+/// How a fiscal year is split into periods.
+#[derive(Clone, Copy)]
+enum FiscalScheme {
+    /// Periods are calendar months.
+    Month,
+    /// 52-53 week year, with each quarter's 13 weeks split into periods of
+    /// these many weeks. The 53rd week, if any, belongs to the last period.
+    Weeks([i32; 3]),
+}
+
+impl FromStr for FiscalScheme {
+    type Err = PolarsError;
+
+    fn from_str(s: &str) -> Result<Self, Self::Err> {
+        match s {
+            "month" => Ok(FiscalScheme::Month),
+            "445" => Ok(FiscalScheme::Weeks([4, 4, 5])),
+            "454" => Ok(FiscalScheme::Weeks([4, 5, 4])),
+            "544" => Ok(FiscalScheme::Weeks([5, 4, 4])),
+            s => polars_bail!(InvalidOperation:
+                "Invalid scheme {}, expected one of: \"month\", \"445\", \"454\", \"544\"", s
+            ),
+        }
+    }
+}
+
+struct FiscalCalendar {
+    start_month: u32,
+    scheme: FiscalScheme,
+    /// Day of the week weeks start on, from 0 (Monday) to 6 (Sunday).
+    week_start: usize,
+    /// Whether 52-53 week years start on the `week_start` day nearest to the
+    /// first of `start_month` (rather than the last one on or before it).
+    nearest: bool,
+}
+
+impl FiscalCalendar {
+    /// First day of fiscal year `fiscal_year`, which ends in that calendar year.
+    fn year_start(&self, fiscal_year: i32) -> i32 {
+        let start_year = if self.start_month == 1 {
+            fiscal_year
+        } else {
+            fiscal_year - 1
+        };
+        let anchor = days_from_civil(start_year, self.start_month, 1);
+        match self.scheme {
+            FiscalScheme::Month => anchor,
+            FiscalScheme::Weeks(_) => {
+                let back = ((weekday(anchor) + 7 - self.week_start) % 7) as i32;
+                if self.nearest && back > 3 {
+                    anchor - back + 7
+                } else {
+                    anchor - back
+                }
+            }
+        }
+    }
+
+    /// Fiscal year which the calendar date falls in, if the fiscal year
+    /// started on the first of `start_month`.
+    fn month_fiscal_year(&self, year: i32, month: u32) -> i32 {
+        if self.start_month != 1 && month >= self.start_month {
+            year + 1
+        } else {
+            year
+        }
+    }
+}
+
+/// Start of each fiscal year in a range, computed once per call.
+struct YearStarts {
+    first_fiscal_year: i32,
+    starts: Vec<i32>,
+}
+
+impl YearStarts {
+    /// Year starts for every fiscal year that dates from `min_days` to
+    /// `max_days` can fall in (plus the year after, which bounds the last one).
+    fn new(calendar: &FiscalCalendar, min_days: i32, max_days: i32) -> Self {
+        let fiscal_year = |days| {
+            let (year, month, _) = civil_from_days(days);
+            calendar.month_fiscal_year(year, month)
+        };
+        // 52-53 week years start at most a few days away from the first of
+        // the month, so one year either side is enough.
+        let first_fiscal_year = fiscal_year(min_days) - 1;
+        let last_fiscal_year = fiscal_year(max_days) + 2;
+        Self {
+            first_fiscal_year,
+            starts: (first_fiscal_year..=last_fiscal_year)
+                .map(|fiscal_year| calendar.year_start(fiscal_year))
+                .collect(),
+        }
+    }
+
+    /// Fiscal year of `days`, and the day it started.
+    #[inline]
+    fn find(&self, calendar: &FiscalCalendar, days: i32) -> (i32, i32) {
+        let (year, month, _) = civil_from_days(days);
+        let mut i = (calendar.month_fiscal_year(year, month) - self.first_fiscal_year) as usize;
+        if days < self.starts[i] {
+            i -= 1;
+        } else if days >= self.starts[i + 1] {
+            i += 1;
+        }
+        (self.first_fiscal_year + i as i32, self.starts[i])
+    }
+}
+
+pub(crate) fn fiscal_period_fields() -> Vec<Field> {
+    vec![
+        Field::new("fiscal_year".into(), DataType::Int32),
+        Field::new("fiscal_quarter".into(), DataType::Int8),
+        Field::new("fiscal_period".into(), DataType::Int8),
+        Field::new("fiscal_week".into(), DataType::Int8),
+    ]
+}
+
+/// Fiscal year, quarter, period and week of each date or datetime in `s`.
+///
+/// Fields are derived arithmetically from each row's local date, with the
+/// start of each fiscal year in the input's range computed up front.
+pub(crate) fn impl_fiscal_period(
+    s: &Series,
+    start_month: u32,
+    scheme: &str,
+    week_start: usize,
+    anchor: &str,
+) -> PolarsResult<Series> {
+    polars_ensure!(
+        (1..=12).contains(&start_month),
+        InvalidOperation: "`start_month` must be between 1 and 12, got {}", start_month
+    );
+    polars_ensure!(
+        week_start < 7,
+        InvalidOperation: "`week_start` must be between 0 and 6, got {}", week_start
+    );
+    let nearest = match anchor {
+        "nearest" => true,
+        "last" => false,
+        _ => polars_bail!(InvalidOperation:
+            "Invalid anchor {}, expected one of: \"nearest\", \"last\"", anchor
+        ),
+    };
+    let calendar = FiscalCalendar {
+        start_month,
+        scheme: FiscalScheme::from_str(scheme)?,
+        week_start,
+        nearest,
+    };
+
+    let days = to_local_days(s)?;
+    let len = days.len();
+    let mut fiscal_year = PrimitiveChunkedBuilder::<Int32Type>::new("fiscal_year".into(), len);
+    let mut fiscal_quarter = PrimitiveChunkedBuilder::<Int8Type>::new("fiscal_quarter".into(), len);
+    let mut fiscal_period = PrimitiveChunkedBuilder::<Int8Type>::new("fiscal_period".into(), len);
+    let mut fiscal_week = PrimitiveChunkedBuilder::<Int8Type>::new("fiscal_week".into(), len);
+
+    if let (Some(min_days), Some(max_days)) = (days.min(), days.max()) {
+        let year_starts = YearStarts::new(&calendar, min_days, max_days);
+        for day in days.iter() {
+            let Some(day) = day else {
+                fiscal_year.append_null();
+                fiscal_quarter.append_null();
+                fiscal_period.append_null();
+                fiscal_week.append_null();
+                continue;
+            };
+            let (year, start) = year_starts.find(&calendar, day);
+            let week = (day - start) / 7;
+            let (quarter, period) = match calendar.scheme {
+                FiscalScheme::Month => {
+                    let (_, month, _) = civil_from_days(day);
+                    let period = (month as i32 - start_month as i32).rem_euclid(12);
+                    (period / 3, period)
+                }
+                FiscalScheme::Weeks(weeks) => {
+                    let quarter = (week / 13).min(3);
+                    let week_of_quarter = week - 13 * quarter;
+                    let period_of_quarter = if week_of_quarter < weeks[0] {
+                        0
+                    } else if week_of_quarter < weeks[0] + weeks[1] {
+                        1
+                    } else {
+                        2
+                    };
+                    (quarter, 3 * quarter + period_of_quarter)
+                }
+            };
+            fiscal_year.append_value(year);
+            fiscal_quarter.append_value((quarter + 1) as i8);
+            fiscal_period.append_value((period + 1) as i8);
+            fiscal_week.append_value((week + 1) as i8);
+        }
+    } else {
+        for _ in 0..len {
+            fiscal_year.append_null();
+            fiscal_quarter.append_null();
+            fiscal_period.append_null();
+            fiscal_week.append_null();
+        }
+    }
+
+    let columns = [
+        fiscal_year.finish().into_series(),
+        fiscal_quarter.finish().into_series(),
+        fiscal_period.finish().into_series(),
+        fiscal_week.finish().into_series(),
+    ];
+    Ok(StructChunked::from_series(s.name().clone(), len, columns.iter())?.into_series())
+}
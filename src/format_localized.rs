@@ -1,16 +1,16 @@
-use chrono::format::StrftimeItems;
+use chrono::format::{Item, StrftimeItems};
 use chrono::TimeZone;
 use chrono::{self, format::DelayedFormat};
 use polars::prelude::*;
-use polars_arrow::array::MutablePlString;
-use polars_arrow::temporal_conversions::MILLISECONDS_IN_DAY;
-use polars_arrow::temporal_conversions::{
-    timestamp_ms_to_datetime, timestamp_ns_to_datetime, timestamp_us_to_datetime,
-};
+use polars_arrow::array::{MutablePlString, PrimitiveArray, Utf8ViewArray};
+use polars_arrow::types::NativeType;
 use std::fmt::Write;
 use std::str::FromStr;
 
-fn format_ndt(
+use crate::civil::{datetime_decoder, days_to_datetime};
+use crate::utils::{maybe_dedupe_apply, maybe_dedupe_apply_many, par_apply, par_apply_many};
+
+pub(crate) fn format_ndt(
     ndt: chrono::NaiveDateTime,
     format: &str,
     locale: chrono::prelude::Locale,
@@ -20,71 +20,216 @@ fn format_ndt(
     dt.format_localized(format, locale)
 }
 
+fn parse_locale(locale: &str) -> PolarsResult<chrono::Locale> {
+    chrono::Locale::try_from(locale).map_err(
+        |_| polars_err!(ComputeError: format!("given locale {} could not be parsed", locale)),
+    )
+}
+
+/// Format each value of `ca` with `format_value`, keeping its validity.
+///
+/// Null slots get an empty string, so that the input's validity can be reused
+/// as is, rather than rebuilt element by element.
+fn format_chunks<T>(
+    ca: &ChunkedArray<T>,
+    mut format_value: impl FnMut(T::Native, &mut String) -> PolarsResult<()>,
+) -> PolarsResult<StringChunked>
+where
+    T: PolarsNumericType,
+{
+    let mut buf = String::new();
+    let chunks = ca
+        .downcast_iter()
+        .map(|arr| {
+            let mut out = MutablePlString::with_capacity(arr.len());
+            format_values_many(arr, std::slice::from_mut(&mut out), |value, outs| {
+                buf.clear();
+                format_value(value, &mut buf)?;
+                outs[0].push_value(&buf);
+                Ok(())
+            })?;
+            Ok(out.freeze().with_validity(arr.validity().cloned()))
+        })
+        .collect::<PolarsResult<Vec<Utf8ViewArray>>>()?;
+    Ok(StringChunked::from_chunk_iter(ca.name().clone(), chunks))
+}
+
+/// Call `format_value` with each non-null value of `arr`, which pushes one
+/// result to each of `outs`, and push an empty string to each for null slots.
+///
+/// Arrays without nulls go through a tight loop over their values.
+fn format_values_many<T: NativeType>(
+    arr: &PrimitiveArray<T>,
+    outs: &mut [MutablePlString],
+    mut format_value: impl FnMut(T, &mut [MutablePlString]) -> PolarsResult<()>,
+) -> PolarsResult<()> {
+    match arr.validity().filter(|validity| validity.unset_bits() > 0) {
+        None => {
+            for &value in arr.values().iter() {
+                format_value(value, outs)?;
+            }
+        }
+        Some(validity) => {
+            for (&value, is_valid) in arr.values().iter().zip(validity.iter()) {
+                if is_valid {
+                    format_value(value, outs)?;
+                } else {
+                    for out in outs.iter_mut() {
+                        out.push_value("");
+                    }
+                }
+            }
+        }
+    }
+    Ok(())
+}
+
+/// A format string, parsed once up front, and the locale to format in.
+struct ParsedFormat {
+    items: Vec<Item<'static>>,
+    locale: chrono::Locale,
+}
+
+impl ParsedFormat {
+    fn new(format: &str, locale: &str) -> PolarsResult<Self> {
+        let locale = parse_locale(locale)?;
+        let items = StrftimeItems::new_with_locale(format, locale)
+            .parse_to_owned()
+            .map_err(|_| polars_err!(ComputeError: "invalid format string {}", format))?;
+        Ok(Self { items, locale })
+    }
+}
+
+/// Format each value of `ca` with each of `formats`, converting it to a
+/// datetime in `tz` only once.
+fn format_chunks_many<T>(
+    ca: &ChunkedArray<T>,
+    formats: &[ParsedFormat],
+    to_datetime: impl Fn(T::Native) -> PolarsResult<chrono::NaiveDateTime>,
+    tz: chrono_tz::Tz,
+) -> PolarsResult<Vec<StringChunked>>
+where
+    T: PolarsNumericType,
+{
+    let mut chunks: Vec<Vec<Utf8ViewArray>> = formats.iter().map(|_| vec![]).collect();
+    let mut buf = String::new();
+    for arr in ca.downcast_iter() {
+        let mut outs: Vec<MutablePlString> = formats
+            .iter()
+            .map(|_| MutablePlString::with_capacity(arr.len()))
+            .collect();
+        format_values_many(arr, &mut outs, |value, outs| {
+            let dt = tz.from_utc_datetime(&to_datetime(value)?);
+            for (format, out) in formats.iter().zip(outs.iter_mut()) {
+                buf.clear();
+                let fmted = dt.format_localized_with_items(format.items.iter(), format.locale);
+                write!(buf, "{fmted}").unwrap();
+                out.push_value(&buf);
+            }
+            Ok(())
+        })?;
+        for (chunks, out) in chunks.iter_mut().zip(outs) {
+            chunks.push(out.freeze().with_validity(arr.validity().cloned()));
+        }
+    }
+    Ok(chunks
+        .into_iter()
+        .map(|chunks| StringChunked::from_chunk_iter(ca.name().clone(), chunks))
+        .collect())
+}
+
 pub(crate) fn impl_format_localized(
     s: &Series,
     format: &str,
     locale: &str,
+    dedupe: Option<bool>,
 ) -> PolarsResult<Series> {
-    let locale = chrono::Locale::try_from(locale).map_err(
-        |_| polars_err!(ComputeError: format!("given locale {} could not be parsed", locale)),
-    )?;
+    let locale = parse_locale(locale)?;
 
     let ca: StringChunked = match s.dtype() {
         DataType::Date => {
             let ca = s.date()?;
-            ca.phys.apply_kernel_cast(&|arr| {
-                let mut buf = String::new();
-                let mut mutarr = MutablePlString::with_capacity(arr.len());
-
-                for opt in arr.into_iter() {
-                    match opt {
-                        None => mutarr.push_null(),
-                        Some(timestamp) => {
-                            buf.clear();
-                            let ndt =
-                                timestamp_ms_to_datetime((*timestamp as i64) * MILLISECONDS_IN_DAY);
-                            let fmted = format_ndt(ndt, format, locale, chrono_tz::UTC);
-                            write!(buf, "{fmted}").unwrap();
-                            mutarr.push(Some(&buf))
-                        }
-                    }
-                }
-
-                mutarr.freeze().boxed()
-            })
+            maybe_dedupe_apply(&ca.phys, dedupe, |days| {
+                par_apply(days, |days| {
+                    format_chunks(days, |days, buf| {
+                        let ndt = days_to_datetime(days)?;
+                        let fmted = format_ndt(ndt, format, locale, chrono_tz::UTC);
+                        write!(buf, "{fmted}").unwrap();
+                        Ok(())
+                    })
+                })
+            })?
         }
         DataType::Datetime(time_unit, time_zone) => {
             let ca = s.datetime()?;
-            let timestamp_to_datetime = match time_unit {
-                TimeUnit::Nanoseconds => timestamp_ns_to_datetime,
-                TimeUnit::Microseconds => timestamp_us_to_datetime,
-                TimeUnit::Milliseconds => timestamp_ms_to_datetime,
-            };
+            let timestamp_to_datetime = datetime_decoder(*time_unit);
             let tz = match time_zone {
                 None => chrono_tz::UTC,
                 Some(tz) => chrono_tz::Tz::from_str(tz).unwrap(),
             };
-            ca.phys.apply_kernel_cast(&|arr| {
-                let mut buf = String::new();
-                let mut mutarr = MutablePlString::with_capacity(arr.len());
-
-                for opt in arr.into_iter() {
-                    match opt {
-                        None => mutarr.push_null(),
-                        Some(timestamp) => {
-                            buf.clear();
-                            let ndt = timestamp_to_datetime(*timestamp);
-                            let fmted = format_ndt(ndt, format, locale, tz);
-                            write!(buf, "{fmted}").unwrap();
-                            mutarr.push(Some(&buf))
-                        }
-                    }
-                }
-
-                mutarr.freeze().boxed()
-            })
+            maybe_dedupe_apply(&ca.phys, dedupe, |timestamps| {
+                par_apply(timestamps, |timestamps| {
+                    format_chunks(timestamps, |timestamp, buf| {
+                        let ndt = timestamp_to_datetime(timestamp)?;
+                        let fmted = format_ndt(ndt, format, locale, tz);
+                        write!(buf, "{fmted}").unwrap();
+                        Ok(())
+                    })
+                })
+            })?
         }
         _ => unreachable!(),
     };
     Ok(ca.into_series())
 }
+
+/// Format `s` with each of `formats`, given as `[name, format, locale]`, into
+/// a Struct with one String field per format.
+///
+/// Each value is decoded, and converted to its time zone, once for all the
+/// formats, rather than once per format.
+pub(crate) fn impl_format_localized_many(
+    s: &Series,
+    formats: &[[String; 3]],
+    dedupe: Option<bool>,
+) -> PolarsResult<StructChunked> {
+    polars_ensure!(
+        !formats.is_empty(),
+        InvalidOperation: "`format` must contain at least one format"
+    );
+    let parsed = formats
+        .iter()
+        .map(|[_, format, locale]| ParsedFormat::new(format, locale))
+        .collect::<PolarsResult<Vec<_>>>()?;
+
+    let columns = match s.dtype() {
+        DataType::Date => {
+            let ca = s.date()?;
+            maybe_dedupe_apply_many(&ca.phys, dedupe, |days| {
+                par_apply_many(days, |days| {
+                    format_chunks_many(days, &parsed, days_to_datetime, chrono_tz::UTC)
+                })
+            })?
+        }
+        DataType::Datetime(time_unit, time_zone) => {
+            let ca = s.datetime()?;
+            let timestamp_to_datetime = datetime_decoder(*time_unit);
+            let tz = match time_zone {
+                None => chrono_tz::UTC,
+                Some(tz) => chrono_tz::Tz::from_str(tz).unwrap(),
+            };
+            maybe_dedupe_apply_many(&ca.phys, dedupe, |timestamps| {
+                par_apply_many(timestamps, |timestamps| {
+                    format_chunks_many(timestamps, &parsed, timestamp_to_datetime, tz)
+                })
+            })?
+        }
+        dtype => polars_bail!(InvalidOperation: "dtype '{}' not supported", dtype),
+    };
+    let columns = columns
+        .into_iter()
+        .zip(formats)
+        .map(|(ca, [name, _, _])| ca.with_name(name.as_str().into()).into_series())
+        .collect::<Vec<_>>();
+    StructChunked::from_series(s.name().clone(), s.len(), columns.iter())
+}
@@ -0,0 +1,206 @@
+//! Holiday calendars generated from declarative rules.
+use polars::prelude::*;
+use pyo3::prelude::*;
+use pyo3_polars::error::PyPolarsErr;
+use pyo3_polars::PySeries;
+use std::str::FromStr;
+
+use crate::civil::{civil_from_days, days_from_civil, weekday};
+use crate::nth_day::nth_weekday_in_month;
+
+/// How a holiday which falls outside of the week's business days is moved.
+#[derive(Clone, Copy)]
+enum Observance {
+    /// Not moved.
+    Actual,
+    /// Moved to the nearest business day of the week, or the earlier one if
+    /// two are as near.
+    Nearest,
+    /// Moved to the next business day of the week which isn't already a
+    /// holiday.
+    Next,
+}
+
+impl FromStr for Observance {
+    type Err = PolarsError;
+
+    fn from_str(s: &str) -> Result<Self, Self::Err> {
+        match s {
+            "actual" => Ok(Observance::Actual),
+            "nearest_weekday" => Ok(Observance::Nearest),
+            "next_weekday" => Ok(Observance::Next),
+            s => polars_bail!(InvalidOperation:
+                "Invalid observed {}, expected one of: \"actual\", \"nearest_weekday\", \"next_weekday\"", s
+            ),
+        }
+    }
+}
+
+enum HolidayDate {
+    Fixed {
+        month: u32,
+        day: u32,
+    },
+    /// `n`-th weekday (from 0 for Monday) of the month, from the end if `n`
+    /// is negative.
+    NthWeekday {
+        month: u32,
+        weekday: usize,
+        n: i32,
+    },
+    /// Days after Easter Sunday.
+    Easter {
+        offset: i32,
+    },
+}
+
+struct HolidayRule {
+    date: HolidayDate,
+    observance: Observance,
+}
+
+/// Days since the Unix epoch of Easter Sunday in `year`, in the Gregorian calendar.
+fn easter(year: i32) -> i32 {
+    // Anonymous Gregorian algorithm (Meeus/Jones/Butcher).
+    let a = year.rem_euclid(19);
+    let (b, c) = (year.div_euclid(100), year.rem_euclid(100));
+    let (d, e) = (b / 4, b % 4);
+    let f = (b + 8) / 25;
+    let g = (b - f + 1) / 3;
+    let h = (19 * a + b - d - g + 15) % 30;
+    let (i, k) = (c / 4, c % 4);
+    let l = (32 + 2 * e + 2 * i - h - k) % 7;
+    let m = (a + 11 * h + 22 * l) / 451;
+    let month = (h + l - 7 * m + 114) / 31;
+    let day = (h + l - 7 * m + 114) % 31 + 1;
+    days_from_civil(year, month as u32, day as u32)
+}
+
+impl HolidayRule {
+    fn new(kind: &str, month: u32, value: i32, n: i32, observed: &str) -> PolarsResult<Self> {
+        let date = match kind {
+            "fixed" => {
+                polars_ensure!(
+                    (1..=12).contains(&month) && (1..=31).contains(&value),
+                    InvalidOperation: "invalid fixed holiday: month {}, day {}", month, value
+                );
+                HolidayDate::Fixed {
+                    month,
+                    day: value as u32,
+                }
+            }
+            "nth_weekday" => {
+                polars_ensure!(
+                    (1..=12).contains(&month) && (0..7).contains(&value) && n != 0,
+                    InvalidOperation: "invalid nth weekday holiday: month {}, weekday {}, n {}", month, value, n
+                );
+                HolidayDate::NthWeekday {
+                    month,
+                    weekday: value as usize,
+                    n,
+                }
+            }
+            "easter" => HolidayDate::Easter { offset: value },
+            kind => polars_bail!(InvalidOperation: "Invalid holiday rule kind {}", kind),
+        };
+        Ok(Self {
+            date,
+            observance: Observance::from_str(observed)?,
+        })
+    }
+
+    /// The holiday in `year`, before any observance shift, if there is one.
+    fn date(&self, year: i32) -> Option<i32> {
+        match self.date {
+            HolidayDate::Fixed { month, day } => {
+                let days = days_from_civil(year, month, day);
+                // Skip dates which don't exist in this year, such as 29 February.
+                (civil_from_days(days) == (year, month, day)).then_some(days)
+            }
+            HolidayDate::NthWeekday { month, weekday, n } => {
+                nth_weekday_in_month(year, month, weekday, n)
+            }
+            HolidayDate::Easter { offset } => Some(easter(year) + offset),
+        }
+    }
+
+    /// Move `days` according to the rule's observance, skipping days which
+    /// are `taken` by other holidays.
+    fn observe(&self, days: i32, weekmask: &[bool; 7], taken: impl Fn(i32) -> bool) -> i32 {
+        let is_business_day = |days: i32| weekmask[weekday(days)];
+        // Without any business days in the week, there's nowhere to move to.
+        if is_business_day(days) || !weekmask.contains(&true) {
+            return days;
+        }
+        match self.observance {
+            Observance::Actual => days,
+            Observance::Nearest => (1..7)
+                .flat_map(|k| [days - k, days + k])
+                .find(|&days| is_business_day(days))
+                .unwrap_or(days),
+            Observance::Next => (days + 1..)
+                .find(|&days| is_business_day(days) && !taken(days))
+                .unwrap(),
+        }
+    }
+}
+
+fn build_holidays(
+    rules: &[HolidayRule],
+    start_year: i32,
+    end_year: i32,
+    weekmask: &[bool; 7],
+) -> Vec<i32> {
+    let mut holidays =
+        Vec::with_capacity(rules.len() * (end_year - start_year + 1).max(0) as usize);
+    let mut actual = Vec::with_capacity(rules.len());
+    let mut observed = Vec::with_capacity(rules.len());
+    for year in start_year..=end_year {
+        actual.clear();
+        actual.extend(rules.iter().map(|rule| rule.date(year)));
+        observed.clear();
+        for (rule, days) in rules.iter().zip(&actual) {
+            if let Some(days) = *days {
+                // Don't move onto another holiday, whether it's been moved
+                // there or falls there.
+                let taken = |days| observed.contains(&days) || actual.contains(&Some(days));
+                let days = rule.observe(days, weekmask, taken);
+                observed.push(days);
+            }
+        }
+        holidays.extend_from_slice(&observed);
+    }
+    holidays.sort_unstable();
+    holidays.dedup();
+    holidays
+}
+
+/// Holidays from `start_year` to `end_year` (inclusive), as a sorted,
+/// deduplicated Date series.
+///
+/// Each rule is `(kind, month, value, n, observed)`, where `value` is the day
+/// of the month for "fixed" rules, the weekday (from 0 for Monday) for
+/// "nth_weekday" rules, and the offset in days for "easter" rules.
+/// "next_weekday" observance skips the year's other holidays, both where they
+/// fall and where earlier rules moved them to.
+#[pyfunction]
+pub fn generate_holidays(
+    rules: Vec<(String, u32, i32, i32, String)>,
+    start_year: i32,
+    end_year: i32,
+    weekmask: [bool; 7],
+) -> PyResult<PySeries> {
+    let rules = rules
+        .iter()
+        .map(|(kind, month, value, n, observed)| {
+            HolidayRule::new(kind, *month, *value, *n, observed)
+        })
+        .collect::<PolarsResult<Vec<_>>>()
+        .map_err(PyPolarsErr::from)?;
+    let holidays = build_holidays(&rules, start_year, end_year, &weekmask);
+    Ok(PySeries(
+        Int32Chunked::from_vec("holidays".into(), holidays)
+            .into_date()
+            .into_series(),
+    ))
+}
@@ -1,18 +1,34 @@
 mod arg_previous_greater;
+mod business_days;
+mod calendar_table;
+mod civil;
 mod expressions;
+mod fiscal;
 mod format_localized;
+mod holidays;
 mod month_delta;
+mod nth_day;
+mod parse_localized;
+mod profiling;
+mod rolling_business;
+mod sessions;
 mod timezone;
 mod to_julian;
+mod utils;
 
 use pyo3::prelude::*;
-use pyo3_polars::PolarsAllocator;
 
 #[pymodule]
 fn _internal(_py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
+    m.add_function(wrap_pyfunction!(calendar_table::calendar_table, m)?)?;
+    m.add_function(wrap_pyfunction!(holidays::generate_holidays, m)?)?;
+    m.add_function(wrap_pyfunction!(profiling::set_profiling, m)?)?;
+    m.add_function(wrap_pyfunction!(profiling::is_profiling, m)?)?;
+    m.add_function(wrap_pyfunction!(profiling::reset_profiling, m)?)?;
+    m.add_function(wrap_pyfunction!(profiling::profiling_stats, m)?)?;
     Ok(())
 }
 
 #[global_allocator]
-static ALLOC: PolarsAllocator = PolarsAllocator::new();
+static ALLOC: profiling::ProfilingAllocator = profiling::ProfilingAllocator::new();
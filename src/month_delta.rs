@@ -1,50 +1,37 @@
-use chrono::Datelike;
-use chrono::NaiveDate;
+use arity::{binary_elementwise_values, unary_elementwise_values};
 use polars::prelude::*;
 
-const EPOCH_DAYS_FROM_CE: i32 = 719_163;
+use crate::civil::{civil_from_days, days_in_month};
 
-// Copied from https://docs.pola.rs/docs/rust/dev/src/polars_time/windows/duration.rs.html#398
-// `add_month` is a private function.
-fn add_month(ts: NaiveDate, n_months: i64) -> NaiveDate {
-    // Have to define, because it is hidden
-    const DAYS_PER_MONTH: [[i64; 12]; 2] = [
-        //J   F   M   A   M   J   J   A   S   O   N   D
-        [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], // non-leap year
-        [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], // leap year
-    ];
-    let months = n_months;
-
-    // Retrieve the current date and increment the values
-    // based on the number of months
-
-    let mut year = ts.year();
-    let mut month = ts.month() as i32;
-    let mut day = ts.day();
-    year += (months / 12) as i32;
-    month += (months % 12) as i32;
-
-    // if the month overflowed or underflowed, adjust the year
-    // accordingly. Because we add the modulo for the months
-    // the year will only adjust by one
-    if month > 12 {
-        year += 1;
-        month -= 12;
-    } else if month <= 0 {
-        year -= 1;
-        month += 12;
-    }
-
-    // Adding this not to import copy pasta again
-    let leap_year = year % 400 == 0 || (year % 4 == 0 && year % 100 != 0);
-    // Normalize the day if we are past the end of the month.
-    let last_day_of_month = DAYS_PER_MONTH[leap_year as usize][(month - 1) as usize] as u32;
-
-    if day > last_day_of_month {
-        day = last_day_of_month
+/// Whole months from a date to `right`, given whether the date is on or before
+/// `right`, its day of the month, and two values which are the same for every
+/// date in its month:
+///
+/// * `months`: the difference between the calendar months of the date and `right`.
+/// * `last_day`: the last day of the month of `right`.
+///
+/// Moving the date by `months` months lands in the month of `right`, on `left_day`
+/// clamped to `last_day`. Comparing that with the day of `right` says whether
+/// that's one month too many (or too few).
+fn m_diff_from_parts(
+    forwards: bool,
+    left_day: u32,
+    right_day: u32,
+    months: i32,
+    last_day: u32,
+) -> i32 {
+    let day = left_day.min(last_day);
+    if forwards {
+        months - (day > right_day) as i32
+    } else {
+        months + (day < right_day) as i32
     }
+}
 
-    NaiveDate::from_ymd_opt(year, month as u32, day).unwrap()
+/// Difference between the calendar months of `left` and `right`, given as
+/// years and months.
+fn calendar_month_diff(left: (i32, u32), right: (i32, u32)) -> i32 {
+    (right.0 - left.0) * 12 + right.1 as i32 - left.1 as i32
 }
 
 /// Calculates the difference in months between two dates.
@@ -54,8 +41,8 @@ fn add_month(ts: NaiveDate, n_months: i64) -> NaiveDate {
 ///
 /// # Arguments
 ///
-/// * `left`: `NaiveDate` - The start date.
-/// * `right`: `NaiveDate` - The end date.
+/// * `left`: `i32` - The start date, as days since the Unix epoch.
+/// * `right`: `i32` - The end date, as days since the Unix epoch.
 ///
 /// # Returns
 ///
@@ -64,28 +51,60 @@ fn add_month(ts: NaiveDate, n_months: i64) -> NaiveDate {
 /// # Examples
 ///
 /// ```
-/// let start_date = NaiveDate::from_ymd(2023, 1, 1);
-/// let end_date = NaiveDate::from_ymd(2023, 4, 1);
+/// let start_date = days_from_civil(2023, 1, 1);
+/// let end_date = days_from_civil(2023, 4, 1);
 /// assert_eq!(get_m_diff(start_date, end_date), 3);
 /// ```
-fn get_m_diff(left: NaiveDate, right: NaiveDate) -> i32 {
-    let mut n = 0;
-    if right >= left {
-        if right.year() + 1 > left.year() {
-            n = (right.year() - left.year() - 1) * 12;
-        }
-        while add_month(left, (n + 1).into()) <= right {
-            n += 1;
-        }
-    } else {
-        if left.year() + 1 > right.year() {
-            n = -(left.year() - right.year() - 1) * 12;
-        }
-        while add_month(left, (n - 1).into()) >= right {
-            n -= 1;
-        }
-    }
-    n
+fn get_m_diff(left: i32, right: i32) -> i32 {
+    let (left_year, left_month, left_day) = civil_from_days(left);
+    let (right_year, right_month, right_day) = civil_from_days(right);
+    m_diff_from_parts(
+        left <= right,
+        left_day,
+        right_day,
+        calendar_month_diff((left_year, left_month), (right_year, right_month)),
+        days_in_month(right_year, right_month),
+    )
+}
+
+/// Month differences between each of `start_dates` and a fixed end date, `end_days`.
+///
+/// Consecutive start dates in the same month share everything but their day of
+/// the month, which can be read off from the number of days since the start of
+/// the month. So, dates are only decoded when the month changes, which for
+/// sorted input is once per month.
+fn month_delta_to_fixed_end(start_dates: &Int32Chunked, end_days: i32) -> Int32Chunked {
+    let (end_year, end_month, end_day) = civil_from_days(end_days);
+    let last_day = days_in_month(end_year, end_month);
+    // First day of the month (as days since the Unix epoch), first day of the
+    // following month, and calendar month difference to `end_days`.
+    let month_of = |days: i32| {
+        let (year, month, day) = civil_from_days(days);
+        let first_day = days - day as i32 + 1;
+        (
+            first_day,
+            first_day + days_in_month(year, month) as i32,
+            calendar_month_diff((year, month), (end_year, end_month)),
+        )
+    };
+    let mut month: Option<(i32, i32, i32)> = None;
+    // Null slots are computed too, so that the input's validity can be reused
+    // as is rather than rebuilt element by element.
+    let mut out: Int32Chunked = unary_elementwise_values(start_dates, |days: i32| {
+        let (first_day, _, months) = match month {
+            Some(m) if m.0 <= days && days < m.1 => m,
+            _ => {
+                let m = month_of(days);
+                month = Some(m);
+                m
+            }
+        };
+        let day = (days - first_day + 1) as u32;
+        m_diff_from_parts(days <= end_days, day, end_day, months, last_day)
+    });
+    // Later start dates are fewer months away from the end date.
+    out.set_sorted_flag(start_dates.is_sorted_flag().reverse());
+    out
 }
 
 /// Implements the month delta operation for Polars series containing dates.
@@ -128,26 +147,24 @@ pub(crate) fn impl_month_delta(start_dates: &Series, end_dates: &Series) -> Pola
 
     let month_diff: Int32Chunked = match end_dates.len() {
         1 => match unsafe { end_dates.phys.get_unchecked(0) } {
-            Some(end_date_i32) => {
-                let end_date =
-                    NaiveDate::from_num_days_from_ce_opt(EPOCH_DAYS_FROM_CE + end_date_i32)
-                        .unwrap();
-                start_dates
-                    .as_date_iter()
-                    .map(|s_arr| s_arr.map(|start_date| get_m_diff(start_date, end_date)))
-                    .collect()
-            }
-            _ => Int32Chunked::full_null(PlSmallStr::EMPTY, start_dates.len())
+            Some(end_date_i32) => month_delta_to_fixed_end(&start_dates.phys, end_date_i32),
+            _ => Int32Chunked::full_null(PlSmallStr::EMPTY, start_dates.len()),
         },
-        _ => start_dates
-            .as_date_iter()
-            .zip(end_dates.as_date_iter())
-            .map(|(s_arr, e_arr)| {
-                s_arr
-                    .zip(e_arr)
-                    .map(|(start_date, end_date)| get_m_diff(start_date, end_date))
+        len => {
+            let start_dates = match start_dates.len() {
+                1 => start_dates.phys.new_from_index(0, len),
+                start_len => {
+                    polars_ensure!(
+                        start_len == len,
+                        ShapeMismatch: "expected `start_dates` and `end_dates` to be of equal length, got {} and {}", start_len, len
+                    );
+                    start_dates.phys.clone()
+                }
+            };
+            binary_elementwise_values(&start_dates, &end_dates.phys, |start: i32, end: i32| {
+                get_m_diff(start, end)
             })
-            .collect(),
+        }
     };
 
     Ok(month_diff.into_series())
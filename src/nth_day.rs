@@ -0,0 +1,121 @@
+use polars::prelude::*;
+
+use crate::business_days::{to_local_days, BusinessDayCounter};
+use crate::civil::{civil_from_days, days_from_civil, weekday};
+
+/// First day of the month of `days`, and of the month after.
+#[inline]
+fn month_bounds(days: i32) -> (i32, i32) {
+    let (year, month, _) = civil_from_days(days);
+    (
+        days_from_civil(year, month, 1),
+        next_month_start(year, month),
+    )
+}
+
+#[inline]
+fn next_month_start(year: i32, month: u32) -> i32 {
+    if month == 12 {
+        days_from_civil(year + 1, 1, 1)
+    } else {
+        days_from_civil(year, month + 1, 1)
+    }
+}
+
+/// The `n`-th `target_weekday` (from 0 for Monday) from `first` up to (but
+/// excluding) `next_first`, counting from the end if `n` is negative.
+#[inline]
+fn nth_weekday(first: i32, next_first: i32, target_weekday: usize, n: i32) -> Option<i32> {
+    let nth = if n > 0 {
+        let first_weekday = first + (target_weekday as i32 - weekday(first) as i32).rem_euclid(7);
+        first_weekday + 7 * (n - 1)
+    } else {
+        let last = next_first - 1;
+        let last_weekday = last - (weekday(last) as i32 - target_weekday as i32).rem_euclid(7);
+        last_weekday + 7 * (n + 1)
+    };
+    (first..next_first).contains(&nth).then_some(nth)
+}
+
+/// The `n`-th `target_weekday` of a month, as in `impl_nth_weekday_of_month`.
+pub(crate) fn nth_weekday_in_month(
+    year: i32,
+    month: u32,
+    target_weekday: usize,
+    n: i32,
+) -> Option<i32> {
+    nth_weekday(
+        days_from_civil(year, month, 1),
+        next_month_start(year, month),
+        target_weekday,
+        n,
+    )
+}
+
+/// The `n`-th `weekday` (from 0 for Monday) of the month of each date in `s`,
+/// counting from the end of the month if `n` is negative.
+///
+/// Months without an `n`-th such weekday give null.
+pub(crate) fn impl_nth_weekday_of_month(
+    s: &Series,
+    target_weekday: usize,
+    n: i32,
+) -> PolarsResult<Series> {
+    polars_ensure!(
+        target_weekday < 7,
+        InvalidOperation: "`weekday` must be between 0 and 6, got {}", target_weekday
+    );
+    polars_ensure!(n != 0, InvalidOperation: "`n` must not be zero");
+    let days = to_local_days(s)?;
+    let out: Int32Chunked = arity::unary_elementwise(&days, |day: Option<i32>| {
+        let (first, next_first) = month_bounds(day?);
+        nth_weekday(first, next_first, target_weekday, n)
+    });
+    Ok(out.into_date().into_series())
+}
+
+/// The `n`-th business day of the month of each date in `s`, counting from
+/// the end of the month if `n` is negative.
+///
+/// The business days before the start and end of the month come from
+/// `BusinessDayCounter`, and the `n`-th one is found by binary search over the
+/// days of the month. Months with fewer than `n` business days give null.
+pub(crate) fn impl_nth_business_day_of_month(
+    s: &Series,
+    n: i32,
+    weekmask: &[bool; 7],
+    holidays: &[i32],
+) -> PolarsResult<Series> {
+    polars_ensure!(n != 0, InvalidOperation: "`n` must not be zero");
+    let counter = BusinessDayCounter::new(weekmask, holidays);
+    let days = to_local_days(s)?;
+    let out: Int32Chunked = arity::unary_elementwise(&days, |day: Option<i32>| {
+        let (first, next_first) = month_bounds(day?);
+        let (before_first, before_next_first) = (
+            counter.count_before(first),
+            counter.count_before(next_first),
+        );
+        // Business days before the one we're after.
+        let target = if n > 0 {
+            before_first + n - 1
+        } else {
+            before_next_first + n
+        };
+        if !(before_first..before_next_first).contains(&target) {
+            return None;
+        }
+        // First day which has more than `target` business days up to and
+        // including it.
+        let (mut low, mut high) = (first, next_first - 1);
+        while low < high {
+            let mid = low + (high - low) / 2;
+            if counter.count_before(mid + 1) > target {
+                high = mid;
+            } else {
+                low = mid + 1;
+            }
+        }
+        Some(low)
+    });
+    Ok(out.into_date().into_series())
+}
@@ -0,0 +1,324 @@
+use chrono::format::{
+    parse_and_remainder, Fixed, Item, ParseErrorKind, ParseResult, Parsed, StrftimeItems,
+};
+use chrono::{Locale, NaiveDate, NaiveDateTime, NaiveTime, Weekday};
+use polars::prelude::*;
+use pyo3_polars::export::polars_core::datatypes::TimeZone as PolarsTimeZone;
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex, OnceLock};
+
+use crate::format_localized::format_ndt;
+use crate::utils::par_apply;
+
+const WEEKDAYS: [Weekday; 7] = [
+    Weekday::Mon,
+    Weekday::Tue,
+    Weekday::Wed,
+    Weekday::Thu,
+    Weekday::Fri,
+    Weekday::Sat,
+    Weekday::Sun,
+];
+
+/// Case-insensitive trie of names, for longest-prefix matching.
+struct NameTrie {
+    // Node 0 is the root.
+    nodes: Vec<TrieNode>,
+}
+
+#[derive(Default)]
+struct TrieNode {
+    children: Vec<(char, usize)>,
+    value: Option<u32>,
+}
+
+impl NameTrie {
+    fn new() -> Self {
+        Self {
+            nodes: vec![TrieNode::default()],
+        }
+    }
+
+    fn insert(&mut self, name: &str, value: u32) {
+        if name.is_empty() {
+            return;
+        }
+        let mut node = 0;
+        for c in name.chars().flat_map(char::to_lowercase) {
+            node = match self.nodes[node].children.iter().find(|(k, _)| *k == c) {
+                Some(&(_, child)) => child,
+                None => {
+                    self.nodes.push(TrieNode::default());
+                    let child = self.nodes.len() - 1;
+                    self.nodes[node].children.push((c, child));
+                    child
+                }
+            };
+        }
+        // If two names collide (e.g. a short and a long form), keep the first.
+        self.nodes[node].value.get_or_insert(value);
+    }
+
+    /// Insert an abbreviated name, which also matches without its trailing
+    /// period (e.g. "Oct" as well as "oct.").
+    fn insert_abbreviation(&mut self, name: &str, value: u32) {
+        self.insert(name, value);
+        if let Some(stripped) = name.strip_suffix('.') {
+            self.insert(stripped, value);
+        }
+    }
+
+    fn is_empty(&self) -> bool {
+        self.nodes.len() == 1
+    }
+
+    /// Longest name which `s` starts with, and its length in bytes in `s`.
+    fn longest_match(&self, s: &str) -> Option<(u32, usize)> {
+        let mut node = 0;
+        let mut best = None;
+        for (i, c) in s.char_indices() {
+            for lower in c.to_lowercase() {
+                match self.nodes[node].children.iter().find(|(k, _)| *k == lower) {
+                    Some(&(_, child)) => node = child,
+                    None => return best,
+                }
+            }
+            if let Some(value) = self.nodes[node].value {
+                best = Some((value, i + c.len_utf8()));
+            }
+        }
+        best
+    }
+}
+
+/// Month, weekday, and AM/PM names of a locale, as written by `format_localized`.
+struct LocaleNames {
+    months: NameTrie,
+    weekdays: NameTrie,
+    am_pm: NameTrie,
+}
+
+impl LocaleNames {
+    fn new(locale: Locale) -> Self {
+        let name = |ndt: NaiveDateTime, format: &str| {
+            format_ndt(ndt, format, locale, chrono_tz::UTC).to_string()
+        };
+        let mut months = NameTrie::new();
+        for month in 1..=12 {
+            let ndt = NaiveDate::from_ymd_opt(2000, month, 1)
+                .unwrap()
+                .and_time(NaiveTime::MIN);
+            months.insert(&name(ndt, "%B"), month);
+            months.insert_abbreviation(&name(ndt, "%b"), month);
+        }
+        let mut weekdays = NameTrie::new();
+        for weekday in 0..7 {
+            // 2000-01-03 was a Monday.
+            let ndt = NaiveDate::from_ymd_opt(2000, 1, 3 + weekday)
+                .unwrap()
+                .and_time(NaiveTime::MIN);
+            weekdays.insert(&name(ndt, "%A"), weekday);
+            weekdays.insert_abbreviation(&name(ndt, "%a"), weekday);
+        }
+        let mut am_pm = NameTrie::new();
+        for (hour, is_pm) in [(1, 0), (13, 1)] {
+            let ndt = NaiveDate::from_ymd_opt(2000, 1, 1)
+                .unwrap()
+                .and_hms_opt(hour, 0, 0)
+                .unwrap();
+            am_pm.insert(&name(ndt, "%p"), is_pm);
+        }
+        Self {
+            months,
+            weekdays,
+            am_pm,
+        }
+    }
+
+    /// Names for `locale`, computed once per process.
+    fn get(locale_name: &str, locale: Locale) -> Arc<Self> {
+        static CACHE: OnceLock<Mutex<HashMap<String, Arc<LocaleNames>>>> = OnceLock::new();
+        let mut cache = CACHE
+            .get_or_init(Default::default)
+            .lock()
+            .unwrap_or_else(|e| e.into_inner());
+        cache
+            .entry(locale_name.to_string())
+            .or_insert_with(|| Arc::new(Self::new(locale)))
+            .clone()
+    }
+}
+
+enum Segment<'a> {
+    /// Items which chrono can parse by itself.
+    Items(Vec<Item<'a>>),
+    Month,
+    Weekday,
+    AmPm,
+}
+
+/// A format string, compiled once and then used to parse every value.
+struct LocalizedFormat<'a> {
+    source: &'a str,
+    segments: Vec<Segment<'a>>,
+    names: Arc<LocaleNames>,
+}
+
+/// Whether `format` contains a UTC offset, in which case values are converted to UTC.
+pub(crate) fn format_has_offset(format: &str) -> bool {
+    StrftimeItems::new(format).any(|item| {
+        matches!(
+            item,
+            Item::Fixed(
+                Fixed::TimezoneOffset
+                    | Fixed::TimezoneOffsetColon
+                    | Fixed::TimezoneOffsetDoubleColon
+                    | Fixed::TimezoneOffsetTripleColon
+                    | Fixed::TimezoneOffsetColonZ
+                    | Fixed::TimezoneOffsetZ
+                    | Fixed::RFC2822
+                    | Fixed::RFC3339
+            )
+        )
+    })
+}
+
+impl<'a> LocalizedFormat<'a> {
+    fn new(format: &'a str, locale_name: &str, locale: Locale) -> PolarsResult<Self> {
+        let items = StrftimeItems::new_with_locale(format, locale)
+            .parse()
+            .map_err(|_| polars_err!(ComputeError: "invalid format string: '{}'", format))?;
+        let names = LocaleNames::get(locale_name, locale);
+        let mut segments = vec![];
+        for item in items {
+            let segment = match item {
+                Item::Fixed(Fixed::ShortMonthName | Fixed::LongMonthName) => Segment::Month,
+                Item::Fixed(Fixed::ShortWeekdayName | Fixed::LongWeekdayName) => Segment::Weekday,
+                Item::Fixed(Fixed::LowerAmPm | Fixed::UpperAmPm) => {
+                    // Some locales (e.g. de_DE) write nothing for `%p`, so it
+                    // can't be read back.
+                    polars_ensure!(
+                        !names.am_pm.is_empty(),
+                        ComputeError: "locale '{}' has no AM/PM names, so format '{}' can't be parsed. \
+                        Use `%H` for the hour instead of `%I` and `%p`.",
+                        locale_name, format
+                    );
+                    Segment::AmPm
+                }
+                item => {
+                    if let Some(Segment::Items(items)) = segments.last_mut() {
+                        items.push(item);
+                        continue;
+                    }
+                    Segment::Items(vec![item])
+                }
+            };
+            segments.push(segment);
+        }
+        Ok(Self {
+            source: format,
+            segments,
+            names,
+        })
+    }
+
+    fn parse(&self, s: &str) -> Option<NaiveDateTime> {
+        let mut parsed = Parsed::new();
+        let mut rest = s;
+        for segment in &self.segments {
+            let (names, set): (&NameTrie, fn(&mut Parsed, u32) -> ParseResult<()>) = match segment {
+                Segment::Items(items) => {
+                    rest = parse_and_remainder(&mut parsed, rest, items.iter()).ok()?;
+                    continue;
+                }
+                Segment::Month => (&self.names.months, |p, v| p.set_month(v as i64)),
+                Segment::Weekday => (&self.names.weekdays, |p, v| {
+                    p.set_weekday(WEEKDAYS[v as usize])
+                }),
+                Segment::AmPm => (&self.names.am_pm, |p, v| p.set_ampm(v == 1)),
+            };
+            let (value, len) = names.longest_match(rest)?;
+            set(&mut parsed, value).ok()?;
+            rest = &rest[len..];
+        }
+        if !rest.is_empty() {
+            return None;
+        }
+        let ndt = match parsed.to_naive_datetime_with_offset(0) {
+            Ok(ndt) => ndt,
+            // Formats without a time of day parse to midnight.
+            Err(e) if e.kind() == ParseErrorKind::NotEnough => {
+                parsed.to_naive_date().ok()?.and_time(NaiveTime::MIN)
+            }
+            Err(_) => return None,
+        };
+        match parsed.offset() {
+            Some(offset) => ndt.checked_sub_signed(chrono::TimeDelta::try_seconds(offset as i64)?),
+            None => Some(ndt),
+        }
+    }
+}
+
+pub(crate) fn parse_time_unit(time_unit: &str) -> PolarsResult<TimeUnit> {
+    match time_unit {
+        "ns" => Ok(TimeUnit::Nanoseconds),
+        "us" => Ok(TimeUnit::Microseconds),
+        "ms" => Ok(TimeUnit::Milliseconds),
+        _ => {
+            polars_bail!(InvalidOperation: "expected time unit 'ns', 'us', or 'ms', got '{}'", time_unit)
+        }
+    }
+}
+
+pub(crate) fn parse_localized_dtype(format: &str, time_unit: &str) -> PolarsResult<DataType> {
+    let time_zone = format_has_offset(format).then_some(PolarsTimeZone::UTC);
+    Ok(DataType::Datetime(parse_time_unit(time_unit)?, time_zone))
+}
+
+/// Parse strings with localized month and weekday names, like those written by
+/// `impl_format_localized`.
+///
+/// The format is compiled once into chrono items, with the locale's names
+/// looked up in tries. Values which don't match the format raise if `strict`,
+/// and become null otherwise.
+pub(crate) fn impl_parse_localized(
+    s: &Series,
+    format: &str,
+    locale: &str,
+    time_unit: &str,
+    strict: bool,
+) -> PolarsResult<Series> {
+    let ca = s.str()?;
+    let locale_name = locale;
+    let locale = chrono::Locale::try_from(locale_name).map_err(
+        |_| polars_err!(ComputeError: format!("given locale {} could not be parsed", locale_name)),
+    )?;
+    let dtype = parse_localized_dtype(format, time_unit)?;
+    let DataType::Datetime(time_unit, time_zone) = dtype else {
+        unreachable!()
+    };
+    let format = LocalizedFormat::new(format, locale_name, locale)?;
+    let to_timestamp: fn(NaiveDateTime) -> Option<i64> = match time_unit {
+        TimeUnit::Nanoseconds => |ndt: NaiveDateTime| ndt.and_utc().timestamp_nanos_opt(),
+        TimeUnit::Microseconds => |ndt: NaiveDateTime| Some(ndt.and_utc().timestamp_micros()),
+        TimeUnit::Milliseconds => |ndt: NaiveDateTime| Some(ndt.and_utc().timestamp_millis()),
+    };
+
+    let out: Int64Chunked = par_apply(ca, |ca| {
+        arity::try_unary_elementwise(ca, |value| {
+            let Some(value) = value else {
+                return Ok(None);
+            };
+            match format.parse(value).and_then(to_timestamp) {
+                Some(timestamp) => Ok(Some(timestamp)),
+                None if strict => polars_bail!(
+                    ComputeError: "could not parse '{}' with format '{}'. \
+                    Pass `strict=False` to set unparseable values to null.",
+                    value, format.source
+                ),
+                None => Ok(None),
+            }
+        })
+    })?;
+    Ok(out.into_datetime(time_unit, time_zone).into_series())
+}
@@ -0,0 +1,174 @@
+//! Opt-in counters for the plugin's kernels.
+//!
+//! Profiling is off unless `POLARS_XDT_PROFILE` is set (to anything other than
+//! "" or "0") when the plugin is first used, or it's switched on with
+//! `set_profiling`. While it's off, a kernel call or an allocation only costs
+//! one relaxed atomic load.
+//!
+//! Allocated bytes are counted by the plugin's global allocator, so they only
+//! include allocations made by the plugin itself, not by the host Polars. The
+//! allocation counter is shared between threads: if several kernels run at
+//! the same time, their allocations are attributed to each of them.
+use std::alloc::{GlobalAlloc, Layout};
+use std::collections::BTreeMap;
+use std::sync::atomic::{AtomicU64, AtomicU8, Ordering};
+use std::sync::Mutex;
+use std::time::Instant;
+
+use polars::prelude::*;
+use pyo3::prelude::*;
+use pyo3_polars::error::PyPolarsErr;
+use pyo3_polars::{PolarsAllocator, PyDataFrame};
+
+// 0: disabled, 1: enabled, anything else: not yet read from the environment.
+static ENABLED: AtomicU8 = AtomicU8::new(u8::MAX);
+static ALLOCATED_BYTES: AtomicU64 = AtomicU64::new(0);
+static COUNTERS: Mutex<BTreeMap<&'static str, Counters>> = Mutex::new(BTreeMap::new());
+
+#[derive(Default)]
+struct Counters {
+    calls: u64,
+    wall_time_ns: u64,
+    rows: u64,
+    chunks: u64,
+    allocated_bytes: u64,
+}
+
+#[inline(always)]
+fn enabled() -> bool {
+    match ENABLED.load(Ordering::Relaxed) {
+        0 => false,
+        1 => true,
+        _ => init_from_env(),
+    }
+}
+
+/// Enable profiling if the `POLARS_XDT_PROFILE` environment variable asks for it.
+///
+/// This is called on first use rather than when the Python module is imported,
+/// as Polars loads the plugin without importing it.
+#[cold]
+fn init_from_env() -> bool {
+    // Reading the environment allocates, which calls back into `enabled`:
+    // disable profiling first so that doesn't recurse.
+    ENABLED.store(0, Ordering::Relaxed);
+    let enabled = std::env::var_os("POLARS_XDT_PROFILE").is_some_and(|v| !v.is_empty() && v != "0");
+    // Keep the setting if `set_profiling` was called in the meantime.
+    let _ = ENABLED.compare_exchange(0, enabled as u8, Ordering::Relaxed, Ordering::Relaxed);
+    ENABLED.load(Ordering::Relaxed) == 1
+}
+
+/// `PolarsAllocator`, which also counts allocated bytes while profiling.
+pub struct ProfilingAllocator(PolarsAllocator);
+
+impl ProfilingAllocator {
+    pub const fn new() -> Self {
+        Self(PolarsAllocator::new())
+    }
+}
+
+impl Default for ProfilingAllocator {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+#[inline(always)]
+fn record_allocation(bytes: usize) {
+    if enabled() {
+        ALLOCATED_BYTES.fetch_add(bytes as u64, Ordering::Relaxed);
+    }
+}
+
+unsafe impl GlobalAlloc for ProfilingAllocator {
+    unsafe fn alloc(&self, layout: Layout) -> *mut u8 {
+        record_allocation(layout.size());
+        self.0.alloc(layout)
+    }
+
+    unsafe fn alloc_zeroed(&self, layout: Layout) -> *mut u8 {
+        record_allocation(layout.size());
+        self.0.alloc_zeroed(layout)
+    }
+
+    unsafe fn dealloc(&self, ptr: *mut u8, layout: Layout) {
+        self.0.dealloc(ptr, layout)
+    }
+
+    unsafe fn realloc(&self, ptr: *mut u8, layout: Layout, new_size: usize) -> *mut u8 {
+        record_allocation(new_size.saturating_sub(layout.size()));
+        self.0.realloc(ptr, layout, new_size)
+    }
+}
+
+/// Measurement of a single kernel call, recorded when dropped.
+pub(crate) struct Span {
+    function: &'static str,
+    start: Instant,
+    allocated_bytes_at_start: u64,
+    rows: u64,
+    chunks: u64,
+}
+
+/// Start measuring a call of `function`, if profiling is enabled.
+///
+/// Rows are those of the longest input; chunks are those of the first input.
+pub(crate) fn profile(function: &'static str, inputs: &[Series]) -> Option<Span> {
+    if !enabled() {
+        return None;
+    }
+    Some(Span {
+        function,
+        start: Instant::now(),
+        allocated_bytes_at_start: ALLOCATED_BYTES.load(Ordering::Relaxed),
+        rows: inputs.iter().map(|s| s.len()).max().unwrap_or(0) as u64,
+        chunks: inputs.first().map_or(0, |s| s.n_chunks()) as u64,
+    })
+}
+
+impl Drop for Span {
+    fn drop(&mut self) {
+        let wall_time_ns = self.start.elapsed().as_nanos() as u64;
+        let allocated_bytes = ALLOCATED_BYTES
+            .load(Ordering::Relaxed)
+            .wrapping_sub(self.allocated_bytes_at_start);
+        let mut counters = COUNTERS.lock().unwrap_or_else(|e| e.into_inner());
+        let counters = counters.entry(self.function).or_default();
+        counters.calls += 1;
+        counters.wall_time_ns += wall_time_ns;
+        counters.rows += self.rows;
+        counters.chunks += self.chunks;
+        counters.allocated_bytes += allocated_bytes;
+    }
+}
+
+#[pyfunction]
+pub fn set_profiling(enabled: bool) {
+    ENABLED.store(enabled as u8, Ordering::Relaxed);
+}
+
+#[pyfunction]
+pub fn is_profiling() -> bool {
+    enabled()
+}
+
+#[pyfunction]
+pub fn reset_profiling() {
+    COUNTERS.lock().unwrap_or_else(|e| e.into_inner()).clear();
+}
+
+#[pyfunction]
+pub fn profiling_stats() -> PyResult<PyDataFrame> {
+    let counters = COUNTERS.lock().unwrap_or_else(|e| e.into_inner());
+    let column = |f: fn(&Counters) -> u64| counters.values().map(f).collect::<Vec<_>>();
+    let df = df!(
+        "function" => counters.keys().copied().collect::<Vec<_>>(),
+        "calls" => column(|c| c.calls),
+        "wall_time_ns" => column(|c| c.wall_time_ns),
+        "rows" => column(|c| c.rows),
+        "chunks" => column(|c| c.chunks),
+        "allocated_bytes" => column(|c| c.allocated_bytes),
+    )
+    .map_err(PyPolarsErr::from)?;
+    Ok(PyDataFrame(df))
+}
@@ -0,0 +1,326 @@
+//! Rolling aggregations over windows of business days.
+use polars::prelude::*;
+use polars_arrow::array::{Array, PrimitiveArray};
+use polars_arrow::types::NativeType;
+use std::collections::VecDeque;
+use std::str::FromStr;
+
+use crate::business_days::{to_local_days, BusinessDayCounter};
+
+#[derive(Clone, Copy)]
+pub enum RollingAgg {
+    Sum,
+    Mean,
+    Min,
+    Max,
+}
+
+impl FromStr for RollingAgg {
+    type Err = PolarsError;
+
+    fn from_str(s: &str) -> Result<Self, Self::Err> {
+        match s {
+            "sum" => Ok(RollingAgg::Sum),
+            "mean" => Ok(RollingAgg::Mean),
+            "min" => Ok(RollingAgg::Min),
+            "max" => Ok(RollingAgg::Max),
+            s => polars_bail!(InvalidOperation:
+                "Invalid agg {}, expected one of: \"sum\", \"mean\", \"min\", \"max\"", s
+            ),
+        }
+    }
+}
+
+impl RollingAgg {
+    pub fn dtype(&self, dtype: &DataType) -> PolarsResult<DataType> {
+        polars_ensure!(
+            dtype.is_primitive_numeric(),
+            ComputeError: "Expected numeric data type, got: {}", dtype
+        );
+        Ok(match (self, dtype) {
+            (RollingAgg::Sum, dtype) if dtype.is_float() => dtype.clone(),
+            (RollingAgg::Sum, _) => DataType::Int64,
+            (RollingAgg::Mean, DataType::Float32) => DataType::Float32,
+            (RollingAgg::Mean, _) => DataType::Float64,
+            (RollingAgg::Min | RollingAgg::Max, dtype) => dtype.clone(),
+        })
+    }
+}
+
+/// Running sums, which values can be taken back out of.
+trait RunningSum: NativeType + Default {
+    fn add(self, other: Self) -> Self;
+    fn sub(self, other: Self) -> Self;
+    /// Whether taking this value back out of a sum doesn't undo adding it, so
+    /// that the sum has to be recomputed.
+    fn is_sticky(self) -> bool;
+    fn to_f64(self) -> f64;
+}
+
+impl RunningSum for i64 {
+    fn add(self, other: Self) -> Self {
+        self.wrapping_add(other)
+    }
+    fn sub(self, other: Self) -> Self {
+        self.wrapping_sub(other)
+    }
+    fn is_sticky(self) -> bool {
+        false
+    }
+    fn to_f64(self) -> f64 {
+        self as f64
+    }
+}
+
+impl RunningSum for f64 {
+    fn add(self, other: Self) -> Self {
+        self + other
+    }
+    fn sub(self, other: Self) -> Self {
+        self - other
+    }
+    fn is_sticky(self) -> bool {
+        !self.is_finite()
+    }
+    fn to_f64(self) -> f64 {
+        self
+    }
+}
+
+/// Business day ordinals of `by`, which must be sorted and without nulls.
+///
+/// Dates which aren't business days get the ordinal of the business day
+/// before them, so that they're in the same windows as it.
+fn business_ordinals(
+    by: &Series,
+    weekmask: &[bool; 7],
+    holidays: &[i32],
+) -> PolarsResult<Vec<i32>> {
+    polars_ensure!(
+        weekmask.iter().any(|&is_business_day| is_business_day),
+        InvalidOperation: "At least one day of the week must be a business day"
+    );
+    let days = to_local_days(by)?;
+    polars_ensure!(
+        days.null_count() == 0,
+        ComputeError: "`by` must not contain nulls"
+    );
+    let counter = BusinessDayCounter::new(weekmask, holidays);
+    let mut ordinals = Vec::with_capacity(days.len());
+    for arr in days.downcast_iter() {
+        ordinals.extend(
+            arr.values()
+                .iter()
+                .map(|&day| counter.count_before(day + 1)),
+        );
+    }
+    polars_ensure!(
+        ordinals.windows(2).all(|pair| pair[0] <= pair[1]),
+        ComputeError: "`by` must be sorted in ascending order"
+    );
+    Ok(ordinals)
+}
+
+/// Call `f` with each row and the first row of its window: the rows from the
+/// last `window` business days, up to and including its own.
+///
+/// The window's start only ever moves forwards, so this is a single pass.
+#[inline]
+fn for_each_window(ordinals: &[i32], window: i32, mut f: impl FnMut(usize, usize)) {
+    let mut start = 0;
+    for (i, &ordinal) in ordinals.iter().enumerate() {
+        let first = ordinal.saturating_sub(window);
+        while ordinals[start] <= first {
+            start += 1;
+        }
+        f(i, start);
+    }
+}
+
+/// Call `f` with the sum and number of non-null values of each row's window.
+fn window_sums<T: RunningSum>(
+    arr: &PrimitiveArray<T>,
+    ordinals: &[i32],
+    window: i32,
+    mut f: impl FnMut(T, usize),
+) {
+    let get = |i: usize| arr.is_valid(i).then(|| arr.value(i));
+    let (mut sum, mut count, mut previous_start) = (T::default(), 0, 0);
+    for_each_window(ordinals, window, |i, start| {
+        // Rows enter the window once, and leave it once.
+        if let Some(value) = get(i) {
+            sum = sum.add(value);
+            count += 1;
+        }
+        let mut is_stale = false;
+        for j in previous_start..start {
+            if let Some(value) = get(j) {
+                is_stale |= value.is_sticky();
+                sum = sum.sub(value);
+                count -= 1;
+            }
+        }
+        if is_stale {
+            sum = (start..=i).filter_map(get).fold(T::default(), T::add);
+        }
+        previous_start = start;
+        f(sum, count);
+    });
+}
+
+/// Call `f` with the minimum (or maximum, if `is_max`) non-null value of each
+/// row's window, if it has any, and its number of non-null values.
+///
+/// A deque of the window's candidates is kept, in order, without those which
+/// a later value beats, so each row is pushed and popped at most once.
+fn window_extrema<T: NativeType + PartialOrd>(
+    arr: &PrimitiveArray<T>,
+    ordinals: &[i32],
+    window: i32,
+    is_max: bool,
+    mut f: impl FnMut(Option<T>, usize),
+) {
+    let beats = |a: T, b: T| if is_max { a >= b } else { a <= b };
+    let mut candidates: VecDeque<usize> = VecDeque::new();
+    let (mut count, mut previous_start) = (0, 0);
+    for_each_window(ordinals, window, |i, start| {
+        if arr.is_valid(i) {
+            let value = arr.value(i);
+            while candidates
+                .back()
+                .is_some_and(|&j| beats(value, arr.value(j)))
+            {
+                candidates.pop_back();
+            }
+            candidates.push_back(i);
+            count += 1;
+        }
+        count -= (previous_start..start).filter(|&j| arr.is_valid(j)).count();
+        while candidates.front().is_some_and(|&j| j < start) {
+            candidates.pop_front();
+        }
+        previous_start = start;
+        f(candidates.front().map(|&j| arr.value(j)), count);
+    });
+}
+
+fn rolling_sum<T>(
+    ca: &ChunkedArray<T>,
+    ordinals: &[i32],
+    window: i32,
+    min_samples: usize,
+    mean: bool,
+) -> Series
+where
+    T: PolarsNumericType,
+    T::Native: RunningSum,
+{
+    let ca = ca.rechunk();
+    let Some(arr) = ca.downcast_iter().next() else {
+        return ca.into_owned().into_series();
+    };
+    if mean {
+        let mut builder = PrimitiveChunkedBuilder::<Float64Type>::new(ca.name().clone(), ca.len());
+        window_sums(arr, ordinals, window, |sum, count| {
+            builder.append_option((count >= min_samples).then(|| sum.to_f64() / count as f64))
+        });
+        builder.finish().into_series()
+    } else {
+        let mut builder = PrimitiveChunkedBuilder::<T>::new(ca.name().clone(), ca.len());
+        window_sums(arr, ordinals, window, |sum, count| {
+            builder.append_option((count >= min_samples).then_some(sum))
+        });
+        builder.finish().into_series()
+    }
+}
+
+fn rolling_extremum<T>(
+    ca: &ChunkedArray<T>,
+    ordinals: &[i32],
+    window: i32,
+    min_samples: usize,
+    is_max: bool,
+) -> Series
+where
+    T: PolarsNumericType,
+{
+    let ca = ca.rechunk();
+    let mut builder = PrimitiveChunkedBuilder::<T>::new(ca.name().clone(), ca.len());
+    if let Some(arr) = ca.downcast_iter().next() {
+        window_extrema(arr, ordinals, window, is_max, |value, count| {
+            builder.append_option(value.filter(|_| count >= min_samples))
+        });
+    }
+    builder.finish().into_series()
+}
+
+/// Aggregate `s` over the last `window` business days of each row, as given
+/// by the dates (or datetimes, by local date) in `by`.
+///
+/// Dates are mapped to business day ordinals in O(1) each, and the window's
+/// start follows its end through the sorted rows, so that no rows are added
+/// for the days which are missing from the data. Windows with fewer than
+/// `min_samples` non-null values give null.
+pub(crate) fn impl_rolling_business(
+    s: &Series,
+    by: &Series,
+    window: i32,
+    agg: &str,
+    min_samples: usize,
+    weekmask: &[bool; 7],
+    holidays: &[i32],
+) -> PolarsResult<Series> {
+    let agg = RollingAgg::from_str(agg)?;
+    let dtype = agg.dtype(s.dtype())?;
+    polars_ensure!(window > 0, InvalidOperation: "`window` must be positive, got {}", window);
+    polars_ensure!(
+        by.len() == s.len(),
+        ShapeMismatch: "`by` must have the same length as the input, got {} and {}", by.len(), s.len()
+    );
+    // Windows without any values give null, whatever `min_samples` is.
+    let min_samples = min_samples.max(1);
+    let ordinals = business_ordinals(by, weekmask, holidays)?;
+
+    let out = match agg {
+        RollingAgg::Sum | RollingAgg::Mean => {
+            let mean = matches!(agg, RollingAgg::Mean);
+            if s.dtype().is_float() {
+                let s = s.cast(&DataType::Float64)?;
+                rolling_sum(s.f64()?, &ordinals, window, min_samples, mean)
+            } else {
+                let s = s.cast(&DataType::Int64)?;
+                rolling_sum(s.i64()?, &ordinals, window, min_samples, mean)
+            }
+        }
+        RollingAgg::Min | RollingAgg::Max => {
+            let is_max = matches!(agg, RollingAgg::Max);
+            let s = s.to_physical_repr();
+            match s.dtype() {
+                DataType::Int64 => {
+                    rolling_extremum(s.i64()?, &ordinals, window, min_samples, is_max)
+                }
+                DataType::Int32 => {
+                    rolling_extremum(s.i32()?, &ordinals, window, min_samples, is_max)
+                }
+                DataType::UInt64 => {
+                    rolling_extremum(s.u64()?, &ordinals, window, min_samples, is_max)
+                }
+                DataType::UInt32 => {
+                    rolling_extremum(s.u32()?, &ordinals, window, min_samples, is_max)
+                }
+                DataType::Float64 => {
+                    rolling_extremum(s.f64()?, &ordinals, window, min_samples, is_max)
+                }
+                DataType::Float32 => {
+                    rolling_extremum(s.f32()?, &ordinals, window, min_samples, is_max)
+                }
+                // Smaller integers gain nothing from a kernel of their own.
+                _ => {
+                    let s = s.cast(&DataType::Int64)?;
+                    rolling_extremum(s.i64()?, &ordinals, window, min_samples, is_max)
+                }
+            }
+        }
+    };
+    out.cast(&dtype)
+}
@@ -0,0 +1,151 @@
+use polars::prelude::*;
+use pyo3_polars::export::polars_core::datatypes::TimeZone as PolarsTimeZone;
+
+use crate::business_days::{to_local_timestamps, BusinessDayCounter};
+use crate::civil::{nanoseconds_per_unit, split_timestamp, NANOSECONDS_PER_DAY};
+
+/// Trading sessions on business days, on the local clock.
+struct SessionCalendar {
+    /// Session opens and closes, as time units since midnight, in order.
+    opens: Vec<i64>,
+    closes: Vec<i64>,
+    units_per_day: i64,
+    business_days: BusinessDayCounter,
+}
+
+impl SessionCalendar {
+    /// * `sessions`: `[open, close)` pairs, in nanoseconds since midnight.
+    fn new(
+        sessions: &[[i64; 2]],
+        weekmask: &[bool; 7],
+        holidays: &[i32],
+        time_unit: TimeUnit,
+    ) -> PolarsResult<Self> {
+        polars_ensure!(
+            !sessions.is_empty(),
+            InvalidOperation: "At least one session must be given"
+        );
+        polars_ensure!(
+            weekmask.iter().any(|&is_business_day| is_business_day),
+            InvalidOperation: "At least one day of the week must be a business day"
+        );
+        let mut previous_close = 0;
+        for &[open, close] in sessions {
+            polars_ensure!(
+                previous_close <= open && open < close && close <= NANOSECONDS_PER_DAY,
+                InvalidOperation: "sessions must be in order, not overlap, and each open and close within the same day"
+            );
+            previous_close = close;
+        }
+        let per_nanosecond = nanoseconds_per_unit(time_unit);
+        Ok(Self {
+            opens: sessions
+                .iter()
+                .map(|[open, _]| open / per_nanosecond)
+                .collect(),
+            closes: sessions
+                .iter()
+                .map(|[_, close]| close / per_nanosecond)
+                .collect(),
+            units_per_day: NANOSECONDS_PER_DAY / per_nanosecond,
+            business_days: BusinessDayCounter::new(weekmask, holidays),
+        })
+    }
+
+    #[inline]
+    fn is_in_session(&self, timestamp: i64) -> bool {
+        let (day, time_of_day) = split_timestamp(timestamp, self.units_per_day);
+        let session = self.closes.partition_point(|&close| close <= time_of_day);
+        self.business_days.is_business_day(day)
+            && session < self.opens.len()
+            && self.opens[session] <= time_of_day
+    }
+
+    /// First of `boundaries` (opens or closes) at or after `timestamp`.
+    #[inline]
+    fn next(&self, boundaries: &[i64], timestamp: i64) -> i64 {
+        let (mut day, time_of_day) = split_timestamp(timestamp, self.units_per_day);
+        if self.business_days.is_business_day(day) {
+            let session = boundaries.partition_point(|&boundary| boundary < time_of_day);
+            if let Some(boundary) = boundaries.get(session) {
+                return day as i64 * self.units_per_day + boundary;
+            }
+        }
+        // Weekends and holidays are only ever a few days long.
+        day += 1;
+        while !self.business_days.is_business_day(day) {
+            day += 1;
+        }
+        day as i64 * self.units_per_day + boundaries[0]
+    }
+}
+
+/// Time zone in which sessions are observed, for datetimes `s`.
+fn session_time_zone(s: &Series, time_zone: Option<&str>) -> PolarsResult<Option<PolarsTimeZone>> {
+    match (s.dtype(), time_zone) {
+        (_, Some(time_zone)) => PolarsTimeZone::opt_try_new(Some(time_zone)),
+        (DataType::Datetime(_, time_zone), None) => Ok(time_zone.clone()),
+        (dtype, None) => {
+            polars_bail!(InvalidOperation: "polars_xdt session functions only work on Datetime type, got {}", dtype)
+        }
+    }
+}
+
+/// Whether each datetime in `s` falls within one of `sessions` on a business day.
+///
+/// Each row costs a binary search over the day's sessions.
+pub(crate) fn impl_is_in_session(
+    s: &Series,
+    sessions: &[[i64; 2]],
+    weekmask: &[bool; 7],
+    holidays: &[i32],
+    time_zone: Option<&str>,
+) -> PolarsResult<Series> {
+    let DataType::Datetime(time_unit, _) = s.dtype() else {
+        polars_bail!(InvalidOperation: "polars_xdt session functions only work on Datetime type, got {}", s.dtype())
+    };
+    let calendar = SessionCalendar::new(sessions, weekmask, holidays, *time_unit)?;
+    let timestamps = to_local_timestamps(s, time_zone)?;
+    let out: BooleanChunked = timestamps
+        .apply_nonnull_values_generic(DataType::Boolean, |timestamp| {
+            calendar.is_in_session(timestamp)
+        });
+    Ok(out.into_series())
+}
+
+/// Next session open (or, if `close` is set, close) at or after each datetime in `s`.
+///
+/// Boundaries are found on the local clock, and converted back to the time
+/// zone of `s`.
+pub(crate) fn impl_next_session_boundary(
+    s: &Series,
+    sessions: &[[i64; 2]],
+    weekmask: &[bool; 7],
+    holidays: &[i32],
+    time_zone: Option<&str>,
+    close: bool,
+) -> PolarsResult<Series> {
+    let DataType::Datetime(time_unit, _) = s.dtype() else {
+        polars_bail!(InvalidOperation: "polars_xdt session functions only work on Datetime type, got {}", s.dtype())
+    };
+    let calendar = SessionCalendar::new(sessions, weekmask, holidays, *time_unit)?;
+    let boundaries = if close {
+        &calendar.closes
+    } else {
+        &calendar.opens
+    };
+    let timestamps = to_local_timestamps(s, time_zone)?;
+    let local = timestamps
+        .apply_values(|timestamp| calendar.next(boundaries, timestamp))
+        .into_datetime(*time_unit, None);
+    let Some(time_zone) = session_time_zone(s, time_zone)? else {
+        return Ok(local.into_series());
+    };
+    let out = polars_ops::prelude::replace_time_zone(
+        &local,
+        Some(&time_zone),
+        &StringChunked::from_iter(std::iter::once("earliest")),
+        NonExistent::Raise,
+    )?;
+    out.into_series().cast(s.dtype())
+}
@@ -1,15 +1,16 @@
-use arity::try_binary_elementwise;
-use chrono::{LocalResult, NaiveDateTime, TimeZone};
+use arity::{try_binary_elementwise, try_ternary_elementwise, try_unary_elementwise};
+use chrono::{DateTime, LocalResult, NaiveDateTime, Offset, TimeDelta, TimeZone};
+use chrono_tz::OffsetComponents;
 use polars::prelude::*;
 use polars_arrow::legacy::time_zone::Tz;
 use pyo3_polars::export::polars_core::datatypes::time_zone::parse_time_zone;
 use pyo3_polars::export::polars_core::datatypes::TimeZone as PolarsTimeZone;
 use pyo3_polars::export::polars_core::utils::arrow::legacy::kernels::Ambiguous;
-use pyo3_polars::export::polars_core::utils::arrow::temporal_conversions::{
-    timestamp_ms_to_datetime, timestamp_ns_to_datetime, timestamp_us_to_datetime,
-};
 use std::str::FromStr;
 
+use crate::civil::{datetime_decoder, split_timestamp, units_per_second, weekday, SECONDS_PER_DAY};
+use crate::utils::{maybe_dedupe_apply, par_apply, sortedness_no_nulls};
+
 fn naive_utc_to_naive_local_in_new_time_zone(
     from_tz: &Tz,
     to_tz: &Tz,
@@ -22,45 +23,191 @@ fn naive_utc_to_naive_local_in_new_time_zone(
         .naive_local()
 }
 
+/// How to handle local datetimes which fall in a daylight saving time gap.
+#[derive(Clone, Copy)]
+pub enum NonExistentStrategy {
+    Raise,
+    Null,
+    ShiftForward,
+    ShiftBackward,
+}
+
+impl FromStr for NonExistentStrategy {
+    type Err = PolarsError;
+
+    fn from_str(s: &str) -> Result<Self, Self::Err> {
+        match s {
+            "raise" => Ok(NonExistentStrategy::Raise),
+            "null" => Ok(NonExistentStrategy::Null),
+            "shift_forward" => Ok(NonExistentStrategy::ShiftForward),
+            "shift_backward" => Ok(NonExistentStrategy::ShiftBackward),
+            s => polars_bail!(InvalidOperation:
+                "Invalid argument {}, expected one of: \"raise\", \"null\", \"shift_forward\", \"shift_backward\"", s
+            ),
+        }
+    }
+}
+
+/// Find the UTC instant at which the daylight saving time gap containing the
+/// non-existent local datetime `ndt` ends.
+fn dst_gap_end(tz: &Tz, ndt: NaiveDateTime) -> NaiveDateTime {
+    let offset_seconds = |seconds: i64| {
+        let utc = DateTime::from_timestamp(seconds, 0).unwrap().naive_utc();
+        tz.offset_from_utc_datetime(&utc).fix().local_minus_utc() as i64
+    };
+    // Time zone transitions are assumed to be more than a day apart, so the
+    // offsets either side of the gap are those a day before and after it.
+    let local_seconds = ndt.and_utc().timestamp();
+    let offset_before = offset_seconds(local_seconds - SECONDS_PER_DAY);
+    let offset_after = offset_seconds(local_seconds + SECONDS_PER_DAY);
+
+    // The transition happens in (lo, hi]. Transitions always fall on whole
+    // seconds, so bisect down to a one-second interval.
+    let mut lo = local_seconds - offset_after;
+    let mut hi = local_seconds - offset_before + 1;
+    while hi - lo > 1 {
+        let mid = lo + (hi - lo) / 2;
+        if offset_seconds(mid) == offset_before {
+            lo = mid;
+        } else {
+            hi = mid;
+        }
+    }
+    DateTime::from_timestamp(hi, 0).unwrap().naive_utc()
+}
+
 fn naive_local_to_naive_utc_in_new_time_zone(
     from_tz: &Tz,
     to_tz: &Tz,
     ndt: NaiveDateTime,
     ambiguous: &Ambiguous,
-) -> PolarsResult<NaiveDateTime> {
+    non_existent: NonExistentStrategy,
+) -> PolarsResult<Option<NaiveDateTime>> {
     match from_tz.from_local_datetime(&ndt) {
-        LocalResult::Single(dt) => Ok(dt.with_timezone(to_tz).naive_utc()),
+        LocalResult::Single(dt) => Ok(Some(dt.with_timezone(to_tz).naive_utc())),
         LocalResult::Ambiguous(dt_earliest, dt_latest) => match ambiguous {
-            Ambiguous::Earliest => Ok(dt_earliest.with_timezone(to_tz).naive_utc()),
-            Ambiguous::Latest => Ok(dt_latest.with_timezone(to_tz).naive_utc()),
+            Ambiguous::Earliest => Ok(Some(dt_earliest.with_timezone(to_tz).naive_utc())),
+            Ambiguous::Latest => Ok(Some(dt_latest.with_timezone(to_tz).naive_utc())),
             Ambiguous::Raise => {
-                polars_bail!(ComputeError: "datetime '{}' is ambiguous in time zone '{}'. Please use `ambiguous` to tell how it should be localized.", ndt, to_tz)
+                polars_bail!(ComputeError: "datetime '{}' is ambiguous in time zone '{}'. Please use `ambiguous` to tell how it should be localized.", ndt, from_tz)
             }
-            Ambiguous::Null => {
-                unimplemented!("Ambiguous::Null is not yet supported");
+            Ambiguous::Null => Ok(None),
+        },
+        LocalResult::None => match non_existent {
+            NonExistentStrategy::Raise => polars_bail!(ComputeError:
+                "datetime '{}' is non-existent in time zone '{}'. You may be able to use `non_existent='null'` to return `null` in this case.",
+                ndt, from_tz
+            ),
+            NonExistentStrategy::Null => Ok(None),
+            NonExistentStrategy::ShiftForward => Ok(Some(dst_gap_end(from_tz, ndt))),
+            // The smallest step backwards in any time unit is one nanosecond, and
+            // converting to a coarser time unit rounds down.
+            NonExistentStrategy::ShiftBackward => {
+                Ok(Some(dst_gap_end(from_tz, ndt) - TimeDelta::nanoseconds(1)))
             }
         },
-        LocalResult::None => polars_bail!(ComputeError:
-            "datetime '{}' is non-existent in time zone '{}'. Non-existent datetimes are not yet supported",
-            ndt, to_tz
-        ),
     }
 }
 
+/// Parse `tz`, reusing the previously parsed time zone if it hasn't changed.
+fn parse_time_zone_cached(cached: &mut Option<(String, Tz)>, tz: &str) -> PolarsResult<Tz> {
+    if let Some((name, parsed)) = cached.as_ref() {
+        if name.as_str() == tz {
+            return Ok(*parsed);
+        }
+    }
+    let parsed = parse_time_zone(tz)?;
+    *cached = Some((tz.to_string(), parsed));
+    Ok(parsed)
+}
+
+/// Convert runs of sorted UTC `timestamps` to local time, appending to `out`.
+///
+/// UTC offsets only change at time zone transitions, so rather than looking up
+/// the offset of every timestamp, look for where each run of timestamps sharing
+/// an offset ends and shift the whole run at once.
+///
+/// Returns whether `out` is still sorted.
+fn sorted_timestamps_to_local(
+    timestamps: &[i64],
+    offset: impl Fn(i64) -> i64,
+    units_per_day: i64,
+    out: &mut Vec<i64>,
+) -> bool {
+    let mut is_sorted = true;
+    let mut start = 0;
+    while start < timestamps.len() {
+        let run_offset = offset(timestamps[start]);
+        // Time zone transitions are assumed to be more than a day apart, so there
+        // is at most one of them within a day of the start of the run.
+        let window_end = start
+            + timestamps[start..]
+                .partition_point(|&ts| ts < timestamps[start].saturating_add(units_per_day));
+        let run_end = if window_end == start + 1 || offset(timestamps[window_end - 1]) == run_offset
+        {
+            window_end
+        } else {
+            start + timestamps[start..window_end].partition_point(|&ts| offset(ts) == run_offset)
+        };
+        if let Some(&last) = out.last() {
+            is_sorted &= last <= timestamps[start] + run_offset;
+        }
+        out.extend(timestamps[start..run_end].iter().map(|ts| ts + run_offset));
+        start = run_end;
+    }
+    is_sorted
+}
+
+/// Convert `timestamps`, whose values are sorted and non-null, to local time in `to_tz`.
+fn sorted_to_local_datetime(
+    timestamps: &Int64Chunked,
+    time_unit: TimeUnit,
+    to_tz: &Tz,
+) -> PolarsResult<Int64Chunked> {
+    let timestamp_to_datetime = datetime_decoder(time_unit);
+    // The timestamps are sorted, so they all decode if the first and last do.
+    for timestamp in [timestamps.first(), timestamps.last()]
+        .into_iter()
+        .flatten()
+    {
+        timestamp_to_datetime(timestamp)?;
+    }
+    let units_per_second = units_per_second(time_unit);
+    let offset = |timestamp: i64| {
+        // Can't fail, as the ends were checked above.
+        let ndt = timestamp_to_datetime(timestamp).unwrap();
+        let offset = to_tz.offset_from_utc_datetime(&ndt);
+        offset.fix().local_minus_utc() as i64 * units_per_second
+    };
+
+    let mut out = Vec::with_capacity(timestamps.len());
+    let mut is_sorted = true;
+    for arr in timestamps.downcast_iter() {
+        is_sorted &= sorted_timestamps_to_local(
+            arr.values(),
+            &offset,
+            units_per_second * SECONDS_PER_DAY,
+            &mut out,
+        );
+    }
+    let mut out = Int64Chunked::from_vec(timestamps.name().clone(), out);
+    if is_sorted {
+        out.set_sorted_flag(IsSorted::Ascending);
+    }
+    Ok(out)
+}
+
 pub fn elementwise_to_local_datetime(
-    datetime: &Logical<DatetimeType, Int64Type>,
+    datetime: &DatetimeChunked,
     tz: &StringChunked,
 ) -> PolarsResult<DatetimeChunked> {
     let binding = PlSmallStr::from("UTC");
     let from_time_zone = datetime.time_zone().as_deref().unwrap_or(&binding);
     let from_tz = parse_time_zone(from_time_zone)?;
 
-    let timestamp_to_datetime: fn(i64) -> NaiveDateTime = match datetime.time_unit() {
-        TimeUnit::Milliseconds => timestamp_ms_to_datetime,
-        TimeUnit::Microseconds => timestamp_us_to_datetime,
-        TimeUnit::Nanoseconds => timestamp_ns_to_datetime,
-    };
-    let datetime_to_timestamp: fn(NaiveDateTime) -> i64 = match datetime.time_unit() {
+    let time_unit = datetime.time_unit();
+    let timestamp_to_datetime = datetime_decoder(time_unit);
+    let datetime_to_timestamp: fn(NaiveDateTime) -> i64 = match time_unit {
         TimeUnit::Milliseconds => datetime_to_timestamp_ms,
         TimeUnit::Microseconds => datetime_to_timestamp_us,
         TimeUnit::Nanoseconds => datetime_to_timestamp_ns,
@@ -69,21 +216,30 @@ pub fn elementwise_to_local_datetime(
         1 => match unsafe { tz.get_unchecked(0) } {
             Some(convert_tz) => {
                 let to_tz = parse_time_zone(convert_tz)?;
-                Ok(datetime.phys.apply(|timestamp_opt| {
-                    timestamp_opt.map(|ts| {
-                        let ndt = timestamp_to_datetime(ts);
-                        datetime_to_timestamp(naive_utc_to_naive_local_in_new_time_zone(
-                            &from_tz, &to_tz, ndt,
-                        ))
-                    })
-                }))
+                if sortedness_no_nulls(&datetime.phys) == IsSorted::Ascending {
+                    return Ok(par_apply(&datetime.phys, |timestamps| {
+                        sorted_to_local_datetime(timestamps, time_unit, &to_tz)
+                    })?
+                    .into_datetime(time_unit, None));
+                }
+                let convert = |ts: i64| -> PolarsResult<i64> {
+                    let ndt = timestamp_to_datetime(ts)?;
+                    Ok(datetime_to_timestamp(
+                        naive_utc_to_naive_local_in_new_time_zone(&from_tz, &to_tz, ndt),
+                    ))
+                };
+                // Null slots can hold any value (e.g. NumPy's NaT), which might not
+                // decode, so only non-null values are converted.
+                par_apply(&datetime.phys, |timestamps| {
+                    timestamps.try_apply_nonnull_values_generic(convert)
+                })
             }
             _ => Ok(Int64Chunked::full_null(PlSmallStr::EMPTY, datetime.len())),
         },
         _ => try_binary_elementwise(&datetime.phys, tz, |timestamp_opt, convert_tz_opt| {
             match (timestamp_opt, convert_tz_opt) {
                 (Some(timestamp), Some(convert_tz)) => {
-                    let ndt = timestamp_to_datetime(timestamp);
+                    let ndt = timestamp_to_datetime(timestamp)?;
                     let to_tz = parse_time_zone(convert_tz)?;
                     Ok(Some(datetime_to_timestamp(
                         naive_utc_to_naive_local_in_new_time_zone(&from_tz, &to_tz, ndt),
@@ -93,57 +249,424 @@ pub fn elementwise_to_local_datetime(
             }
         }),
     };
-    let out = out?.into_datetime(datetime.time_unit(), None);
+    let out = out?.into_datetime(time_unit, None);
     Ok(out)
 }
 
 pub fn elementwise_from_local_datetime(
-    datetime: &Logical<DatetimeType, Int64Type>,
+    datetime: &DatetimeChunked,
     from_tz: &StringChunked,
+    ambiguous: &StringChunked,
     out_tz: &str,
-    ambiguous: &str,
+    non_existent: &str,
+    dedupe: Option<bool>,
 ) -> PolarsResult<DatetimeChunked> {
     let to_tz = parse_time_zone(out_tz)?;
-    let ambig = Ambiguous::from_str(ambiguous)?;
-    let timestamp_to_datetime: fn(i64) -> NaiveDateTime = match datetime.time_unit() {
-        TimeUnit::Milliseconds => timestamp_ms_to_datetime,
-        TimeUnit::Microseconds => timestamp_us_to_datetime,
-        TimeUnit::Nanoseconds => timestamp_ns_to_datetime,
-    };
-    let datetime_to_timestamp: fn(NaiveDateTime) -> i64 = match datetime.time_unit() {
+    let non_existent = NonExistentStrategy::from_str(non_existent)?;
+    let time_unit = datetime.time_unit();
+    let timestamp_to_datetime = datetime_decoder(time_unit);
+    let datetime_to_timestamp: fn(NaiveDateTime) -> i64 = match time_unit {
         TimeUnit::Milliseconds => datetime_to_timestamp_ms,
         TimeUnit::Microseconds => datetime_to_timestamp_us,
         TimeUnit::Nanoseconds => datetime_to_timestamp_ns,
     };
-    let out = match from_tz.len() {
-        1 => match unsafe { from_tz.get_unchecked(0) } {
-            Some(from_tz) => {
+    let convert = |timestamp: i64, from_tz: &Tz, ambiguous: &Ambiguous| {
+        let ndt = timestamp_to_datetime(timestamp)?;
+        naive_local_to_naive_utc_in_new_time_zone(from_tz, &to_tz, ndt, ambiguous, non_existent)
+            .map(|ndt| ndt.map(datetime_to_timestamp))
+    };
+    let len = datetime.len();
+    let out = match (from_tz.len(), ambiguous.len()) {
+        (1, 1) => match unsafe { (from_tz.get_unchecked(0), ambiguous.get_unchecked(0)) } {
+            (Some(from_tz), Some(ambiguous)) => {
                 let from_tz = parse_time_zone(from_tz)?;
-                datetime.phys.try_apply_nonnull_values_generic(|timestamp| {
-                    let ndt = timestamp_to_datetime(timestamp);
-                    Ok::<i64, PolarsError>(datetime_to_timestamp(
-                        naive_local_to_naive_utc_in_new_time_zone(&from_tz, &to_tz, ndt, &ambig)?,
-                    ))
+                let ambiguous = Ambiguous::from_str(ambiguous)?;
+                let convert = |timestamp: i64| convert(timestamp, &from_tz, &ambiguous);
+                maybe_dedupe_apply(&datetime.phys, dedupe, |timestamps| {
+                    par_apply(timestamps, |timestamps| {
+                        try_unary_elementwise(timestamps, |timestamp_opt| {
+                            timestamp_opt.map_or(Ok(None), convert)
+                        })
+                    })
+                })
+            }
+            _ => Ok(Int64Chunked::full_null(PlSmallStr::EMPTY, len)),
+        },
+        (from_tz_len, ambiguous_len) => {
+            polars_ensure!(
+                (from_tz_len == 1 || from_tz_len == len)
+                    && (ambiguous_len == 1 || ambiguous_len == len),
+                ShapeMismatch: "expected `from_tz` and `ambiguous` to be of length 1 or {}, got {} and {}",
+                len, from_tz_len, ambiguous_len
+            );
+            let from_tz = match from_tz_len {
+                1 => from_tz.new_from_index(0, len),
+                _ => from_tz.clone(),
+            };
+            let ambiguous = match ambiguous_len {
+                1 => ambiguous.new_from_index(0, len),
+                _ => ambiguous.clone(),
+            };
+            let mut cached: Option<(String, Tz)> = None;
+            try_ternary_elementwise(
+                &datetime.phys,
+                &from_tz,
+                &ambiguous,
+                |timestamp_opt, from_tz_opt, ambiguous_opt| match (
+                    timestamp_opt,
+                    from_tz_opt,
+                    ambiguous_opt,
+                ) {
+                    (Some(timestamp), Some(from_tz), Some(ambiguous)) => {
+                        let from_tz = parse_time_zone_cached(&mut cached, from_tz)?;
+                        convert(timestamp, &from_tz, &Ambiguous::from_str(ambiguous)?)
+                    }
+                    _ => Ok(None),
+                },
+            )
+        }
+    };
+    let out = out?.into_datetime(time_unit, PolarsTimeZone::opt_try_new(Some(out_tz))?);
+    Ok(out)
+}
+
+/// Build a function which truncates (or, if `ceil` is set, takes the ceiling of)
+/// a timestamp to a multiple of `every`, in the local calendar of a time zone.
+fn timestamp_rounder(
+    every: &str,
+    time_unit: TimeUnit,
+    ceil: bool,
+) -> PolarsResult<impl Fn(i64, Option<&Tz>) -> PolarsResult<i64> + Send + Sync> {
+    let every = Duration::try_parse(every)?;
+    polars_ensure!(
+        !every.negative(),
+        ComputeError: "cannot truncate a Datetime to a negative duration"
+    );
+    let window = Window::new(every, every, Duration::new(0));
+
+    let truncate: fn(&Window, i64, Option<&Tz>) -> PolarsResult<i64> = match time_unit {
+        TimeUnit::Milliseconds => Window::truncate_ms,
+        TimeUnit::Microseconds => Window::truncate_us,
+        TimeUnit::Nanoseconds => Window::truncate_ns,
+    };
+    let add: fn(&Duration, i64, Option<&Tz>) -> PolarsResult<i64> = match time_unit {
+        TimeUnit::Milliseconds => Duration::add_ms,
+        TimeUnit::Microseconds => Duration::add_us,
+        TimeUnit::Nanoseconds => Duration::add_ns,
+    };
+    Ok(move |timestamp: i64, local_tz: Option<&Tz>| {
+        let truncated = truncate(&window, timestamp, local_tz)?;
+        if ceil && truncated != timestamp {
+            add(&every, truncated, local_tz)
+        } else {
+            Ok(truncated)
+        }
+    })
+}
+
+/// Round each non-null timestamp in `timestamps` with `round`.
+fn round_timestamps<F>(timestamps: &Int64Chunked, round: F) -> PolarsResult<Int64Chunked>
+where
+    F: Fn(i64) -> PolarsResult<i64> + Send + Sync,
+{
+    par_apply(timestamps, |timestamps| {
+        timestamps.try_apply_nonnull_values_generic(&round)
+    })
+}
+
+/// Truncate (or, if `ceil` is set, take the ceiling of) each timestamp in the
+/// local calendar of its row's time zone, returning the result as a timestamp
+/// in the input's time zone.
+///
+/// Each row is localized, rounded, and converted back in a single pass, without
+/// materializing intermediate local datetimes.
+pub fn elementwise_local_truncate(
+    datetime: &DatetimeChunked,
+    tz: &StringChunked,
+    every: &str,
+    ceil: bool,
+) -> PolarsResult<DatetimeChunked> {
+    let time_unit = datetime.time_unit();
+    let time_zone = datetime.time_zone().clone();
+    let round = timestamp_rounder(every, time_unit, ceil)?;
+
+    let out = match tz.len() {
+        1 => match unsafe { tz.get_unchecked(0) } {
+            Some(local_tz) => {
+                let local_tz = parse_time_zone(local_tz)?;
+                round_timestamps(&datetime.phys, |timestamp| {
+                    round(timestamp, Some(&local_tz))
                 })
             }
             _ => Ok(Int64Chunked::full_null(PlSmallStr::EMPTY, datetime.len())),
         },
-        _ => try_binary_elementwise(&datetime.phys, from_tz, |timestamp_opt, from_tz_opt| {
-            match (timestamp_opt, from_tz_opt) {
-                (Some(timestamp), Some(from_tz)) => {
-                    let ndt = timestamp_to_datetime(timestamp);
-                    let from_tz = parse_time_zone(from_tz)?;
-                    Ok(Some(datetime_to_timestamp(
-                        naive_local_to_naive_utc_in_new_time_zone(&from_tz, &to_tz, ndt, &ambig)?,
-                    )))
+        tz_len => {
+            polars_ensure!(
+                tz_len == datetime.len(),
+                ShapeMismatch: "expected time zone column of length 1 or {}, got {}", datetime.len(), tz_len
+            );
+            // Zone columns are usually long runs of the same value, so only re-parse
+            // the time zone when it changes from one row to the next.
+            let mut cached: Option<(String, Tz)> = None;
+            try_binary_elementwise(&datetime.phys, tz, |timestamp_opt, local_tz_opt| {
+                match (timestamp_opt, local_tz_opt) {
+                    (Some(timestamp), Some(local_tz)) => {
+                        let local_tz = parse_time_zone_cached(&mut cached, local_tz)?;
+                        Ok(Some(round(timestamp, Some(&local_tz))?))
+                    }
+                    _ => Ok(None),
                 }
-                _ => Ok(None),
-            }
-        }),
+            })
+        }
     };
-    let out = out?.into_datetime(
-        datetime.time_unit(),
-        PolarsTimeZone::opt_try_new(Some(out_tz))?,
+    Ok(out?.into_datetime(time_unit, time_zone))
+}
+
+/// Take the ceiling of each datetime (or date) to a multiple of `every`, in the
+/// calendar of its own time zone.
+pub fn impl_ceil(s: &Series, every: &str) -> PolarsResult<Series> {
+    match s.dtype() {
+        DataType::Date => {
+            // Dates are rounded as midnight datetimes.
+            let datetime = s.cast(&DataType::Datetime(TimeUnit::Milliseconds, None))?;
+            ceil_datetime(datetime.datetime()?, every)?
+                .into_series()
+                .cast(&DataType::Date)
+        }
+        DataType::Datetime(_, _) => Ok(ceil_datetime(s.datetime()?, every)?.into_series()),
+        dtype => {
+            polars_bail!(InvalidOperation: "polars_xdt.ceil only works on Date or Datetime type, got {}", dtype)
+        }
+    }
+}
+
+fn ceil_datetime(datetime: &DatetimeChunked, every: &str) -> PolarsResult<DatetimeChunked> {
+    let time_unit = datetime.time_unit();
+    let time_zone = datetime.time_zone().clone();
+    let tz = time_zone
+        .as_deref()
+        .map(|tz| parse_time_zone(tz))
+        .transpose()?;
+    let round = timestamp_rounder(every, time_unit, true)?;
+    let out = round_timestamps(&datetime.phys, |timestamp| round(timestamp, tz.as_ref()))?;
+    Ok(out.into_datetime(time_unit, time_zone))
+}
+
+/// Calendar fields which `local_fields` can extract.
+#[derive(Clone, Copy, PartialEq)]
+pub enum LocalField {
+    Date,
+    Hour,
+    Weekday,
+    UtcOffset,
+    IsDst,
+}
+
+impl FromStr for LocalField {
+    type Err = PolarsError;
+
+    fn from_str(s: &str) -> Result<Self, Self::Err> {
+        match s {
+            "date" => Ok(LocalField::Date),
+            "hour" => Ok(LocalField::Hour),
+            "weekday" => Ok(LocalField::Weekday),
+            "utc_offset" => Ok(LocalField::UtcOffset),
+            "is_dst" => Ok(LocalField::IsDst),
+            s => polars_bail!(InvalidOperation:
+                "Invalid field {}, expected one of: \"date\", \"hour\", \"weekday\", \"utc_offset\", \"is_dst\"", s
+            ),
+        }
+    }
+}
+
+impl LocalField {
+    pub fn dtype(&self, time_unit: TimeUnit) -> DataType {
+        match self {
+            LocalField::Date => DataType::Date,
+            LocalField::Hour | LocalField::Weekday => DataType::Int8,
+            LocalField::UtcOffset => DataType::Duration(time_unit),
+            LocalField::IsDst => DataType::Boolean,
+        }
+    }
+}
+
+struct LocalFieldsBuilders {
+    date: Option<PrimitiveChunkedBuilder<Int32Type>>,
+    hour: Option<PrimitiveChunkedBuilder<Int8Type>>,
+    weekday: Option<PrimitiveChunkedBuilder<Int8Type>>,
+    utc_offset: Option<PrimitiveChunkedBuilder<Int64Type>>,
+    is_dst: Option<BooleanChunkedBuilder>,
+}
+
+impl LocalFieldsBuilders {
+    fn new(fields: &[LocalField], len: usize) -> Self {
+        let wants = |field: LocalField| fields.contains(&field);
+        Self {
+            date: wants(LocalField::Date).then(|| PrimitiveChunkedBuilder::new("date".into(), len)),
+            hour: wants(LocalField::Hour).then(|| PrimitiveChunkedBuilder::new("hour".into(), len)),
+            weekday: wants(LocalField::Weekday)
+                .then(|| PrimitiveChunkedBuilder::new("weekday".into(), len)),
+            utc_offset: wants(LocalField::UtcOffset)
+                .then(|| PrimitiveChunkedBuilder::new("utc_offset".into(), len)),
+            is_dst: wants(LocalField::IsDst)
+                .then(|| BooleanChunkedBuilder::new("is_dst".into(), len)),
+        }
+    }
+
+    #[inline]
+    fn append(&mut self, date: i32, hour: i8, weekday: i8, utc_offset: i64, is_dst: bool) {
+        if let Some(b) = self.date.as_mut() {
+            b.append_value(date)
+        }
+        if let Some(b) = self.hour.as_mut() {
+            b.append_value(hour)
+        }
+        if let Some(b) = self.weekday.as_mut() {
+            b.append_value(weekday)
+        }
+        if let Some(b) = self.utc_offset.as_mut() {
+            b.append_value(utc_offset)
+        }
+        if let Some(b) = self.is_dst.as_mut() {
+            b.append_value(is_dst)
+        }
+    }
+
+    #[inline]
+    fn append_null(&mut self) {
+        if let Some(b) = self.date.as_mut() {
+            b.append_null()
+        }
+        if let Some(b) = self.hour.as_mut() {
+            b.append_null()
+        }
+        if let Some(b) = self.weekday.as_mut() {
+            b.append_null()
+        }
+        if let Some(b) = self.utc_offset.as_mut() {
+            b.append_null()
+        }
+        if let Some(b) = self.is_dst.as_mut() {
+            b.append_null()
+        }
+    }
+
+    fn finish(
+        mut self,
+        fields: &[LocalField],
+        name: PlSmallStr,
+        len: usize,
+        time_unit: TimeUnit,
+    ) -> PolarsResult<StructChunked> {
+        let columns = fields
+            .iter()
+            .map(|field| match field {
+                LocalField::Date => self.date.take().unwrap().finish().into_date().into_series(),
+                LocalField::Hour => self.hour.take().unwrap().finish().into_series(),
+                LocalField::Weekday => self.weekday.take().unwrap().finish().into_series(),
+                LocalField::UtcOffset => self
+                    .utc_offset
+                    .take()
+                    .unwrap()
+                    .finish()
+                    .into_duration(time_unit)
+                    .into_series(),
+                LocalField::IsDst => self.is_dst.take().unwrap().finish().into_series(),
+            })
+            .collect::<Vec<_>>();
+        StructChunked::from_series(name, len, columns.iter())
+    }
+}
+
+/// Extract the requested local calendar fields for each timestamp, in its
+/// row's time zone.
+///
+/// The UTC offset is looked up once per row and all fields are derived from it,
+/// so no intermediate local Datetime column is materialized.
+pub fn impl_local_fields(
+    datetime: &Logical<DatetimeType, Int64Type>,
+    tz: &StringChunked,
+    fields: &[String],
+) -> PolarsResult<StructChunked> {
+    let fields = fields
+        .iter()
+        .map(|field| LocalField::from_str(field))
+        .collect::<PolarsResult<Vec<_>>>()?;
+    polars_ensure!(
+        !fields.is_empty(),
+        InvalidOperation: "`local_fields` requires at least one field"
     );
-    Ok(out)
+    for (i, field) in fields.iter().enumerate() {
+        polars_ensure!(
+            !fields[..i].contains(field),
+            InvalidOperation: "fields passed to `local_fields` must be unique"
+        );
+    }
+
+    let time_unit = datetime.time_unit();
+    let timestamp_to_datetime = datetime_decoder(time_unit);
+    let units_per_second = units_per_second(time_unit);
+    let units_per_hour = units_per_second * 3_600;
+    let units_per_day = units_per_hour * 24;
+
+    let len = datetime.len();
+    let mut builders = LocalFieldsBuilders::new(&fields, len);
+    let mut push = |timestamp_opt: Option<i64>, local_tz_opt: Option<&Tz>| -> PolarsResult<()> {
+        let (timestamp, local_tz) = match (timestamp_opt, local_tz_opt) {
+            (Some(timestamp), Some(local_tz)) => (timestamp, local_tz),
+            _ => {
+                builders.append_null();
+                return Ok(());
+            }
+        };
+        let offset = local_tz.offset_from_utc_datetime(&timestamp_to_datetime(timestamp)?);
+        let offset_units = offset.fix().local_minus_utc() as i64 * units_per_second;
+        let local = timestamp + offset_units;
+        let (days, time_of_day) = split_timestamp(local, units_per_day);
+        builders.append(
+            days,
+            (time_of_day / units_per_hour) as i8,
+            // Weekdays are numbered from 1 (Monday) to 7.
+            (weekday(days) + 1) as i8,
+            offset_units,
+            offset.dst_offset().num_seconds() != 0,
+        );
+        Ok(())
+    };
+
+    match tz.len() {
+        1 => {
+            let local_tz = match unsafe { tz.get_unchecked(0) } {
+                Some(local_tz) => Some(parse_time_zone(local_tz)?),
+                None => None,
+            };
+            if datetime.phys.null_count() == 0 {
+                for arr in datetime.phys.downcast_iter() {
+                    for &timestamp in arr.values().iter() {
+                        push(Some(timestamp), local_tz.as_ref())?;
+                    }
+                }
+            } else {
+                for timestamp_opt in datetime.phys.iter() {
+                    push(timestamp_opt, local_tz.as_ref())?;
+                }
+            }
+        }
+        _ => {
+            polars_ensure!(
+                tz.len() == len,
+                ShapeMismatch: "expected time zone column of length 1 or {}, got {}", len, tz.len()
+            );
+            let mut cached: Option<(String, Tz)> = None;
+            for (timestamp_opt, local_tz_opt) in datetime.phys.iter().zip(tz.iter()) {
+                let local_tz = match local_tz_opt {
+                    Some(local_tz) => Some(parse_time_zone_cached(&mut cached, local_tz)?),
+                    None => None,
+                };
+                push(timestamp_opt, local_tz.as_ref())?;
+            }
+        }
+    }
+    drop(push);
+    builders.finish(&fields, datetime.name().clone(), len, time_unit)
 }
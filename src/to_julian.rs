@@ -1,10 +1,11 @@
-use chrono::{Datelike, Timelike};
+use arity::unary_elementwise_values;
 use polars::prelude::*;
-use polars_arrow::legacy::utils::CustomIterTools;
-use polars_arrow::temporal_conversions::{
-    timestamp_ms_to_datetime, timestamp_ns_to_datetime, timestamp_us_to_datetime,
+
+use crate::civil::{
+    civil_from_days, nanoseconds_per_unit, split_timestamp, time_from_nanoseconds,
+    NANOSECONDS_PER_DAY,
 };
-use polars_arrow::{array::Float64Array, temporal_conversions::MILLISECONDS_IN_DAY};
+use crate::utils::par_apply;
 
 fn to_julian_date(
     mut year: i32,
@@ -34,54 +35,43 @@ pub(crate) fn impl_to_julian_date(s: &Series) -> PolarsResult<Series> {
     match s.dtype() {
         DataType::Date => {
             let ca = s.date()?;
-            let chunks = ca.phys.downcast_iter().map(|arr| -> Float64Array {
-                arr.into_iter()
-                    .map(|timestamp_opt| {
-                        timestamp_opt.map(|timestamp| {
-                            let ndt =
-                                timestamp_ms_to_datetime((*timestamp as i64) * MILLISECONDS_IN_DAY);
-                            to_julian_date(ndt.year(), ndt.month(), ndt.day(), 0, 0, 0, 0)
-                        })
-                    })
-                    .collect_trusted()
-            });
-            Ok(Float64Chunked::from_chunk_iter(PlSmallStr::EMPTY, chunks).into_series())
+            // Null slots are converted too, so that the input's validity can be
+            // reused as is rather than rebuilt element by element.
+            let mut out: Float64Chunked = par_apply(&ca.phys, |days| {
+                Ok(unary_elementwise_values(days, |days: i32| {
+                    let (year, month, day) = civil_from_days(days);
+                    to_julian_date(year, month, day, 0, 0, 0, 0)
+                }))
+            })?;
+            // Julian dates are strictly increasing in time.
+            out.set_sorted_flag(s.is_sorted_flag());
+            Ok(out.into_series())
         }
         DataType::Datetime(time_unit, time_zone) => {
             if !(time_zone.is_none() || time_zone.as_deref() == Some(&PlSmallStr::from("UTC"))) {
                 polars_bail!(InvalidOperation: "polars_xdt to_julian currently only works on UTC or naive Datetime type. \
                 For now, please cast to UTC Datetime first.")
             };
-            let timestamp_to_datetime = match time_unit {
-                TimeUnit::Nanoseconds => timestamp_ns_to_datetime,
-                TimeUnit::Microseconds => timestamp_us_to_datetime,
-                TimeUnit::Milliseconds => timestamp_ms_to_datetime,
-            };
+            let per_nanosecond = nanoseconds_per_unit(*time_unit);
+            let units_per_day = NANOSECONDS_PER_DAY / per_nanosecond;
             let ca = &polars_ops::prelude::replace_time_zone(
                 s.datetime()?,
                 None,
                 &StringChunked::from_iter(std::iter::once("raise")),
                 NonExistent::Raise,
             )?;
-            let chunks = ca.phys.downcast_iter().map(|arr| -> Float64Array {
-                arr.into_iter()
-                    .map(|timestamp_opt| {
-                        timestamp_opt.map(|timestamp| {
-                            let ndt = timestamp_to_datetime(*timestamp);
-                            to_julian_date(
-                                ndt.year(),
-                                ndt.month(),
-                                ndt.day(),
-                                ndt.hour(),
-                                ndt.minute(),
-                                ndt.second(),
-                                ndt.nanosecond(),
-                            )
-                        })
-                    })
-                    .collect_trusted()
-            });
-            Ok(Float64Chunked::from_chunk_iter(PlSmallStr::EMPTY, chunks).into_series())
+            let mut out: Float64Chunked = par_apply(&ca.phys, |timestamps| {
+                Ok(unary_elementwise_values(timestamps, |timestamp: i64| {
+                    let (days, time) = split_timestamp(timestamp, units_per_day);
+                    let (year, month, day) = civil_from_days(days);
+                    let (hour, minute, second, nanosecond) =
+                        time_from_nanoseconds(time * per_nanosecond);
+                    to_julian_date(year, month, day, hour, minute, second, nanosecond)
+                }))
+            })?;
+            // Julian dates are strictly increasing in time.
+            out.set_sorted_flag(s.is_sorted_flag());
+            Ok(out.into_series())
         }
         _ => {
             polars_bail!(InvalidOperation: "polars_xdt to_julian currently only works on Date type. \
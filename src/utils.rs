@@ -0,0 +1,232 @@
+use polars::prelude::*;
+use pyo3_polars::export::polars_core::POOL;
+use std::hash::Hash;
+
+/// Below this many rows per thread, kernels run on the calling thread, as
+/// splitting the work up would cost more than it saves.
+const MIN_ROWS_PER_THREAD: usize = 1 << 15;
+
+/// Whether the calling thread is one of Polars' worker threads.
+///
+/// Polars, which is loaded separately from this plugin, has its own thread
+/// pool, so the thread's name is the only way to tell.
+fn in_polars_worker_thread() -> bool {
+    if POOL.current_thread_index().is_some() {
+        return true;
+    }
+    let pool_name = std::env::var("POLARS_THREAD_NAME").unwrap_or_else(|_| "polars".to_string());
+    std::thread::current().name().is_some_and(|name| {
+        name.starts_with(pool_name.as_str()) || name.starts_with("async-executor")
+    })
+}
+
+/// Apply `f` to `ca`, split into contiguous ranges which are processed on
+/// Polars' thread pool, if `ca` is large enough for that to pay off.
+///
+/// If the calling thread is already one of Polars' worker threads, then
+/// Polars is already evaluating expressions (or columns) in parallel, so `f`
+/// is applied on the calling thread to avoid oversubscribing the cores.
+pub(crate) fn par_apply<T, U, F>(ca: &ChunkedArray<T>, f: F) -> PolarsResult<ChunkedArray<U>>
+where
+    T: PolarsDataType,
+    U: PolarsPhysicalType,
+    ChunkedArray<U>: IntoSeries,
+    F: Fn(&ChunkedArray<T>) -> PolarsResult<ChunkedArray<U>> + Send + Sync,
+{
+    let mut out = par_apply_many(ca, |ca| Ok(vec![f(ca)?]))?;
+    Ok(out.pop().unwrap())
+}
+
+/// Like `par_apply`, for `f` which returns several columns, each of which is
+/// put back together from the ranges separately.
+pub(crate) fn par_apply_many<T, U, F>(
+    ca: &ChunkedArray<T>,
+    f: F,
+) -> PolarsResult<Vec<ChunkedArray<U>>>
+where
+    T: PolarsDataType,
+    U: PolarsPhysicalType,
+    ChunkedArray<U>: IntoSeries,
+    F: Fn(&ChunkedArray<T>) -> PolarsResult<Vec<ChunkedArray<U>>> + Send + Sync,
+{
+    let len = ca.len();
+    let n_threads = POOL.current_num_threads().min(len / MIN_ROWS_PER_THREAD);
+    if n_threads <= 1 || in_polars_worker_thread() {
+        return f(ca);
+    }
+    let rows_per_thread = len.div_ceil(n_threads);
+    let mut results: Vec<Option<PolarsResult<Vec<ChunkedArray<U>>>>> =
+        (0..n_threads).map(|_| None).collect();
+    POOL.scope(|scope| {
+        for (i, result) in results.iter_mut().enumerate() {
+            let f = &f;
+            scope.spawn(move |_| {
+                let part = ca.slice((i * rows_per_thread) as i64, rows_per_thread);
+                *result = Some(f(&part));
+            });
+        }
+    });
+    let mut out: Vec<Series> = vec![];
+    for result in results {
+        let parts = result.unwrap()?.into_iter().map(IntoSeries::into_series);
+        if out.is_empty() {
+            out.extend(parts);
+        } else {
+            for (out, part) in out.iter_mut().zip(parts) {
+                out.append_owned(part)?;
+            }
+        }
+    }
+    out.into_iter()
+        .map(|out| Ok(out.unpack::<U>()?.clone()))
+        .collect()
+}
+
+/// Find how `ca` is sorted, if it has no nulls.
+///
+/// Sorted flags don't survive the trip across the plugin boundary, so if the
+/// flag isn't set then the values themselves are checked. This is a single
+/// branch-free pass, which is cheap compared to the kernels which make use of
+/// its result.
+///
+/// Returns `IsSorted::Not` if `ca` contains nulls.
+pub(crate) fn sortedness_no_nulls<T>(ca: &ChunkedArray<T>) -> IsSorted
+where
+    T: PolarsNumericType,
+{
+    if ca.null_count() > 0 {
+        return IsSorted::Not;
+    }
+    match ca.is_sorted_flag() {
+        IsSorted::Not => (),
+        flag => return flag,
+    }
+    let mut ascending = true;
+    let mut descending = true;
+    let mut previous: Option<T::Native> = None;
+    for arr in ca.downcast_iter() {
+        let values = arr.values().as_slice();
+        if let (Some(previous), Some(&first)) = (previous, values.first()) {
+            ascending &= previous <= first;
+            descending &= previous >= first;
+        }
+        for window in values.windows(2) {
+            ascending &= window[0] <= window[1];
+            descending &= window[0] >= window[1];
+        }
+        if !(ascending || descending) {
+            return IsSorted::Not;
+        }
+        previous = values.last().copied().or(previous);
+    }
+    if ascending {
+        IsSorted::Ascending
+    } else {
+        IsSorted::Descending
+    }
+}
+
+/// Largest number of distinct values memoized by a single call to `dedupe_apply`.
+const DEDUPE_MAX_DISTINCT: usize = 1 << 16;
+
+/// Number of rows sampled to decide whether to dedupe automatically.
+const DEDUPE_SAMPLE_SIZE: usize = 1024;
+
+/// Whether the rows sampled from `ca` are repetitive enough for computing
+/// results once per distinct value to pay off.
+fn looks_low_cardinality<T>(ca: &ChunkedArray<T>) -> bool
+where
+    T: PolarsNumericType,
+    T::Native: Hash + Eq,
+{
+    let len = ca.len();
+    if len < 4 * DEDUPE_SAMPLE_SIZE {
+        return false;
+    }
+    let step = len / DEDUPE_SAMPLE_SIZE;
+    let mut distinct = PlHashSet::with_capacity(DEDUPE_SAMPLE_SIZE);
+    for i in (0..len).step_by(step).take(DEDUPE_SAMPLE_SIZE) {
+        if let Some(value) = ca.get(i) {
+            distinct.insert(value);
+        }
+    }
+    // Be conservative: a uniform sample underestimates the number of distinct
+    // values in the whole column.
+    distinct.len() * 8 <= DEDUPE_SAMPLE_SIZE
+}
+
+/// Apply `f` once to each distinct non-null value of `ca`, and gather the
+/// results of each of the columns it returns.
+///
+/// Returns `None` if `ca` turns out to have more than `DEDUPE_MAX_DISTINCT`
+/// distinct values, in which case the caller should apply `f` directly.
+fn dedupe_apply<T, U, F>(ca: &ChunkedArray<T>, f: F) -> PolarsResult<Option<Vec<ChunkedArray<U>>>>
+where
+    T: PolarsNumericType,
+    T::Native: Hash + Eq,
+    U: PolarsDataType,
+    ChunkedArray<U>: ChunkTake<IdxCa>,
+    F: Fn(&ChunkedArray<T>) -> PolarsResult<Vec<ChunkedArray<U>>>,
+{
+    let mut index: PlHashMap<T::Native, IdxSize> = PlHashMap::new();
+    let mut distinct = Vec::new();
+    let mut idx = Vec::with_capacity(ca.len());
+    for value in ca.iter() {
+        idx.push(value.map(|value| {
+            *index.entry(value).or_insert_with(|| {
+                distinct.push(value);
+                (distinct.len() - 1) as IdxSize
+            })
+        }));
+        if distinct.len() > DEDUPE_MAX_DISTINCT {
+            return Ok(None);
+        }
+    }
+    let idx = IdxCa::from_iter(idx);
+    let out = f(&ChunkedArray::from_vec(ca.name().clone(), distinct))?
+        .iter()
+        .map(|out| out.take(&idx))
+        .collect::<PolarsResult<Vec<_>>>()?;
+    Ok(Some(out))
+}
+
+/// Apply `f` to `ca`, computing it once per distinct value if `dedupe` is set.
+///
+/// If `dedupe` is `None`, a sample of `ca` decides. Either way, if there turn
+/// out to be too many distinct values to memoize, `f` is applied directly.
+pub(crate) fn maybe_dedupe_apply<T, U, F>(
+    ca: &ChunkedArray<T>,
+    dedupe: Option<bool>,
+    f: F,
+) -> PolarsResult<ChunkedArray<U>>
+where
+    T: PolarsNumericType,
+    T::Native: Hash + Eq,
+    U: PolarsDataType,
+    ChunkedArray<U>: ChunkTake<IdxCa>,
+    F: Fn(&ChunkedArray<T>) -> PolarsResult<ChunkedArray<U>>,
+{
+    let mut out = maybe_dedupe_apply_many(ca, dedupe, |ca| Ok(vec![f(ca)?]))?;
+    Ok(out.pop().unwrap())
+}
+
+/// Like `maybe_dedupe_apply`, for `f` which returns several columns.
+pub(crate) fn maybe_dedupe_apply_many<T, U, F>(
+    ca: &ChunkedArray<T>,
+    dedupe: Option<bool>,
+    f: F,
+) -> PolarsResult<Vec<ChunkedArray<U>>>
+where
+    T: PolarsNumericType,
+    T::Native: Hash + Eq,
+    U: PolarsDataType,
+    ChunkedArray<U>: ChunkTake<IdxCa>,
+    F: Fn(&ChunkedArray<T>) -> PolarsResult<Vec<ChunkedArray<U>>>,
+{
+    if dedupe.unwrap_or_else(|| looks_low_cardinality(ca)) {
+        if let Some(out) = dedupe_apply(ca, &f)? {
+            return Ok(out);
+        }
+    }
+    f(ca)
+}
@@ -18,3 +18,29 @@ def test_ceil() -> None:
     result = df.select(result=xdt.ceil("date_col", "1mo"))["result"]
     assert result[0] == datetime(2024, 9, 1, 0, 0, 0, 0)
     assert result[1] == datetime(2024, 10, 1, 0, 0, 0, 0)
+
+
+def test_ceil_date_and_tz_aware() -> None:
+    df = pl.DataFrame(
+        {
+            "date_col": pl.date_range(
+                datetime(2024, 1, 1), datetime(2024, 12, 31), "5d", eager=True
+            ),
+        }
+    ).with_columns(
+        datetime_col=pl.col("date_col")
+        .cast(pl.Datetime("us"))
+        .dt.offset_by("7h")
+        .dt.replace_time_zone("Europe/London"),
+    )
+    for col in ["date_col", "datetime_col"]:
+        expr = pl.col(col)
+        truncated = expr.dt.truncate("1mo")
+        expected = (
+            pl.when(expr == truncated)
+            .then(expr)
+            .otherwise(truncated.dt.offset_by("1mo"))
+        )
+        result = df.select(result=xdt.ceil(col, "1mo"), expected=expected)
+        assert result["result"].to_list() == result["expected"].to_list()
+        assert result["result"].dtype == df[col].dtype
@@ -34,3 +34,11 @@ def test_against_pandas_date(
     result = df.select(xdt.to_julian_date("a"))["a"].item()
     expected = pd.Timestamp(df["a"].item()).to_julian_date()
     assert result == expected
+
+
+def test_nulls() -> None:
+    df = pl.DataFrame(
+        {"a": [dt.datetime(2020, 1, 1, 12), None, dt.datetime(1970, 1, 1)]}
+    )
+    result = df.select(xdt.to_julian_date("a"))["a"]
+    assert result.to_list() == [2458850.0, None, 2440587.5]
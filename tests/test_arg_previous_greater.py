@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import hypothesis.strategies as st
+import polars as pl
+import pytest
+from hypothesis import given
+
+import polars_xdt as xdt
+
+
+def previous_greater(values: list[int | None]) -> list[int | None]:
+    result: list[int | None] = []
+    for i, value in enumerate(values):
+        if value is None or all(v is None for v in values[:i]):
+            result.append(None)
+            continue
+        result.append(
+            next(
+                (
+                    j
+                    for j in range(i - 1, -1, -1)
+                    if values[j] is not None and values[j] > value  # type: ignore[operator]
+                ),
+                i,
+            )
+        )
+    return result
+
+
+@given(
+    values=st.lists(
+        st.one_of(st.none(), st.integers(min_value=-5, max_value=5)),
+        min_size=1,
+        max_size=50,
+    ),
+)
+def test_against_brute_force(values: list[int | None]) -> None:
+    df = pl.DataFrame({"value": values}, schema={"value": pl.Int64})
+    index = previous_greater(values)
+    assert (
+        df.select(xdt.arg_previous_greater("value"))["value"].to_list() == index
+    )
+
+    dates = [
+        dt.date(2024, 1, 1) + dt.timedelta(days=3 * i)
+        for i in range(len(values))
+    ]
+    df = df.with_columns(date=pl.Series(dates))
+    result = df.select(
+        xdt.arg_previous_greater(
+            "value", fields=["index", "distance", "value", "delta"], by="date"
+        )
+    ).unnest("value")
+    assert result["index"].to_list() == index
+    assert result["distance"].to_list() == [
+        None if j is None else i - j for i, j in enumerate(index)
+    ]
+    assert result["value"].to_list() == [
+        None if j is None else values[j] for j in index
+    ]
+    assert result["delta"].to_list() == [
+        None if j is None else dates[i] - dates[j] for i, j in enumerate(index)
+    ]
+
+
+def test_fields_over_group() -> None:
+    df = pl.DataFrame(
+        {
+            "ts": [
+                dt.datetime(2024, 1, 1, 9),
+                dt.datetime(2024, 1, 1, 10),
+                dt.datetime(2024, 1, 1, 12),
+                dt.datetime(2024, 1, 1, 9),
+                dt.datetime(2024, 1, 1, 11),
+            ],
+            "group": ["a", "a", "a", "b", "b"],
+            "value": [5.0, 1.0, 3.0, 2.0, 1.0],
+        }
+    )
+    result = df.select(
+        xdt.arg_previous_greater("value", fields=["delta", "value"], by="ts")
+        .over("group")
+        .alias("previous")
+    ).unnest("previous")
+    assert result["delta"].to_list() == [
+        None,
+        dt.timedelta(hours=1),
+        dt.timedelta(hours=3),
+        None,
+        dt.timedelta(hours=2),
+    ]
+    assert result["value"].to_list() == [None, 5.0, 5.0, None, 2.0]
+
+
+def test_delta_requires_by() -> None:
+    with pytest.raises(ValueError, match="requires `by`"):
+        xdt.arg_previous_greater("value", fields=["delta"])
@@ -0,0 +1,16 @@
+import runpy
+from pathlib import Path
+
+import polars_xdt as xdt
+
+BENCH = Path(__file__).parent.parent / "benchmarks" / "bench.py"
+
+
+def test_bench_covers_functions() -> None:
+    cases = runpy.run_path(str(BENCH))["CASES"]
+    expected = {
+        name
+        for name in xdt.__all__
+        if name not in {"__version__", "profiling", "profiling_stats"}
+    }
+    assert expected - set(cases) == set()
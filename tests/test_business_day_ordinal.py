@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Literal
+
+import hypothesis.strategies as st
+import numpy as np
+import polars as pl
+import pytest
+from hypothesis import given
+
+import polars_xdt as xdt
+
+mapping = {"Mon": 1, "Tue": 2, "Wed": 3, "Thu": 4, "Fri": 5, "Sat": 6, "Sun": 7}
+reverse_mapping = {value: key for key, value in mapping.items()}
+
+
+@given(
+    dates=st.lists(
+        st.dates(
+            min_value=dt.date(1960, 1, 1), max_value=dt.date(2040, 12, 31)
+        ),
+        min_size=1,
+        max_size=50,
+    ),
+    weekend=st.lists(
+        st.sampled_from(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]),
+        min_size=0,
+        max_size=6,
+        unique=True,
+    ),
+    holidays=st.lists(
+        st.dates(
+            min_value=dt.date(1960, 1, 1), max_value=dt.date(2040, 12, 31)
+        ),
+        min_size=0,
+        max_size=50,
+    ),
+    roll=st.sampled_from(["forward", "backward"]),
+    every=st.integers(min_value=1, max_value=10),
+)
+def test_against_np_busday_count(
+    dates: list[dt.date],
+    weekend: list[str],
+    holidays: list[dt.date],
+    roll: Literal["forward", "backward"],
+    every: int,
+) -> None:
+    result = pl.DataFrame({"date": dates}).select(
+        xdt.business_day_ordinal(
+            "date",
+            every=every,
+            weekend=weekend,
+            holidays=holidays,
+            roll=roll,
+        )
+    )["date"]
+    weekmask = [0 if reverse_mapping[i] in weekend else 1 for i in range(1, 8)]
+    rolled = np.busday_offset(
+        dates, 0, roll=roll, weekmask=weekmask, holidays=holidays
+    )
+    epoch = np.datetime64("1970-01-01")
+    ordinals = np.where(
+        rolled >= epoch,
+        np.busday_count(epoch, rolled, weekmask=weekmask, holidays=holidays),
+        -np.busday_count(rolled, epoch, weekmask=weekmask, holidays=holidays),
+    )
+    assert result.to_list() == (ordinals // every).tolist()
+
+
+def test_datetime_local_date() -> None:
+    df = pl.DataFrame(
+        {
+            "ts": pl.datetime_range(
+                dt.datetime(2024, 1, 5, 22),
+                dt.datetime(2024, 1, 9, 3),
+                "12h",
+                eager=True,
+                time_zone="Asia/Kathmandu",
+            )
+        }
+    ).set_sorted("ts")
+    result = df.select(
+        xdt.business_day_ordinal("ts", roll="backward").alias("ordinal")
+    )["ordinal"]
+    local_dates = df["ts"].dt.date()
+    expected = np.busday_count(
+        "1970-01-01", np.busday_offset(local_dates, 0, roll="backward")
+    )
+    assert result.to_list() == expected.tolist()
+    assert result.is_sorted()
+
+
+def test_group_by_buckets() -> None:
+    df = pl.DataFrame(
+        {
+            "date": pl.date_range(
+                dt.date(2024, 1, 4), dt.date(2024, 1, 10), eager=True
+            ),
+            "sales": [1, 2, 3, 4, 5, 6, 7],
+        }
+    )
+    result = df.group_by(
+        xdt.business_day_ordinal("date", every=2).alias("bucket"),
+        maintain_order=True,
+    ).agg(pl.col("date").first(), pl.col("sales").sum())
+    expected = pl.DataFrame(
+        {
+            "bucket": pl.Series([7045, 7046, 7047], dtype=pl.Int32),
+            "date": [
+                dt.date(2024, 1, 4),
+                dt.date(2024, 1, 6),
+                dt.date(2024, 1, 10),
+            ],
+            "sales": [3, 18, 7],
+        }
+    )
+    assert result.equals(expected)
+
+
+def test_roll_raise() -> None:
+    df = pl.DataFrame({"date": [dt.date(2024, 1, 5), dt.date(2024, 1, 6)]})
+    with pytest.raises(pl.exceptions.ComputeError, match="not a business day"):
+        df.select(xdt.business_day_ordinal("date", roll="raise"))
+
+
+def test_roll_raise_skips_nulls() -> None:
+    # The null slot holds 1970-01-01, which was a Thursday.
+    df = pl.DataFrame({"date": [None, dt.date(2024, 1, 2)]})
+    weekend = ["Thu", "Sat", "Sun"]
+    result = df.select(
+        raise_=xdt.business_day_ordinal("date", weekend=weekend, roll="raise"),
+        forward=xdt.business_day_ordinal("date", weekend=weekend),
+    )
+    assert result["raise_"][0] is None
+    assert result["raise_"].to_list() == result["forward"].to_list()
+
+
+def test_invalid_every() -> None:
+    df = pl.DataFrame({"date": [dt.date(2024, 1, 5)]})
+    with pytest.raises(pl.exceptions.InvalidOperationError, match="every"):
+        df.select(xdt.business_day_ordinal("date", every=0))
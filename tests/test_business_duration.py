@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import hypothesis.strategies as st
+import numpy as np
+import polars as pl
+import pytest
+from hypothesis import given
+
+import polars_xdt as xdt
+
+mapping = {"Mon": 1, "Tue": 2, "Wed": 3, "Thu": 4, "Fri": 5, "Sat": 6, "Sun": 7}
+reverse_mapping = {value: key for key, value in mapping.items()}
+
+
+def reference(  # noqa: PLR0913
+    start: dt.datetime,
+    end: dt.datetime,
+    *,
+    open_time: dt.time,
+    close_time: dt.time,
+    weekend: list[str],
+    holidays: list[dt.date],
+) -> dt.timedelta:
+    if end < start:
+        return -reference(
+            end,
+            start,
+            open_time=open_time,
+            close_time=close_time,
+            weekend=weekend,
+            holidays=holidays,
+        )
+    weekmask = [0 if reverse_mapping[i] in weekend else 1 for i in range(1, 8)]
+    total = dt.timedelta()
+    day = start.date()
+    while day <= end.date():
+        if np.is_busday(day, weekmask=weekmask, holidays=holidays):
+            window_start = max(start, dt.datetime.combine(day, open_time))
+            window_end = min(end, dt.datetime.combine(day, close_time))
+            total += max(window_end - window_start, dt.timedelta())
+        day += dt.timedelta(days=1)
+    return total
+
+
+@given(
+    start=st.datetimes(
+        min_value=dt.datetime(1969, 6, 1), max_value=dt.datetime(1970, 6, 1)
+    ),
+    end=st.datetimes(
+        min_value=dt.datetime(1969, 6, 1), max_value=dt.datetime(1970, 6, 1)
+    ),
+    hours=st.tuples(
+        st.integers(min_value=0, max_value=11),
+        st.integers(min_value=12, max_value=23),
+    ),
+    weekend=st.lists(
+        st.sampled_from(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]),
+        min_size=0,
+        max_size=6,
+        unique=True,
+    ),
+    holidays=st.lists(
+        st.dates(min_value=dt.date(1969, 6, 1), max_value=dt.date(1970, 6, 1)),
+        min_size=0,
+        max_size=30,
+    ),
+)
+def test_against_reference(
+    start: dt.datetime,
+    end: dt.datetime,
+    hours: tuple[int, int],
+    weekend: list[str],
+    holidays: list[dt.date],
+) -> None:
+    open_time = dt.time(hours[0], 30)
+    close_time = dt.time(hours[1])
+    result = (
+        pl.DataFrame({"start": [start], "end": [end]})
+        .select(
+            xdt.business_duration(
+                "start",
+                "end",
+                open=open_time,
+                close=close_time,
+                weekend=weekend,
+                holidays=holidays,
+            )
+        )
+        .item()
+    )
+    expected = reference(
+        start,
+        end,
+        open_time=open_time,
+        close_time=close_time,
+        weekend=weekend,
+        holidays=holidays,
+    )
+    assert result == expected
+
+
+def test_time_zone() -> None:
+    df = pl.DataFrame(
+        {
+            "start": [dt.datetime(2024, 3, 8, 14)],
+            "end": [dt.datetime(2024, 3, 11, 15)],
+        }
+    ).with_columns(pl.all().dt.replace_time_zone("UTC"))
+    result = df.select(
+        xdt.business_duration(
+            "start", "end", time_zone="America/New_York"
+        ).alias("duration"),
+        pl.col("start")
+        .xdt.business_duration("end")  # type: ignore[attr-defined]
+        .alias("duration_utc"),
+    )
+    # 09:00-17:00 New York time, which is UTC-5 on Friday and UTC-4 on Monday:
+    # 09:00 to 17:00 on Friday and 09:00 to 11:00 on Monday.
+    assert result["duration"].item() == dt.timedelta(hours=10)
+    # 14:00 to 17:00 on Friday and 09:00 to 15:00 on Monday.
+    assert result["duration_utc"].item() == dt.timedelta(hours=9)
+
+
+def test_broadcast_and_nulls() -> None:
+    df = pl.DataFrame(
+        {
+            "start": [
+                dt.datetime(2024, 1, 8, 10),
+                None,
+                dt.datetime(2024, 1, 10, 10),
+            ]
+        }
+    )
+    result = df.select(
+        xdt.business_duration("start", pl.lit(dt.datetime(2024, 1, 10, 12)))
+    )["start"]
+    assert result.to_list() == [
+        dt.timedelta(hours=18),
+        None,
+        dt.timedelta(hours=2),
+    ]
+
+
+def test_invalid_hours() -> None:
+    df = pl.DataFrame(
+        {"start": [dt.datetime(2024, 1, 8)], "end": [dt.datetime(2024, 1, 9)]}
+    )
+    with pytest.raises(pl.exceptions.InvalidOperationError, match="open"):
+        df.select(
+            xdt.business_duration(
+                "start", "end", open=dt.time(17), close=dt.time(9)
+            )
+        )
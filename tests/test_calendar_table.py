@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import polars_xdt as xdt
+
+
+def test_against_polars() -> None:
+    start, end = dt.date(1899, 12, 25), dt.date(2101, 1, 5)
+    result = xdt.calendar_table(start, end)
+    dates = pl.date_range(start, end, eager=True)
+    expected = pl.DataFrame({"date": dates}).select(
+        "date",
+        year=pl.col("date").dt.year(),
+        quarter=pl.col("date").dt.quarter(),
+        month=pl.col("date").dt.month(),
+        day=pl.col("date").dt.day(),
+        weekday=pl.col("date").dt.weekday(),
+        day_of_year=pl.col("date").dt.ordinal_day(),
+        iso_year=pl.col("date").dt.iso_year(),
+        iso_week=pl.col("date").dt.week(),
+        julian_date=pl.col("date").cast(pl.Int32) + 2_440_587.5,
+        day_name=pl.col("date").dt.to_string("%A"),
+        month_name=pl.col("date").dt.to_string("%B"),
+        is_workday=pl.col("date").dt.weekday() <= 5,
+    )
+    assert_frame_equal(result.drop("business_day_ordinal"), expected)
+    epoch = np.datetime64("1970-01-01")
+    np_dates = dates.to_numpy()
+    ordinal = np.where(
+        np_dates >= epoch,
+        np.busday_count(epoch, np_dates),
+        -np.busday_count(np_dates, epoch),
+    )
+    assert result["business_day_ordinal"].to_list() == ordinal.tolist()
+
+
+def test_locales_and_calendars() -> None:
+    holidays = [dt.date(2024, 1, 1)]
+    result = xdt.calendar_table(
+        dt.date(2023, 12, 29),
+        dt.date(2024, 1, 2),
+        fields=["month_name", "is_workday"],
+        locales=["fr_FR", "uk_UA"],
+        calendars={
+            "uk": (("Sat", "Sun"), holidays),
+            "plain": (("Sat", "Sun"), None),
+        },
+    )
+    assert result.columns == [
+        "month_name_fr_FR",
+        "month_name_uk_UA",
+        "is_workday_uk",
+        "is_workday_plain",
+    ]
+    assert result["month_name_fr_FR"].to_list() == [
+        "décembre",
+        "décembre",
+        "décembre",
+        "janvier",
+        "janvier",
+    ]
+    assert result["is_workday_uk"].to_list() == [
+        True,
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert result["is_workday_plain"].to_list() == [
+        True,
+        False,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_invalid_field() -> None:
+    with pytest.raises(pl.exceptions.InvalidOperationError, match="field"):
+        xdt.calendar_table(
+            dt.date(2024, 1, 1),
+            dt.date(2024, 1, 2),
+            fields=["week"],  # type: ignore[list-item]
+        )
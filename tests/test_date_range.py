@@ -91,3 +91,21 @@ def test_eager_custom_holiday() -> None:
         ],
     )
     assert_series_equal(result, expected)
+
+
+def test_eager_holiday_series() -> None:
+    holidays = pl.Series([date(2023, 1, 2), date(2023, 1, 9)])
+    result = xdt.date_range(
+        date(2023, 1, 1), date(2023, 1, 10), eager=True, holidays=holidays
+    )
+    expected = pl.Series(
+        "literal",
+        [
+            date(2023, 1, 3),
+            date(2023, 1, 4),
+            date(2023, 1, 5),
+            date(2023, 1, 6),
+            date(2023, 1, 10),
+        ],
+    )
+    assert_series_equal(result, expected)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import polars as pl
+import pytest
+
+import polars_xdt as xdt
+
+WEEKS = {"445": (4, 4, 5), "454": (4, 5, 4), "544": (5, 4, 4)}
+
+
+def _year_start(fiscal_year: int, start_month: int, scheme: str) -> date:
+    anchor = date(fiscal_year - (start_month != 1), start_month, 1)
+    if scheme == "month":
+        return anchor
+    # Weeks start on Sunday, and years on the Sunday nearest the anchor.
+    back = (anchor.isoweekday() % 7 + 7) % 7
+    return anchor - timedelta(days=back - 7 if back > 3 else back)
+
+
+def _fiscal_period(d: date, start_month: int, scheme: str) -> dict[str, int]:
+    fiscal_year = d.year + 1
+    while _year_start(fiscal_year, start_month, scheme) > d:
+        fiscal_year -= 1
+    week = (d - _year_start(fiscal_year, start_month, scheme)).days // 7
+    if scheme == "month":
+        period = (d.month - start_month) % 12
+        quarter = period // 3
+    else:
+        quarter = min(week // 13, 3)
+        first, second, _ = WEEKS[scheme]
+        week_of_quarter = week - 13 * quarter
+        period = (
+            3 * quarter
+            + (week_of_quarter >= first)
+            + (week_of_quarter >= first + second)
+        )
+    return {
+        "fiscal_year": fiscal_year,
+        "fiscal_quarter": quarter + 1,
+        "fiscal_period": period + 1,
+        "fiscal_week": week + 1,
+    }
+
+
+@pytest.mark.parametrize("scheme", ["month", "445", "454", "544"])
+@pytest.mark.parametrize("start_month", [1, 2, 10])
+def test_fiscal_period(scheme: str, start_month: int) -> None:
+    dates = pl.date_range(
+        date(1995, 1, 1), date(2035, 12, 31), "3d", eager=True
+    )
+    result = pl.select(
+        xdt.fiscal_period(
+            dates,
+            start_month=start_month,
+            scheme=scheme,  # type: ignore[arg-type]
+            week_start="Sun",
+        )
+    ).to_series()
+    expected = [_fiscal_period(d, start_month, scheme) for d in dates]
+    assert result.to_list() == expected
+
+
+def test_fiscal_period_nulls_and_datetimes() -> None:
+    s = pl.Series([None, "2024-02-04 23:30"]).str.to_datetime()
+    result = pl.select(
+        xdt.fiscal_period(s.dt.replace_time_zone("America/New_York"))
+    ).to_series()
+    assert result.to_list() == [
+        None,
+        {
+            "fiscal_year": 2024,
+            "fiscal_quarter": 1,
+            "fiscal_period": 2,
+            "fiscal_week": 5,
+        },
+    ]
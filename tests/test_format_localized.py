@@ -93,3 +93,87 @@ def test_pre_epoch(time_unit: Any) -> None:
         result=xdt.format_localized("date_col", "%A, %d %B %Y %z", "en_US")
     )
     assert result["result"][0] == "Friday, 01 January 1960 +0000"
+
+
+def test_format_localized_nulls() -> None:
+    df = pl.DataFrame(
+        {
+            "date_col": [date(2024, 8, 24), None, date(2024, 10, 1), None],
+        },
+    )
+    result = df.select(
+        result=xdt.format_localized("date_col", "%A, %d %B %Y", "en_US")
+    )["result"]
+    assert result.to_list() == [
+        "Saturday, 24 August 2024",
+        None,
+        "Tuesday, 01 October 2024",
+        None,
+    ]
+
+
+@pytest.mark.parametrize(
+    ("value", "dtype"),
+    [
+        (10**9, pl.Date()),
+        (2**62, pl.Datetime("ms")),
+        (2**62, pl.Datetime("us")),
+    ],
+)
+@pytest.mark.parametrize("fmt", ["%Y-%m-%d", ["%Y", "%m"]])
+def test_format_localized_out_of_range(
+    value: int, dtype: pl.DataType, fmt: Any
+) -> None:
+    # Beyond the years which chrono supports.
+    s = pl.Series([value]).cast(dtype)
+    with pytest.raises(pl.exceptions.ComputeError, match="out of range"):
+        pl.select(xdt.format_localized(s, fmt, "en_US"))
+
+
+@pytest.mark.parametrize("dedupe", [True, False, None])
+def test_format_localized_dedupe(dedupe: Any) -> None:
+    # Few distinct values, repeated many times.
+    s = pl.datetime_range(
+        datetime(2024, 1, 1), datetime(2024, 1, 3), "1h", eager=True
+    ).sample(20_000, with_replacement=True, seed=0)
+    s = s.scatter(range(0, len(s), 7), None)
+    result = pl.select(
+        xdt.format_localized(s, "%A %H:%M", "en_US", dedupe=dedupe)
+    ).to_series()
+    expected = s.dt.strftime("%A %H:%M")
+    assert result.to_list() == expected.to_list()
+
+
+@pytest.mark.parametrize("dedupe", [True, False, None])
+def test_format_localized_many(dedupe: Any) -> None:
+    df = pl.DataFrame(
+        {"date_col": [datetime(2024, 8, 24, 13), None, datetime(2024, 10, 1)]},
+        schema={"date_col": pl.Datetime("us", "Europe/London")},
+    )
+    result = df.select(
+        xdt.format_localized(
+            "date_col",
+            {
+                "long": "%A, %d %B %Y %z",
+                "short": ("%a %H:%M", "en_US"),
+            },
+            dedupe=dedupe,
+        )
+    ).unnest("date_col")
+    expected = df.select(
+        long=xdt.format_localized("date_col", "%A, %d %B %Y %z"),
+        short=xdt.format_localized("date_col", "%a %H:%M", "en_US"),
+    )
+    assert result.to_dicts() == expected.to_dicts()
+
+
+def test_format_localized_many_date() -> None:
+    df = pl.DataFrame({"date_col": [date(2024, 8, 24), date(2024, 10, 1)]})
+    result = df.select(
+        xdt.format_localized("date_col", ["%d %B %Y", "%A"])
+    ).unnest("date_col")
+    assert result.columns == ["%d %B %Y", "%A"]
+    assert result.rows() == [
+        ("24 серпня 2024", "субота"),
+        ("01 жовтня 2024", "вівторок"),
+    ]
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import polars as pl
+import pytest
+from polars.testing import assert_series_equal
+
+import polars_xdt as xdt
+
+
+def test_us_holidays() -> None:
+    rules = [
+        {"month": 1, "day": 1, "observed": "nearest_weekday"},
+        {"month": 5, "weekday": "Mon", "n": -1},
+        {"month": 7, "day": 4, "observed": "nearest_weekday"},
+        {"month": 11, "weekday": "Thu", "n": 4},
+    ]
+    result = xdt.generate_holidays(rules, 2026, 2027)
+    expected = pl.Series(
+        "holidays",
+        [
+            dt.date(2026, 1, 1),
+            dt.date(2026, 5, 25),
+            dt.date(2026, 7, 3),
+            dt.date(2026, 11, 26),
+            dt.date(2027, 1, 1),
+            dt.date(2027, 5, 31),
+            dt.date(2027, 7, 5),
+            dt.date(2027, 11, 25),
+        ],
+    )
+    assert_series_equal(result, expected)
+
+
+def test_next_weekday_skips_earlier_holidays() -> None:
+    rules = [
+        {"month": 12, "day": 25, "observed": "next_weekday"},
+        {"month": 12, "day": 26, "observed": "next_weekday"},
+    ]
+    result = xdt.generate_holidays(rules, 2020, 2022)
+    expected = pl.Series(
+        "holidays",
+        [
+            dt.date(2020, 12, 25),
+            dt.date(2020, 12, 28),
+            dt.date(2021, 12, 27),
+            dt.date(2021, 12, 28),
+            dt.date(2022, 12, 26),
+            dt.date(2022, 12, 27),
+        ],
+    )
+    assert_series_equal(result, expected)
+
+
+def test_easter() -> None:
+    result = xdt.generate_holidays([{"easter": 0}], 1999, 2026)
+    expected = [
+        dt.date(1999, 4, 4),
+        dt.date(2000, 4, 23),
+        dt.date(2001, 4, 15),
+        dt.date(2002, 3, 31),
+        dt.date(2003, 4, 20),
+        dt.date(2004, 4, 11),
+        dt.date(2005, 3, 27),
+        dt.date(2006, 4, 16),
+        dt.date(2007, 4, 8),
+        dt.date(2008, 3, 23),
+        dt.date(2009, 4, 12),
+        dt.date(2010, 4, 4),
+        dt.date(2011, 4, 24),
+        dt.date(2012, 4, 8),
+        dt.date(2013, 3, 31),
+        dt.date(2014, 4, 20),
+        dt.date(2015, 4, 5),
+        dt.date(2016, 3, 27),
+        dt.date(2017, 4, 16),
+        dt.date(2018, 4, 1),
+        dt.date(2019, 4, 21),
+        dt.date(2020, 4, 12),
+        dt.date(2021, 4, 4),
+        dt.date(2022, 4, 17),
+        dt.date(2023, 4, 9),
+        dt.date(2024, 3, 31),
+        dt.date(2025, 4, 20),
+        dt.date(2026, 4, 5),
+    ]
+    assert result.to_list() == expected
+    good_friday = xdt.generate_holidays([{"easter": -2}], 2024, 2024)
+    assert good_friday.to_list() == [dt.date(2024, 3, 29)]
+
+
+def test_custom_weekend() -> None:
+    # With a Friday-Saturday weekend, Friday holidays move to Thursday.
+    rules = [{"month": 1, "day": 1, "observed": "nearest_weekday"}]
+    result = xdt.generate_holidays(rules, 2027, 2027, weekend=["Fri", "Sat"])
+    assert result.to_list() == [dt.date(2026, 12, 31)]
+
+
+def test_missing_dates_are_skipped() -> None:
+    result = xdt.generate_holidays([{"month": 2, "day": 29}], 2023, 2024)
+    assert result.to_list() == [dt.date(2024, 2, 29)]
+    result = xdt.generate_holidays(
+        [{"month": 2, "weekday": "Thu", "n": 5}], 2023, 2024
+    )
+    assert result.to_list() == [dt.date(2024, 2, 29)]
+
+
+def test_with_is_workday() -> None:
+    holidays = xdt.generate_holidays([{"month": 12, "day": 25}], 2024, 2025)
+    df = pl.DataFrame(
+        {"date": [dt.date(2024, 12, 24), dt.date(2024, 12, 25)]},
+    )
+    result = df.select(xdt.is_workday("date", holidays=holidays.to_list()))[
+        "date"
+    ]
+    assert result.to_list() == [True, False]
+
+
+def test_invalid_rule() -> None:
+    with pytest.raises(ValueError, match="Holiday rule must have"):
+        xdt.generate_holidays([{"month": 1}], 2024, 2024)
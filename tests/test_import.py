@@ -0,0 +1,17 @@
+import subprocess
+import sys
+
+
+def test_import_is_lazy() -> None:
+    code = (
+        "import sys, polars as pl, polars_xdt;"
+        "print(sorted(m for m in sys.modules if m.startswith('polars_xdt')));"
+        "pl.col('a').xdt.month_name();"
+        "print('polars_xdt.functions' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    modules, functions_loaded = result.stdout.splitlines()
+    assert modules == "['polars_xdt', 'polars_xdt.namespace']"
+    assert functions_loaded == "True"
@@ -5,6 +5,8 @@ import datetime as dt
 import hypothesis.strategies as st
 import numpy as np
 import polars as pl
+import pyarrow as pa
+import pytest
 from hypothesis import given
 
 import polars_xdt as xdt
@@ -84,3 +86,45 @@ def test_against_np_is_busday_datetime(
     date = dt.date(datetime.year, datetime.month, datetime.day)
     expected = np.is_busday(date, weekmask=weekmask, holidays=holidays)
     assert result == expected
+
+
+def test_is_workday_sorted() -> None:
+    # Sorted input walks through the holidays instead of searching them.
+    dates = pl.date_range(dt.date(1999, 6, 1), dt.date(2001, 6, 1), eager=True)
+    holidays = [dt.date(2000, 12, 25), dt.date(2000, 1, 1), dt.date(2001, 1, 1)]
+    for s in (dates, dates.reverse(), dates.shuffle(seed=0)):
+        result = pl.select(xdt.is_workday(s, holidays=holidays)).to_series()
+        expected = np.is_busday(s.to_numpy(), holidays=holidays)
+        assert result.to_list() == expected.tolist()
+
+
+def test_is_workday_holiday_inputs() -> None:
+    # Series and arrays are used as they are, without Python date objects.
+    dates = pl.date_range(
+        dt.date(2023, 12, 20), dt.date(2024, 1, 5), eager=True
+    )
+    holidays = [
+        dt.date(2024, 1, 1),
+        dt.date(2023, 12, 25),
+        dt.date(2023, 12, 26),
+    ]
+    expected = np.is_busday(dates.to_numpy(), holidays=holidays).tolist()
+    for holidays_input in (
+        pl.Series(holidays),
+        np.array(holidays, dtype="datetime64[D]"),
+        pa.array(holidays, type=pa.date32()),
+        pa.chunked_array([holidays[:1], holidays[1:]], type=pa.date32()),
+    ):
+        result = pl.select(xdt.is_workday(dates, holidays=holidays_input))
+        assert result.to_series().to_list() == expected
+
+
+def test_all_weekend() -> None:
+    weekend = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    msg = "At least one day of the week must be a business day"
+    with pytest.raises(ValueError, match=msg):
+        xdt.is_workday("date", weekend=weekend)
+    with pytest.raises(ValueError, match=msg):
+        xdt.business_day_ordinal("date", weekend=weekend)
+    with pytest.raises(ValueError, match=msg):
+        xdt.rolling_business("value", by="date", window=5, weekend=weekend)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import polars_xdt as xdt
+
+
+@pytest.mark.parametrize("time_unit", ["ms", "us", "ns"])
+def test_local_fields(time_unit: str) -> None:
+    df = pl.DataFrame(
+        {
+            "date": [
+                datetime(2020, 3, 29, 0, 30, tzinfo=timezone.utc),
+                datetime(2020, 3, 29, 1, 30, tzinfo=timezone.utc),
+                datetime(2020, 10, 25, 0, 59, tzinfo=timezone.utc),
+                datetime(2020, 10, 25, 1, 0, tzinfo=timezone.utc),
+                datetime(1969, 12, 31, 23, 0, tzinfo=timezone.utc),
+                None,
+            ],
+            "timezone": [
+                "Europe/London",
+                "Europe/London",
+                "America/New_York",
+                "Asia/Kathmandu",
+                "Pacific/Kiritimati",
+                "UTC",
+            ],
+        },
+        schema_overrides={"date": pl.Datetime(time_unit, "UTC")},  # type: ignore[arg-type]
+    )
+    result = df.select(
+        xdt.local_fields("date", pl.col("timezone")).alias("fields")
+    ).unnest("fields")
+    frames = []
+    for i, time_zone in enumerate(df["timezone"]):
+        local = pl.col("date").dt.convert_time_zone(time_zone)
+        frames.append(
+            df.slice(i, 1).select(
+                date=local.dt.date(),
+                hour=local.dt.hour(),
+                weekday=local.dt.weekday(),
+                utc_offset=(
+                    local.dt.base_utc_offset() + local.dt.dst_offset()
+                ).cast(pl.Duration(time_unit)),  # type: ignore[arg-type]
+                is_dst=local.dt.dst_offset() != pl.duration(),
+            )
+        )
+    expected = pl.concat(frames)
+    assert_frame_equal(result, expected)
+
+
+def test_local_fields_subset() -> None:
+    df = pl.DataFrame(
+        {"date": [datetime(2020, 10, 10, 23, tzinfo=timezone.utc)]}
+    )
+    result = df.lazy().select(
+        xdt.local_fields("date", "Asia/Tokyo", fields=["weekday", "date"])
+    )
+    assert result.collect_schema()["date"] == pl.Struct(
+        {"weekday": pl.Int8, "date": pl.Date}
+    )
+    assert result.collect()["date"].to_list() == [
+        {"weekday": 7, "date": datetime(2020, 10, 11).date()}
+    ]
+
+
+def test_local_fields_invalid() -> None:
+    df = pl.DataFrame({"date": [datetime(2020, 10, 10, 23)]})
+    with pytest.raises(pl.exceptions.InvalidOperationError, match="minute"):
+        df.select(xdt.local_fields("date", "UTC", fields=["minute"]))  # type: ignore[list-item]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import polars as pl
+import pytest
+from polars.testing import assert_series_equal
+
+import polars_xdt as xdt
+
+TIME_ZONES = ["Europe/London", "Africa/Kigali", "America/New_York", "UTC"]
+
+
+@pytest.mark.parametrize("every", ["1h", "1d", "1w", "1mo", "1q"])
+@pytest.mark.parametrize("time_unit", ["ms", "us", "ns"])
+def test_local_truncate_and_ceil(every: str, time_unit: str) -> None:
+    df = pl.DataFrame(
+        {
+            "date": [
+                datetime(2020, 3, 29, 0, 30, tzinfo=timezone.utc),
+                datetime(2020, 10, 25, 1, 15, tzinfo=timezone.utc),
+                datetime(2020, 11, 1, 6, 0, tzinfo=timezone.utc),
+                datetime(2021, 1, 1, tzinfo=timezone.utc),
+                None,
+            ],
+        },
+        schema={"date": pl.Datetime(time_unit, "UTC")},  # type: ignore[arg-type]
+    )
+    for time_zone in TIME_ZONES:
+        local = pl.col("date").dt.convert_time_zone(time_zone)
+        truncated = local.dt.truncate(every)
+        ceiled = (
+            pl.when(local == truncated)
+            .then(local)
+            .otherwise(truncated.dt.offset_by(every))
+        )
+        expected = df.select(
+            truncated=truncated.dt.convert_time_zone("UTC"),
+            ceiled=ceiled.dt.convert_time_zone("UTC"),
+        )
+        result = df.with_columns(timezone=pl.lit(time_zone)).select(
+            truncated=xdt.local_truncate("date", every, pl.col("timezone")),
+            ceiled=xdt.local_ceil("date", every, pl.col("timezone")),
+        )
+        assert_series_equal(result["truncated"], expected["truncated"])
+        assert_series_equal(result["ceiled"], expected["ceiled"])
+
+
+def test_local_truncate_per_row_time_zone() -> None:
+    df = pl.DataFrame(
+        {
+            "date": [datetime(2020, 10, 10, 3, tzinfo=timezone.utc)] * 4,
+            "timezone": [
+                "Europe/London",
+                "Africa/Kigali",
+                None,
+                "America/New_York",
+            ],
+        }
+    )
+    result = df.select(xdt.local_truncate("date", "1d", pl.col("timezone")))[
+        "date"
+    ]
+    expected = pl.Series(
+        "date",
+        [
+            datetime(2020, 10, 9, 23, tzinfo=timezone.utc),
+            datetime(2020, 10, 9, 22, tzinfo=timezone.utc),
+            None,
+            datetime(2020, 10, 9, 4, tzinfo=timezone.utc),
+        ],
+    )
+    assert_series_equal(result, expected)
+
+
+def test_local_truncate_negative_every() -> None:
+    df = pl.DataFrame({"date": [datetime(2020, 10, 10, 3)]})
+    with pytest.raises(pl.exceptions.ComputeError, match="negative duration"):
+        df.select(xdt.local_truncate("date", "-1d", "Europe/London"))
+
+
+def test_local_truncate_time_zone_length_mismatch() -> None:
+    dates = pl.Series([datetime(2020, 10, 10, 3, tzinfo=timezone.utc)] * 3)
+    time_zones = pl.Series(["Europe/London", "Asia/Tokyo"])
+    with pytest.raises(
+        pl.exceptions.ShapeError,
+        match="expected time zone column of length 1 or 3, got 2",
+    ):
+        pl.select(xdt.local_truncate(dates, "1d", pl.lit(time_zones)))
@@ -44,6 +44,19 @@ def test_month_delta_hypothesis(start_date: date, end_date: date) -> None:
     assert result == expected
 
 
+def test_month_delta_sorted() -> None:
+    dates = pl.date_range(date(2019, 11, 15), date(2024, 4, 15), eager=True)
+    end_date = date(2022, 2, 28)
+    for start_date in (dates, dates.reverse()):
+        result = pl.select(xdt.month_delta(start_date, end_date)).to_series()
+        expected = [
+            relativedelta(end_date, start).years * 12
+            + relativedelta(end_date, start).months
+            for start in start_date
+        ]
+        assert result.to_list() == expected
+
+
 def test_month_delta_broadcasting() -> None:
     df = pl.DataFrame(
         {
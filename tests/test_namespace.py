@@ -0,0 +1,43 @@
+import inspect
+from datetime import date
+
+import polars as pl
+
+import polars_xdt as xdt
+from polars_xdt.namespace import ExprXDTNamespace
+
+
+def test_namespace_matches_functions() -> None:
+    methods = {
+        name
+        for name, _ in inspect.getmembers(ExprXDTNamespace, inspect.isfunction)
+        if not name.startswith("_")
+    }
+    expected = {
+        name
+        for name in xdt.__all__
+        if name
+        not in {
+            "__version__",
+            "calendar_table",
+            "date_range",
+            "generate_holidays",
+            "profiling",
+            "profiling_stats",
+        }
+    }
+    assert methods == expected
+    for name in methods:
+        method = inspect.signature(getattr(ExprXDTNamespace, name))
+        function = inspect.signature(getattr(xdt, name))
+        assert list(method.parameters)[1:] == list(function.parameters)[1:]
+
+
+def test_namespace_builds_same_expression() -> None:
+    holidays = [date(2024, 1, 1), date(2024, 12, 25)]
+    xdt_ns = pl.col("a").xdt  # type: ignore[attr-defined]
+    result = xdt_ns.is_workday(weekend=("Fri", "Sat"), holidays=holidays)
+    expected = xdt.is_workday("a", weekend=("Fri", "Sat"), holidays=holidays)
+    assert result.meta.eq(expected)
+    result = xdt_ns.month_delta("b")
+    assert result.meta.eq(xdt.month_delta("a", "b"))
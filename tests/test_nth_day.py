@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import calendar
+import datetime as dt
+
+import hypothesis.strategies as st
+import numpy as np
+import polars as pl
+import pytest
+from hypothesis import given
+
+import polars_xdt as xdt
+
+mapping = {"Mon": 1, "Tue": 2, "Wed": 3, "Thu": 4, "Fri": 5, "Sat": 6, "Sun": 7}
+reverse_mapping = {value: key for key, value in mapping.items()}
+
+n_values = st.integers(min_value=-25, max_value=25).filter(lambda n: n != 0)
+
+
+def month_days(date: dt.date) -> list[dt.date]:
+    _, n_days = calendar.monthrange(date.year, date.month)
+    return [date.replace(day=day) for day in range(1, n_days + 1)]
+
+
+def nth(days: list[dt.date], n: int) -> dt.date | None:
+    index = n - 1 if n > 0 else len(days) + n
+    return days[index] if 0 <= index < len(days) else None
+
+
+@given(
+    date=st.dates(
+        min_value=dt.date(1900, 1, 1), max_value=dt.date(2100, 12, 31)
+    ),
+    weekday=st.sampled_from(list(mapping)),
+    n=st.integers(min_value=-6, max_value=6).filter(lambda n: n != 0),
+)
+def test_nth_weekday_of_month(date: dt.date, weekday: str, n: int) -> None:
+    result = (
+        pl.DataFrame({"date": [date]})
+        .select(xdt.nth_weekday_of_month("date", weekday, n))
+        .item()
+    )
+    days = [d for d in month_days(date) if d.isoweekday() == mapping[weekday]]
+    assert result == nth(days, n)
+
+
+@given(
+    date=st.dates(
+        min_value=dt.date(1960, 1, 1), max_value=dt.date(2040, 12, 31)
+    ),
+    n=n_values,
+    weekend=st.lists(
+        st.sampled_from(list(mapping)), min_size=0, max_size=6, unique=True
+    ),
+    holidays=st.lists(
+        st.dates(
+            min_value=dt.date(1960, 1, 1), max_value=dt.date(2040, 12, 31)
+        ),
+        min_size=0,
+        max_size=100,
+    ),
+)
+def test_nth_business_day_of_month(
+    date: dt.date, n: int, weekend: list[str], holidays: list[dt.date]
+) -> None:
+    result = (
+        pl.DataFrame({"date": [date]})
+        .select(
+            xdt.nth_business_day_of_month(
+                "date", n, weekend=weekend, holidays=holidays
+            )
+        )
+        .item()
+    )
+    weekmask = [0 if reverse_mapping[i] in weekend else 1 for i in range(1, 8)]
+    days = [
+        d
+        for d in month_days(date)
+        if np.is_busday(d, weekmask=weekmask, holidays=holidays)
+    ]
+    assert result == nth(days, n)
+
+
+def test_datetime_and_nulls() -> None:
+    df = pl.DataFrame(
+        {"ts": [dt.datetime(2024, 3, 31, 23, 30), None]}
+    ).with_columns(pl.col("ts").dt.replace_time_zone("Asia/Tokyo"))
+    result = df.select(
+        pl.col("ts").xdt.nth_business_day_of_month(-1)  # type: ignore[attr-defined]
+    )["ts"]
+    assert result.to_list() == [dt.date(2024, 3, 29), None]
+
+
+def test_zero() -> None:
+    df = pl.DataFrame({"date": [dt.date(2024, 1, 1)]})
+    with pytest.raises(pl.exceptions.InvalidOperationError, match="zero"):
+        df.select(xdt.nth_weekday_of_month("date", "Mon", 0))
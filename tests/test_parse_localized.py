@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+
+import polars as pl
+import pytest
+
+import polars_xdt as xdt
+
+
+@pytest.mark.parametrize(
+    ("locale", "fmt"),
+    [
+        ("fr_FR", "%A, %d %B %Y %H:%M"),
+        ("de_DE", "%a %d %b %Y %H:%M"),
+        ("uk_UA", "%A, %d %B %Y %H:%M"),
+        ("ja_JP", "%Y年%m月%d日 %A %p %I:%M"),
+        ("en_US", "%a %d %b %Y %I:%M %p"),
+    ],
+)
+def test_parse_localized_roundtrip(locale: str, fmt: str) -> None:
+    dates = pl.datetime_range(
+        datetime(2024, 1, 1, 0, 30), datetime(2024, 12, 31), "37h", eager=True
+    )
+    formatted = pl.select(xdt.format_localized(dates, fmt, locale)).to_series()
+    result = pl.select(xdt.parse_localized(formatted, fmt, locale)).to_series()
+    assert result.to_list() == dates.to_list()
+
+
+def test_parse_localized_case_insensitive() -> None:
+    df = pl.DataFrame(
+        {"a": ["SAMEDI 24 AOÛT 2024", "mardi 1 Octobre 2024", None]}
+    )
+    result = df.select(xdt.parse_localized("a", "%A %d %B %Y", "fr_FR"))["a"]
+    assert result.to_list() == [
+        datetime(2024, 8, 24),
+        datetime(2024, 10, 1),
+        None,
+    ]
+
+
+def test_parse_localized_abbreviation_without_period() -> None:
+    # fr_FR abbreviates October as "oct." and Tuesday as "mar.".
+    df = pl.DataFrame({"a": ["mar. 1 oct. 2024", "Mar 1 Oct 2024"]})
+    result = df.select(xdt.parse_localized("a", "%a %d %b %Y", "fr_FR"))["a"]
+    assert result.to_list() == [datetime(2024, 10, 1), datetime(2024, 10, 1)]
+
+
+def test_parse_localized_no_am_pm_names() -> None:
+    df = pl.DataFrame({"a": ["01.10.2024 01:00"]})
+    with pytest.raises(
+        pl.exceptions.ComputeError, match="locale 'de_DE' has no AM/PM names"
+    ):
+        df.select(xdt.parse_localized("a", "%d.%m.%Y %I:%M %p", "de_DE"))
+
+
+def test_parse_localized_strict() -> None:
+    df = pl.DataFrame({"a": ["24 août 2024", "24 août", "24 foo 2024"]})
+    result = df.select(
+        xdt.parse_localized(
+            "a", "%d %B %Y", "fr_FR", time_unit="ms", strict=False
+        )
+    )["a"]
+    assert result.dtype == pl.Datetime("ms")
+    assert result.to_list() == [datetime(2024, 8, 24), None, None]
+    with pytest.raises(
+        pl.exceptions.ComputeError, match="could not parse '24 foo"
+    ):
+        df.select(xdt.parse_localized("a", "%d %B %Y", "fr_FR"))
+
+
+def test_parse_localized_offset() -> None:
+    df = pl.DataFrame({"a": ["24 août 2024 10:00 +0200"]})
+    result = df.select(xdt.parse_localized("a", "%d %B %Y %H:%M %z", "fr_FR"))[
+        "a"
+    ]
+    assert result.dtype == pl.Datetime("us", "UTC")
+    assert result.to_list() == [datetime(2024, 8, 24, 8, tzinfo=timezone.utc)]
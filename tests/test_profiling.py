@@ -0,0 +1,23 @@
+from datetime import date
+
+import polars as pl
+
+import polars_xdt as xdt
+
+
+def test_profiling() -> None:
+    df = pl.DataFrame(
+        {"date": pl.date_range(date(2024, 1, 1), date(2024, 3, 31), eager=True)}
+    )
+    with xdt.profiling():
+        df.select(xdt.is_workday("date"))
+        df.select(xdt.is_workday("date"), xdt.to_julian_date("date"))
+    result = xdt.profiling_stats().sort("function")
+    assert result["function"].to_list() == ["is_workday", "to_julian_date"]
+    assert result["calls"].to_list() == [2, 1]
+    assert result["rows"].to_list() == [182, 91]
+    assert (result["wall_time_ns"] > 0).all()
+
+    # Nothing is recorded outside of the context.
+    df.select(xdt.is_workday("date"))
+    assert xdt.profiling_stats().sort("function")["calls"].to_list() == [2, 1]
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import TYPE_CHECKING, Any, Literal
+
+import hypothesis.strategies as st
+import numpy as np
+import polars as pl
+import pytest
+from hypothesis import given
+
+import polars_xdt as xdt
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+mapping = {"Mon": 1, "Tue": 2, "Wed": 3, "Thu": 4, "Fri": 5, "Sat": 6, "Sun": 7}
+reverse_mapping = {value: key for key, value in mapping.items()}
+
+
+def _reference(
+    ordinals: np.ndarray[Any, Any],
+    values: list[int | None],
+    window: int,
+    agg: Literal["sum", "mean", "min", "max"],
+) -> list[float | None]:
+    functions: dict[str, Callable[[list[int]], float]] = {
+        "sum": sum,
+        "mean": lambda values: sum(values) / len(values),
+        "min": min,
+        "max": max,
+    }
+    result: list[float | None] = []
+    for i, ordinal in enumerate(ordinals):
+        in_window = [
+            value
+            for value, other in zip(values[: i + 1], ordinals[: i + 1])
+            if value is not None and other > ordinal - window
+        ]
+        result.append(functions[agg](in_window) if in_window else None)
+    return result
+
+
+@given(
+    data=st.lists(
+        st.tuples(
+            st.dates(
+                min_value=dt.date(1960, 1, 1), max_value=dt.date(1960, 3, 31)
+            ),
+            st.none() | st.integers(min_value=-100, max_value=100),
+        ),
+        min_size=1,
+        max_size=50,
+    ),
+    window=st.integers(min_value=1, max_value=30),
+    agg=st.sampled_from(["sum", "mean", "min", "max"]),
+    weekend=st.lists(
+        st.sampled_from(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]),
+        min_size=0,
+        max_size=6,
+        unique=True,
+    ),
+    holidays=st.lists(
+        st.dates(min_value=dt.date(1960, 1, 1), max_value=dt.date(1960, 3, 31)),
+        min_size=0,
+        max_size=20,
+    ),
+)
+def test_against_reference(
+    data: list[tuple[dt.date, int | None]],
+    window: int,
+    agg: Literal["sum", "mean", "min", "max"],
+    weekend: list[str],
+    holidays: list[dt.date],
+) -> None:
+    data = sorted(data, key=lambda row: row[0])
+    dates = [date for date, _ in data]
+    values = [value for _, value in data]
+    result = pl.DataFrame(
+        {"date": dates, "value": values}, schema_overrides={"value": pl.Int64}
+    ).select(
+        xdt.rolling_business(
+            "value",
+            by="date",
+            window=f"{window}bd",
+            agg=agg,
+            weekend=weekend,
+            holidays=holidays,
+        )
+    )["value"]
+    weekmask = [0 if reverse_mapping[i] in weekend else 1 for i in range(1, 8)]
+    # Business days up to and including each date.
+    ordinals = np.busday_count(
+        np.datetime64("1970-01-01"),
+        np.array(dates, dtype="datetime64[D]") + 1,
+        weekmask=weekmask,
+        holidays=holidays,
+    )
+    expected = _reference(ordinals, values, window, agg)
+    assert result.to_list() == pytest.approx(expected)
+
+
+def test_over_groups() -> None:
+    df = pl.DataFrame(
+        {
+            "ticker": ["A", "B", "A", "B", "A", "B"],
+            "date": [
+                dt.date(2024, 1, 5),
+                dt.date(2024, 1, 5),
+                dt.date(2024, 1, 8),
+                dt.date(2024, 1, 9),
+                dt.date(2024, 1, 10),
+                dt.date(2024, 1, 10),
+            ],
+            "price": [1.0, 10.0, 2.0, 20.0, 4.0, 40.0],
+        }
+    )
+    result = df.with_columns(
+        mean=xdt.rolling_business(
+            "price", by="date", window=2, agg="mean"
+        ).over("ticker"),
+        max=xdt.rolling_business(
+            "price", by="date", window="3bd", agg="max", min_samples=2
+        ).over("ticker"),
+    )
+    assert result["mean"].to_list() == [1.0, 10.0, 1.5, 20.0, 4.0, 30.0]
+    assert result["max"].to_list() == [None, None, 2.0, 20.0, 4.0, 40.0]
+
+
+def test_weekend_rows_belong_to_friday() -> None:
+    df = pl.DataFrame(
+        {
+            "date": [
+                dt.datetime(2024, 1, 5, 12),
+                dt.datetime(2024, 1, 6, 9),
+                dt.datetime(2024, 1, 8, 9),
+            ],
+            "value": [1, 2, 4],
+        }
+    )
+    result = df.select(xdt.rolling_business("value", by="date", window="1bd"))[
+        "value"
+    ]
+    assert result.to_list() == [1, 3, 4]
+
+
+def test_invalid_window() -> None:
+    with pytest.raises(ValueError, match="20bd"):
+        xdt.rolling_business("value", by="date", window="20d")
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import hypothesis.strategies as st
+import numpy as np
+import polars as pl
+import pytest
+from hypothesis import given
+
+import polars_xdt as xdt
+
+mapping = {"Mon": 1, "Tue": 2, "Wed": 3, "Thu": 4, "Fri": 5, "Sat": 6, "Sun": 7}
+reverse_mapping = {value: key for key, value in mapping.items()}
+
+
+@st.composite
+def session_lists(draw: st.DrawFn) -> list[tuple[dt.time, dt.time]]:
+    minutes = sorted(
+        draw(
+            st.lists(
+                st.integers(min_value=0, max_value=24 * 60 - 1),
+                min_size=2,
+                max_size=6,
+                unique=True,
+            )
+        )
+    )
+    if len(minutes) % 2:
+        minutes = minutes[:-1]
+    times = [dt.time(minute // 60, minute % 60) for minute in minutes]
+    return list(zip(times[::2], times[1::2]))
+
+
+@given(
+    tick=st.datetimes(
+        min_value=dt.datetime(1969, 6, 1), max_value=dt.datetime(1970, 6, 1)
+    ),
+    sessions=session_lists(),
+    weekend=st.lists(
+        st.sampled_from(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]),
+        min_size=0,
+        max_size=6,
+        unique=True,
+    ),
+    holidays=st.lists(
+        st.dates(min_value=dt.date(1969, 6, 1), max_value=dt.date(1970, 6, 1)),
+        min_size=0,
+        max_size=30,
+    ),
+)
+def test_against_reference(
+    tick: dt.datetime,
+    sessions: list[tuple[dt.time, dt.time]],
+    weekend: list[str],
+    holidays: list[dt.date],
+) -> None:
+    result = pl.DataFrame({"tick": [tick]}).select(
+        in_session=xdt.is_in_session(
+            "tick", sessions, weekend=weekend, holidays=holidays
+        ),
+        next_open=xdt.next_session_open(
+            "tick", sessions, weekend=weekend, holidays=holidays
+        ),
+        next_close=xdt.next_session_close(
+            "tick", sessions, weekend=weekend, holidays=holidays
+        ),
+    )
+    weekmask = [0 if reverse_mapping[i] in weekend else 1 for i in range(1, 8)]
+    # All session boundaries over the next few weeks, in order.
+    opens, closes = [], []
+    for days in range(-1, 30):
+        day = tick.date() + dt.timedelta(days=days)
+        if np.is_busday(day, weekmask=weekmask, holidays=holidays):
+            for open_, close in sessions:
+                opens.append(dt.datetime.combine(day, open_))
+                closes.append(dt.datetime.combine(day, close))
+    assert result["in_session"].item() == any(
+        open_ <= tick < close for open_, close in zip(opens, closes)
+    )
+    assert result["next_open"].item() == min(o for o in opens if o >= tick)
+    assert result["next_close"].item() == min(c for c in closes if c >= tick)
+
+
+def test_time_zone() -> None:
+    sessions = [(dt.time(9, 30), dt.time(16))]
+    df = pl.DataFrame(
+        {
+            "tick": [
+                dt.datetime(2024, 3, 8, 20, 59),
+                dt.datetime(2024, 3, 8, 21),
+            ]
+        }
+    ).with_columns(pl.col("tick").dt.replace_time_zone("UTC"))
+    result = df.select(
+        in_session=xdt.is_in_session(
+            "tick", sessions, time_zone="America/New_York"
+        ),
+        next_open=pl.col("tick").xdt.next_session_open(  # type: ignore[attr-defined]
+            sessions, time_zone="America/New_York"
+        ),
+    )
+    assert result["in_session"].to_list() == [True, False]
+    # New York switches to daylight saving time on Sunday 2024-03-10, so the
+    # Monday open is at 13:30 UTC rather than 14:30 UTC.
+    expected = dt.datetime(2024, 3, 11, 13, 30, tzinfo=dt.timezone.utc)
+    assert result["next_open"].to_list() == [expected, expected]
+    assert result["next_open"].dtype == pl.Datetime("us", "UTC")
+
+
+def test_overlapping_sessions() -> None:
+    df = pl.DataFrame({"tick": [dt.datetime(2024, 1, 5, 10)]})
+    sessions = [(dt.time(9), dt.time(12)), (dt.time(11), dt.time(15))]
+    with pytest.raises(pl.exceptions.InvalidOperationError, match="overlap"):
+        df.select(xdt.is_in_session("tick", sessions))
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Any, Literal
 
+import numpy as np
 import polars as pl
 import pytest
 from polars.testing import (
     assert_frame_equal,
+    assert_series_equal,
 )
 
 import polars_xdt as xdt
@@ -118,6 +121,97 @@ def test_convert_tz_to_local_datetime_literal() -> None:
     assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("time_zone", ["Europe/London", "Australia/Lord_Howe"])
+def test_to_local_datetime_sorted(time_zone: str) -> None:
+    # Sorted input goes through a separate path, which converts runs of
+    # timestamps sharing a UTC offset at once.
+    s = pl.datetime_range(
+        datetime(2020, 3, 1),
+        datetime(2020, 11, 30),
+        "37m",
+        time_zone="UTC",
+        eager=True,
+    )
+    result = pl.select(xdt.to_local_datetime(s, time_zone)).to_series()
+    expected = s.dt.convert_time_zone(time_zone).dt.replace_time_zone(None)
+    assert_series_equal(result, expected)
+    result = pl.select(
+        xdt.to_local_datetime(s.reverse(), time_zone)
+    ).to_series()
+    assert_series_equal(result, expected.reverse())
+
+
+def test_to_local_datetime_large() -> None:
+    # Large inputs are split up and converted on multiple threads.
+    s = pl.datetime_range(
+        datetime(2020, 1, 1),
+        datetime(2021, 1, 1),
+        "1m",
+        time_zone="UTC",
+        eager=True,
+    ).shuffle(seed=0)
+    result = pl.select(xdt.to_local_datetime(s, "Europe/London")).to_series()
+    expected = s.dt.convert_time_zone("Europe/London").dt.replace_time_zone(
+        None
+    )
+    assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("time_unit", ["ms", "us"])
+def test_to_local_datetime_garbage_in_null_slots(
+    time_unit: Literal["ms", "us"],
+) -> None:
+    # NumPy's NaT leaves i64::MIN in the null slot, which doesn't decode.
+    values = np.array(
+        ["2020-07-01T12:00", "NaT", "2020-01-01T12:00"],
+        dtype=f"datetime64[{time_unit}]",
+    )
+    s = pl.Series(values).dt.replace_time_zone("UTC")
+    result = pl.select(xdt.to_local_datetime(s, "Europe/London")).to_series()
+    assert result.to_list() == [
+        datetime(2020, 7, 1, 13),
+        None,
+        datetime(2020, 1, 1, 12),
+    ]
+
+
+@pytest.mark.parametrize("time_unit", ["ms", "us"])
+def test_out_of_range(time_unit: Literal["ms", "us"]) -> None:
+    # Beyond the years which chrono supports.
+    s = pl.Series([0, 2**62]).cast(pl.Datetime(time_unit, "UTC"))
+    with pytest.raises(pl.exceptions.ComputeError, match="out of range"):
+        pl.select(xdt.to_local_datetime(s, "Europe/London"))
+    with pytest.raises(pl.exceptions.ComputeError, match="out of range"):
+        pl.select(xdt.to_local_datetime(s.reverse(), "Europe/London"))
+    with pytest.raises(pl.exceptions.ComputeError, match="out of range"):
+        pl.select(
+            xdt.from_local_datetime(
+                s.dt.replace_time_zone(None), "Europe/London", "UTC"
+            )
+        )
+
+
+@pytest.mark.parametrize("dedupe", [True, False, None])
+def test_from_local_datetime_dedupe(dedupe: Any) -> None:
+    s = pl.datetime_range(
+        datetime(2020, 3, 28), datetime(2020, 3, 30), "1m", eager=True
+    ).sample(20_000, with_replacement=True, seed=0)
+    s = s.scatter(range(0, len(s), 7), None)
+    result = pl.select(
+        xdt.from_local_datetime(
+            s,
+            "Europe/London",
+            "UTC",
+            non_existent="null",
+            dedupe=dedupe,
+        )
+    ).to_series()
+    expected = s.dt.replace_time_zone(
+        "Europe/London", non_existent="null"
+    ).dt.convert_time_zone("UTC")
+    assert_series_equal(result, expected)
+
+
 def test_convert_tz_to_local_datetime_schema() -> None:
     df = pl.LazyFrame({"date": [datetime(2020, 10, 15, tzinfo=timezone.utc)]})
     result = df.with_columns(
@@ -129,3 +223,90 @@ def test_convert_tz_to_local_datetime_schema() -> None:
     assert result.collect().schema["date"] == pl.Datetime(
         "us", "Asia/Kathmandu"
     )
+
+
+def test_from_local_datetime_ambiguous_column() -> None:
+    df = pl.DataFrame(
+        {
+            "local_date": [
+                datetime(2020, 10, 25, 1, 30),
+                datetime(2020, 10, 25, 1, 30),
+                datetime(2020, 10, 25, 1, 30),
+                datetime(2020, 10, 25, 3, 0),
+            ],
+            "ambiguous": ["earliest", "latest", "null", "raise"],
+        }
+    )
+    result = df.select(
+        xdt.from_local_datetime(
+            "local_date",
+            "Europe/London",
+            "UTC",
+            ambiguous=pl.col("ambiguous"),
+        )
+    )["local_date"]
+    expected = pl.Series(
+        "local_date",
+        [
+            datetime(2020, 10, 25, 0, 30, tzinfo=timezone.utc),
+            datetime(2020, 10, 25, 1, 30, tzinfo=timezone.utc),
+            None,
+            datetime(2020, 10, 25, 3, 0, tzinfo=timezone.utc),
+        ],
+    )
+    assert_series_equal(result, expected)
+
+
+def test_from_local_datetime_ambiguous_raise() -> None:
+    df = pl.DataFrame({"local_date": [datetime(2020, 10, 25, 1, 30)]})
+    with pytest.raises(pl.exceptions.ComputeError, match="is ambiguous"):
+        df.select(xdt.from_local_datetime("local_date", "Europe/London", "UTC"))
+
+
+@pytest.mark.parametrize(
+    ("non_existent", "expected"),
+    [
+        ("null", None),
+        (
+            "shift_forward",
+            datetime(2020, 3, 29, 1, 0, tzinfo=timezone.utc),
+        ),
+        (
+            "shift_backward",
+            datetime(2020, 3, 29, 0, 59, 59, 999999, tzinfo=timezone.utc),
+        ),
+    ],
+)
+def test_from_local_datetime_non_existent(
+    non_existent: Literal["null", "shift_forward", "shift_backward"],
+    expected: datetime | None,
+) -> None:
+    df = pl.DataFrame(
+        {
+            "local_date": [
+                datetime(2020, 3, 29, 0, 30),
+                datetime(2020, 3, 29, 1, 30),
+                datetime(2020, 3, 29, 2, 30),
+            ],
+            "timezone": ["Europe/London"] * 3,
+        }
+    )
+    result = df.select(
+        xdt.from_local_datetime(
+            "local_date",
+            pl.col("timezone"),
+            "UTC",
+            non_existent=non_existent,
+        )
+    )["local_date"]
+    assert result.to_list() == [
+        datetime(2020, 3, 29, 0, 30, tzinfo=timezone.utc),
+        expected,
+        datetime(2020, 3, 29, 1, 30, tzinfo=timezone.utc),
+    ]
+
+
+def test_from_local_datetime_non_existent_raise() -> None:
+    df = pl.DataFrame({"local_date": [datetime(2020, 3, 29, 1, 30)]})
+    with pytest.raises(pl.exceptions.ComputeError, match="is non-existent"):
+        df.select(xdt.from_local_datetime("local_date", "Europe/London", "UTC"))